@@ -0,0 +1,168 @@
+"""
+Cache the availability lookups of the appointment plugins.
+
+End-users browsing the appointment form all query the appointment backend for the
+same products, locations, dates and times. The results of these lookups are cached
+(in the shared Django cache) for a short time, configured per operation with the
+``APPOINTMENTS_*_CACHE_TIMEOUT`` settings. A timeout of ``0`` disables the caching of
+an operation.
+
+Concurrent identical lookups are coalesced: while one process performs the upstream
+call, the others wait (for a limited time) for its result to appear in the cache
+rather than calling the backend as well.
+
+Booking an appointment invalidates the cached dates and times of the location, see
+:func:`invalidate_availability`.
+
+Empty results are not cached, as the plugins also return those when the backend
+could not be reached.
+"""
+import hashlib
+import logging
+import time
+from datetime import date, datetime
+from typing import Callable, Sequence, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .base import BasePlugin, Location, Product
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# how long a lookup may take before concurrent lookups stop waiting for it
+COALESCE_LOCK_TIMEOUT = 10
+COALESCE_POLL_INTERVAL = 0.1
+GENERATION_TIMEOUT = 60 * 60 * 24  # 1 day
+
+_missing = object()
+
+
+def _get_generation_key(plugin: BasePlugin, location_id: str) -> str:
+    return f"appointments-availability:{plugin.identifier}:{location_id}:generation"
+
+
+def get_cache_key(plugin: BasePlugin, operation: str, *parts) -> str:
+    """
+    Build the cache key for the lookup of ``operation`` with the given parameters.
+    """
+    digest = hashlib.md5(repr(parts).encode("utf-8")).hexdigest()
+    return f"appointments-availability:{plugin.identifier}:{operation}:{digest}"
+
+
+def _products_key(products: Sequence[Product] | None) -> tuple:
+    if not products:
+        return ()
+    return tuple(sorted((product.identifier, product.amount) for product in products))
+
+
+def get_or_fetch(key: str, timeout: int, fetch: Callable[[], T]) -> T:
+    """
+    Look up the result in the cache, or fetch it from the backend (once).
+    """
+    if not timeout:
+        return fetch()
+
+    if (result := cache.get(key, _missing)) is not _missing:
+        return result
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, True, timeout=COALESCE_LOCK_TIMEOUT):
+        try:
+            result = fetch()
+            if result:
+                cache.set(key, result, timeout=timeout)
+        finally:
+            cache.delete(lock_key)
+        return result
+
+    # another process is fetching the same data - wait for it to complete
+    deadline = time.monotonic() + COALESCE_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(COALESCE_POLL_INTERVAL)
+        if (result := cache.get(key, _missing)) is not _missing:
+            return result
+        # the other lookup finished without (cacheable) result
+        if cache.get(lock_key) is None:
+            break
+
+    logger.debug("Lookup %s not coalesced, calling the backend", key)
+    return fetch()
+
+
+def get_available_products(
+    plugin: BasePlugin,
+    current_products: list[Product] | None = None,
+    location_id: str = "",
+) -> list[Product]:
+    kwargs = {}
+    if location_id:
+        kwargs["location_id"] = location_id
+    if current_products:
+        kwargs["current_products"] = current_products
+    return get_or_fetch(
+        get_cache_key(plugin, "products", _products_key(current_products), location_id),
+        settings.APPOINTMENTS_PRODUCTS_CACHE_TIMEOUT,
+        lambda: plugin.get_available_products(**kwargs),
+    )
+
+
+def get_locations(
+    plugin: BasePlugin, products: list[Product] | None = None
+) -> list[Location]:
+    return get_or_fetch(
+        get_cache_key(plugin, "locations", products is None, _products_key(products)),
+        settings.APPOINTMENTS_LOCATIONS_CACHE_TIMEOUT,
+        lambda: plugin.get_locations(products),
+    )
+
+
+def get_dates(
+    plugin: BasePlugin, products: list[Product], location: Location
+) -> list[date]:
+    generation = cache.get(_get_generation_key(plugin, location.identifier), 0)
+    return get_or_fetch(
+        get_cache_key(
+            plugin,
+            "dates",
+            _products_key(products),
+            location.identifier,
+            generation,
+        ),
+        settings.APPOINTMENTS_DATES_CACHE_TIMEOUT,
+        lambda: plugin.get_dates(products, location),
+    )
+
+
+def get_times(
+    plugin: BasePlugin, products: list[Product], location: Location, day: date
+) -> list[datetime]:
+    generation = cache.get(_get_generation_key(plugin, location.identifier), 0)
+    return get_or_fetch(
+        get_cache_key(
+            plugin,
+            "times",
+            _products_key(products),
+            location.identifier,
+            day.isoformat(),
+            generation,
+        ),
+        settings.APPOINTMENTS_TIMES_CACHE_TIMEOUT,
+        lambda: plugin.get_times(products, location, day),
+    )
+
+
+def invalidate_availability(plugin: BasePlugin, location: Location) -> None:
+    """
+    Discard the cached dates and times of the location.
+
+    Rather than looking up the cache keys of all the product combinations, the
+    generation of the location is bumped, which is part of the cache keys.
+    """
+    generation_key = _get_generation_key(plugin, location.identifier)
+    try:
+        cache.incr(generation_key)
+    except ValueError:
+        cache.set(generation_key, 1, timeout=GENERATION_TIMEOUT)
@@ -10,6 +10,7 @@ from rest_framework.test import APITestCase
 
 from openforms.submissions.tests.factories import SubmissionFactory
 from openforms.submissions.tests.mixins import SubmissionsMixin
+from openforms.utils.tests.cache import clear_caches
 
 from ..plugin import DemoAppointment
 
@@ -25,6 +26,9 @@ class DemoPluginTests(SubmissionsMixin, APITestCase):
     def setUp(self):
         super().setUp()
 
+        clear_caches()
+        self.addCleanup(clear_caches)
+
         self._add_submission_to_session(self.submission)
 
         patcher = patch(
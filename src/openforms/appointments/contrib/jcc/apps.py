@@ -7,4 +7,11 @@ class JccPluginConfig(AppConfig):
     verbose_name = _("JCC appointment plugin")
 
     def ready(self):
+        from django.db.models.signals import post_save
+
+        from soap.client import clear_client_cache
+
         from . import plugin  # noqa
+        from .models import JccConfig
+
+        post_save.connect(clear_client_cache, sender=JccConfig)
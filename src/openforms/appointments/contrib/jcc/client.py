@@ -1,6 +1,6 @@
 from zeep.client import Client
 
-from soap.client import build_client
+from soap.client import build_client, get_cached_client
 
 from .models import JccConfig
 
@@ -9,4 +9,4 @@ def get_client() -> Client:
     config = JccConfig.get_solo()
     assert isinstance(config, JccConfig)
     assert config.service is not None
-    return build_client(config.service)
+    return get_cached_client(config.service, factory=build_client)
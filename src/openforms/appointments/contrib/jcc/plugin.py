@@ -6,6 +6,7 @@ from datetime import date, datetime
 from functools import wraps
 from typing import Callable, List, ParamSpec, TypeVar
 
+from django.conf import settings
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.html import format_html
@@ -20,6 +21,7 @@ from zgw_consumers.concurrent import parallel
 from openforms.formio.typing import Component
 from openforms.plugins.exceptions import InvalidPluginConfiguration
 
+from ...availability import get_cache_key, get_or_fetch
 from ...base import (
     AppointmentDetails,
     BasePlugin,
@@ -131,28 +133,35 @@ class JccAppointment(BasePlugin[CustomerFields]):
     def _get_all_locations(self, client: Client) -> list[Location]:
         with log_soap_errors("Could not retrieve location IDs"):
             location_ids = client.service.getGovLocations()
-            with parallel() as pool:
-                details = pool.map(
-                    lambda location_id: client.service.getGovLocationDetails(
-                        locationID=location_id
-                    ),
-                    location_ids,
-                )
-            # evaluate the generator
-            details = list(details)
 
-        locations = [
-            Location(
-                identifier=identifier,
-                name=entry["locationDesc"],
-                address=entry["address"],
-                postalcode=entry["postalcode"],
-                city=entry["city"],
+            def _get_details() -> list[Location]:
+                with parallel() as pool:
+                    details = pool.map(
+                        lambda location_id: client.service.getGovLocationDetails(
+                            locationID=location_id
+                        ),
+                        location_ids,
+                    )
+                    # evaluate the generator
+                    details = list(details)
+
+                return [
+                    Location(
+                        identifier=identifier,
+                        name=entry["locationDesc"],
+                        address=entry["address"],
+                        postalcode=entry["postalcode"],
+                        city=entry["city"],
+                    )
+                    for identifier, entry in zip(location_ids, details)
+                ]
+
+            # the location details rarely change, avoid the call per location
+            return get_or_fetch(
+                get_cache_key(self, "location-details", tuple(location_ids)),
+                settings.APPOINTMENTS_LOCATIONS_CACHE_TIMEOUT,
+                _get_details,
             )
-            for identifier, entry in zip(location_ids, details)
-        ]
-
-        return locations
 
     @with_graceful_default(default=[])
     def get_locations(
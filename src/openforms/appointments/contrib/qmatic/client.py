@@ -6,6 +6,7 @@ from ape_pie.client import APIClient
 from dateutil.parser import isoparse
 from zgw_consumers.models import Service
 
+from openforms.utils.connection_pools import mount_pooled_adapter
 from zgw_consumers_ext.api_client import ServiceClientFactory
 
 from .exceptions import QmaticException
@@ -76,7 +77,9 @@ def QmaticClient() -> "Client":
         raise RuntimeError("No Qmatic service defined, aborting!")
     assert isinstance(service, Service)
     service_client_factory = ServiceClientFactory(service)
-    return Client.configure_from(service_client_factory)
+    client = Client.configure_from(service_client_factory)
+    mount_pooled_adapter(client, service_client_factory)
+    return client
 
 
 def startswith_version(url: str) -> bool:
@@ -29,6 +29,7 @@ class MockConfigMixin:
     def setUp(self):
         super().setUp()  # type: ignore
 
+        clear_caches()
         self.addCleanup(clear_caches)  # type: ignore
 
         main_config_patcher = patch(
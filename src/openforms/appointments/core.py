@@ -13,6 +13,7 @@ import elasticapm
 from openforms.logging import logevent
 from openforms.submissions.models import Submission
 
+from .availability import invalidate_availability
 from .base import BasePlugin, CustomerDetails, Location, Product
 from .constants import AppointmentDetailsStatus
 from .exceptions import (
@@ -51,13 +52,17 @@ def book(appointment: Appointment, remarks: str = "") -> str:
     customer = CustomerDetails(details=normalized_data)
 
     logevent.appointment_register_start(appointment.submission, plugin)
-    appointment_id = plugin.create_appointment(
-        products,
-        location,
-        appointment.datetime,
-        customer,
-        remarks=remarks,
-    )
+    try:
+        appointment_id = plugin.create_appointment(
+            products,
+            location,
+            appointment.datetime,
+            customer,
+            remarks=remarks,
+        )
+    finally:
+        # the slot is taken now (or turned out to be unavailable)
+        invalidate_availability(plugin, location)
     appointment_info = AppointmentInfo.objects.create(
         status=AppointmentDetailsStatus.success,
         appointment_id=appointment_id,
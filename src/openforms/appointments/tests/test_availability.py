@@ -0,0 +1,109 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from openforms.utils.tests.cache import clear_caches
+
+from ..availability import (
+    get_available_products,
+    get_dates,
+    get_locations,
+    get_times,
+    invalidate_availability,
+)
+from ..base import Location, Product
+from ..contrib.demo.plugin import DemoAppointment
+
+PRODUCTS = [Product(identifier="1", name="Test product 1")]
+LOCATION = Location(identifier="1", name="Test location")
+
+
+@override_settings(
+    APPOINTMENTS_PRODUCTS_CACHE_TIMEOUT=60,
+    APPOINTMENTS_LOCATIONS_CACHE_TIMEOUT=60,
+    APPOINTMENTS_DATES_CACHE_TIMEOUT=60,
+    APPOINTMENTS_TIMES_CACHE_TIMEOUT=60,
+)
+class AvailabilityCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.plugin = DemoAppointment("demo")
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    def test_lookups_are_cached(self):
+        lookups = (
+            ("get_available_products", lambda: get_available_products(self.plugin)),
+            ("get_locations", lambda: get_locations(self.plugin, PRODUCTS)),
+            ("get_dates", lambda: get_dates(self.plugin, PRODUCTS, LOCATION)),
+            (
+                "get_times",
+                lambda: get_times(self.plugin, PRODUCTS, LOCATION, date(2023, 1, 1)),
+            ),
+        )
+
+        for method, lookup in lookups:
+            with self.subTest(method=method):
+                with patch.object(
+                    self.plugin, method, wraps=getattr(self.plugin, method)
+                ) as m_lookup:
+                    result1 = lookup()
+                    result2 = lookup()
+
+                self.assertEqual(result1, result2)
+                m_lookup.assert_called_once()
+
+    def test_lookups_cached_per_parameters(self):
+        other_location = Location(identifier="2", name="Other location")
+
+        with patch.object(
+            self.plugin, "get_dates", wraps=self.plugin.get_dates
+        ) as m_get_dates:
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+            get_dates(self.plugin, PRODUCTS, other_location)
+            get_dates(self.plugin, [], LOCATION)
+
+        self.assertEqual(m_get_dates.call_count, 3)
+
+    def test_empty_results_not_cached(self):
+        with patch.object(self.plugin, "get_dates", return_value=[]) as m_get_dates:
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+
+        self.assertEqual(m_get_dates.call_count, 2)
+
+    def test_booking_invalidates_dates_and_times(self):
+        other_location = Location(identifier="2", name="Other location")
+        day = date(2023, 1, 1)
+        get_dates(self.plugin, PRODUCTS, LOCATION)
+        get_times(self.plugin, PRODUCTS, LOCATION, day)
+        get_times(self.plugin, PRODUCTS, other_location, day)
+
+        invalidate_availability(self.plugin, LOCATION)
+
+        with (
+            patch.object(
+                self.plugin, "get_dates", wraps=self.plugin.get_dates
+            ) as m_get_dates,
+            patch.object(
+                self.plugin, "get_times", wraps=self.plugin.get_times
+            ) as m_get_times,
+        ):
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+            get_times(self.plugin, PRODUCTS, LOCATION, day)
+            get_times(self.plugin, PRODUCTS, other_location, day)
+
+        m_get_dates.assert_called_once()
+        m_get_times.assert_called_once_with(PRODUCTS, LOCATION, day)
+
+    @override_settings(APPOINTMENTS_DATES_CACHE_TIMEOUT=0)
+    def test_caching_disabled(self):
+        with patch.object(
+            self.plugin, "get_dates", wraps=self.plugin.get_dates
+        ) as m_get_dates:
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+            get_dates(self.plugin, PRODUCTS, LOCATION)
+
+        self.assertEqual(m_get_dates.call_count, 2)
@@ -15,6 +15,7 @@ from openforms.forms.models import Form, FormStep
 from openforms.logging import logevent
 from openforms.submissions.models import Submission
 
+from .availability import invalidate_availability
 from .base import BasePlugin, Customer, Location, Product
 from .constants import AppointmentDetailsStatus
 from .exceptions import (
@@ -147,9 +148,13 @@ def book_appointment_for_submission(submission: Submission) -> None:
     plugin = get_plugin()
     try:
         logevent.appointment_register_start(submission, plugin)
-        appointment_id = plugin.create_appointment(
-            [product], location, start_at, appointment_client
-        )
+        try:
+            appointment_id = plugin.create_appointment(
+                [product], location, start_at, appointment_client
+            )
+        finally:
+            # the slot is taken now (or turned out to be unavailable)
+            invalidate_availability(plugin, location)
         appointment_info = AppointmentInfo.objects.create(
             status=AppointmentDetailsStatus.success,
             appointment_id=appointment_id,
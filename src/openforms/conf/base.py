@@ -573,14 +573,102 @@ TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS = config(
     "TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS", default=2
 )
 
+# Logic evaluation audit logging, see openforms.logging.constants.LogicLoggingModes
+SUBMISSION_LOGIC_LOGGING_MODE = config(
+    "SUBMISSION_LOGIC_LOGGING_MODE", default="immediate"
+)
+# Fraction (between 0 and 1) of the submissions for which the logic evaluation is logged
+SUBMISSION_LOGIC_LOGGING_SAMPLE_RATE = config(
+    "SUBMISSION_LOGIC_LOGGING_SAMPLE_RATE", default=1.0
+)
+# Number of seconds the outcome of the submission processing is cached for the status
+# endpoint
+SUBMISSION_STATUS_CACHE_TIMEOUT = config(
+    "SUBMISSION_STATUS_CACHE_TIMEOUT", default=60 * 60
+)
+# Maximum number of seconds a status request may wait for the processing to be done
+# (capped at 5 seconds), waiting is disabled by default
+SUBMISSION_STATUS_MAX_WAIT = config("SUBMISSION_STATUS_MAX_WAIT", default=0)
+# Number of seconds the result of a logic check is remembered as base for delta responses
+SUBMISSION_LOGIC_STATE_CACHE_TIMEOUT = config(
+    "SUBMISSION_LOGIC_STATE_CACHE_TIMEOUT", default=15 * 60
+)
+
+# Number of submissions removed per batch (and transaction) by the data removal tasks
+DATA_REMOVAL_BATCH_SIZE = config("DATA_REMOVAL_BATCH_SIZE", default=500)
+# Dispatch the data removal batches as separate tasks, to be processed by all workers
+DATA_REMOVAL_FAN_OUT = config("DATA_REMOVAL_FAN_OUT", default=False)
+
 # Zip files for file exports: after how long should they be deleted
 FORMS_EXPORT_REMOVED_AFTER_DAYS = config("FORMS_EXPORT_REMOVED_AFTER_DAYS", default=7)
 
+# Connection pools shared by the API clients of a service, per process. See
+# :mod:`openforms.utils.connection_pools`.
+HTTP_POOL_ENABLED = config("HTTP_POOL_ENABLED", default=True)
+# number of hosts to keep connection pools for, per service
+HTTP_POOL_CONNECTIONS = config("HTTP_POOL_CONNECTIONS", default=10)
+# number of connections to keep per host
+HTTP_POOL_MAXSIZE = config("HTTP_POOL_MAXSIZE", default=10)
+# discard the pools after this many consecutive connection errors
+HTTP_POOL_MAX_FAILURES = config("HTTP_POOL_MAX_FAILURES", default=3)
+# discard the pools if they have not been used for this many seconds
+HTTP_POOL_MAX_IDLE_TIME = config("HTTP_POOL_MAX_IDLE_TIME", default=5 * 60)
+
+# Number of seconds the WSDL and XSD documents of SOAP services are cached
+SOAP_DOCUMENT_CACHE_TIMEOUT = config(
+    "SOAP_DOCUMENT_CACHE_TIMEOUT", default=60 * 60 * 24
+)
+
+# Number of seconds the availability lookups of the appointment plugins are cached,
+# 0 disables the caching
+APPOINTMENTS_PRODUCTS_CACHE_TIMEOUT = config(
+    "APPOINTMENTS_PRODUCTS_CACHE_TIMEOUT", default=15 * 60
+)
+APPOINTMENTS_LOCATIONS_CACHE_TIMEOUT = config(
+    "APPOINTMENTS_LOCATIONS_CACHE_TIMEOUT", default=15 * 60
+)
+APPOINTMENTS_DATES_CACHE_TIMEOUT = config(
+    "APPOINTMENTS_DATES_CACHE_TIMEOUT", default=60
+)
+APPOINTMENTS_TIMES_CACHE_TIMEOUT = config(
+    "APPOINTMENTS_TIMES_CACHE_TIMEOUT", default=30
+)
+
+# Retrieve the prefill values in the background when a submission is started, rather
+# than blocking the request
+PREFILL_ASYNC = config("PREFILL_ASYNC", default=False)
+# Number of seconds the submission step endpoints wait for the background prefill,
+# capped at 3 seconds
+PREFILL_ASYNC_WAIT_TIMEOUT = config("PREFILL_ASYNC_WAIT_TIMEOUT", default=1)
+# Number of seconds the (encrypted) prefill values are cached per identity, 0 (the
+# default) disables the caching
+PREFILL_CACHE_TIMEOUT = config("PREFILL_CACHE_TIMEOUT", default=0)
+
 # a custom default timeout for the requests library, added via monkeypatch in
 # :mod:`openforms.setup`. Value is in seconds.
 DEFAULT_TIMEOUT_REQUESTS = config("DEFAULT_TIMEOUT_REQUESTS", default=10.0)
 
 MAX_FILE_UPLOAD_SIZE = config("MAX_FILE_UPLOAD_SIZE", default="50M", cast=Filesize())
+# Maximum amount of memory the (decoded) image of an attachment may take up to be resized
+ATTACHMENT_RESIZE_MAX_MEMORY = config(
+    "ATTACHMENT_RESIZE_MAX_MEMORY", default="256M", cast=Filesize()
+)
+# Documents at least this large are base64 encoded into the registration request body
+# while it is being sent, rather than in memory up front
+DOCUMENT_UPLOAD_STREAMING_THRESHOLD = config(
+    "DOCUMENT_UPLOAD_STREAMING_THRESHOLD", default="1M", cast=Filesize()
+)
+# Documents at least this large are uploaded in parts (bestandsdelen) to the Documenten
+# API, which requires version 1.1 or newer of the API. 0 disables the chunked upload.
+ZGW_DOCUMENTEN_CHUNKED_UPLOAD_THRESHOLD = config(
+    "ZGW_DOCUMENTEN_CHUNKED_UPLOAD_THRESHOLD", default="0", cast=Filesize()
+)
+# Maximum number of attachments registered in parallel by the registration backends.
+# Keep these below HTTP_POOL_MAXSIZE so that every thread can use a pooled connection.
+ZGW_APIS_ATTACHMENT_CONCURRENCY = config("ZGW_APIS_ATTACHMENT_CONCURRENCY", default=4)
+OBJECTS_API_ATTACHMENT_CONCURRENCY = config(
+    "OBJECTS_API_ATTACHMENT_CONCURRENCY", default=4
+)
 
 # Deal with being hosted on a subpath
 SUBPATH = config("SUBPATH", default="")
@@ -726,6 +814,26 @@ CELERY_BEAT_SCHEDULE = {
 RETRY_SUBMISSIONS_TIME_LIMIT = config(
     "RETRY_SUBMISSIONS_TIME_LIMIT", default=48  # hours
 )
+# Retries of a submission are spread with jittered exponential backoff, starting at the
+# base delay (in seconds) and doubling for every attempt, up to the maximum delay.
+REGISTRATION_RETRY_BACKOFF_BASE = config(
+    "REGISTRATION_RETRY_BACKOFF_BASE", default=60 * 5
+)
+REGISTRATION_RETRY_BACKOFF_MAX = config(
+    "REGISTRATION_RETRY_BACKOFF_MAX", default=60 * 60 * 6
+)
+# Stop registering with a backend (service) after this many consecutive failures, until
+# the reset timeout (in seconds) has passed. 0 disables the circuit breaker.
+REGISTRATION_CIRCUIT_FAILURE_THRESHOLD = config(
+    "REGISTRATION_CIRCUIT_FAILURE_THRESHOLD", default=5
+)
+REGISTRATION_CIRCUIT_RESET_TIMEOUT = config(
+    "REGISTRATION_CIRCUIT_RESET_TIMEOUT", default=60 * 5
+)
+# Maximum number of registrations per backend (service) in progress in the retry flow
+REGISTRATION_BACKEND_MAX_CONCURRENCY = config(
+    "REGISTRATION_BACKEND_MAX_CONCURRENCY", default=10
+)
 
 # Only ACK when the task has been executed. This prevents tasks from getting lost, with
 # the drawback that tasks should be idempotent (if they execute partially, the mutations
@@ -737,6 +845,16 @@ CELERY_TASK_ACKS_LATE = True
 # *should* have the same effect...
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 
+# Route the PDF report generation to a dedicated queue, so that a worker consuming only
+# that queue keeps the WeasyPrint fonts and assets warm. Empty uses the default queue.
+PDF_RENDER_QUEUE = config("PDF_RENDER_QUEUE", default="")
+if PDF_RENDER_QUEUE:
+    CELERY_TASK_ROUTES = {
+        "openforms.submissions.tasks.pdf.generate_submission_report": {
+            "queue": PDF_RENDER_QUEUE
+        },
+    }
+
 #
 # DJANGO-CORS-MIDDLEWARE
 #
@@ -1,12 +1,27 @@
+import json
+import logging
 from base64 import b64encode
+from operator import itemgetter
 from typing import BinaryIO, Literal, TypeAlias
+from uuid import uuid4
 
+from django.conf import settings
 from django.core.files.base import ContentFile
 
+import requests
+
+from openforms.utils.streaming import (
+    FilePart,
+    StreamingBody,
+    get_file_size,
+    make_placeholder,
+)
 from zgw_consumers_ext.api_client import NLXClient
 
 from .utils import get_today
 
+logger = logging.getLogger(__name__)
+
 DocumentStatus: TypeAlias = Literal[
     "in_bewerking",
     "ter_vaststelling",
@@ -32,7 +47,7 @@ class DocumentenClient(NLXClient):
     ):
         assert author, "author must be a non-empty string"
         today = get_today()
-        base64_body = b64encode(content.read()).decode()
+        size = get_file_size(content)
         data = {
             "informatieobjecttype": informatieobjecttype,
             "bronorganisatie": bronorganisatie,
@@ -41,7 +56,6 @@ class DocumentenClient(NLXClient):
             "auteur": author,
             "taal": language,
             "formaat": format,
-            "inhoud": base64_body,
             "status": status,
             "bestandsnaam": filename,
             "beschrijving": description,
@@ -51,7 +65,95 @@ class DocumentenClient(NLXClient):
         if vertrouwelijkheidaanduiding:
             data["vertrouwelijkheidaanduiding"] = vertrouwelijkheidaanduiding
 
-        response = self.post("enkelvoudiginformatieobjecten", json=data)
+        chunked_upload_threshold = settings.ZGW_DOCUMENTEN_CHUNKED_UPLOAD_THRESHOLD
+        if chunked_upload_threshold and size >= chunked_upload_threshold:
+            return self._create_document_in_parts(data, content, size)
+
+        if size < settings.DOCUMENT_UPLOAD_STREAMING_THRESHOLD:
+            data["inhoud"] = b64encode(content.read()).decode()
+            response = self.post("enkelvoudiginformatieobjecten", json=data)
+        else:
+            placeholder = make_placeholder("inhoud")
+            data["inhoud"] = placeholder
+            body = StreamingBody.from_rendered(
+                json.dumps(data), files={placeholder: content}
+            )
+            response = self.post(
+                "enkelvoudiginformatieobjecten",
+                data=body,
+                headers={"Content-Type": "application/json"},
+            )
+        response.raise_for_status()
+
+        return response.json()
+
+    def _create_document_in_parts(
+        self, data: dict, content: ContentFile | BinaryIO, size: int
+    ) -> dict:
+        """
+        Create the document and upload its content in parts ("bestandsdelen").
+
+        Supported since version 1.1 of the Documenten API. The document is created
+        without content and locked, the content is then uploaded in the parts
+        prescribed by the API, after which the document is unlocked again. If a part
+        can't be uploaded, the incomplete document is deleted.
+        """
+        response = self.post(
+            "enkelvoudiginformatieobjecten",
+            json={**data, "inhoud": None, "bestandsomvang": size},
+        )
         response.raise_for_status()
+        document = response.json()
+
+        try:
+            start = content.tell()
+            offset = 0
+            for part in sorted(document["bestandsdelen"], key=itemgetter("volgnummer")):
+                content.seek(start + offset)
+                boundary = uuid4().hex
+                body = StreamingBody.from_form_data(
+                    boundary,
+                    fields={"lock": document["lock"]},
+                    files={
+                        "inhoud": (
+                            data["bestandsnaam"],
+                            FilePart(content, part["omvang"]),
+                        )
+                    },
+                )
+                response = self.put(
+                    part["url"],
+                    data=body,
+                    headers={
+                        "Content-Type": f"multipart/form-data; boundary={boundary}"
+                    },
+                )
+                response.raise_for_status()
+                offset += part["omvang"]
+        except Exception:
+            self._discard_document(document)
+            raise
 
+        self._unlock_document(document)
+
+        # the unlock response has no content, fetch the document with the uploaded
+        # content instead
+        response = self.get(document["url"])
+        response.raise_for_status()
         return response.json()
+
+    def _unlock_document(self, document: dict) -> None:
+        response = self.post(
+            f"{document['url']}/unlock", json={"lock": document["lock"]}
+        )
+        response.raise_for_status()
+
+    def _discard_document(self, document: dict) -> None:
+        try:
+            self._unlock_document(document)
+            response = self.delete(document["url"])
+            response.raise_for_status()
+        except requests.RequestException:
+            logger.exception(
+                "Could not delete the incomplete document %s", document["url"]
+            )
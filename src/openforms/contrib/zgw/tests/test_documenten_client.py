@@ -0,0 +1,132 @@
+import json
+from base64 import b64encode
+from io import BytesIO
+
+from django.test import SimpleTestCase, override_settings
+
+import requests_mock
+from requests import HTTPError
+
+from ..clients.documenten import DocumentenClient
+
+DOCUMENTEN_ROOT = "https://documenten.example.com/api/v1/"
+DOCUMENT_URL = f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten/1"
+
+DOCUMENT_KWARGS = {
+    "informatieobjecttype": "https://catalogi.example.com/api/v1/iot/1",
+    "bronorganisatie": "000000000",
+    "title": "Test",
+    "author": "Aanvrager",
+    "language": "nld",
+    "format": "application/pdf",
+    "status": "definitief",
+    "filename": "test.pdf",
+}
+
+
+@requests_mock.Mocker()
+class DocumentenClientTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.client = DocumentenClient(DOCUMENTEN_ROOT)
+
+    @override_settings(DOCUMENT_UPLOAD_STREAMING_THRESHOLD=10)
+    def test_large_document_streamed(self, m):
+        m.post(f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten", json={"url": "x"})
+        content = b"some larger content"
+
+        with self.client:
+            self.client.create_document(content=BytesIO(content), **DOCUMENT_KWARGS)
+
+        request = m.last_request
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        # the body is a file-like object, not read by requests_mock
+        request.body.seek(0)
+        data = json.loads(request.body.read())
+        self.assertEqual(data["inhoud"], b64encode(content).decode())
+        self.assertEqual(data["titel"], "Test")
+
+    @override_settings(ZGW_DOCUMENTEN_CHUNKED_UPLOAD_THRESHOLD=10)
+    def test_large_document_uploaded_in_parts(self, m):
+        m.post(
+            f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten",
+            json={
+                "url": DOCUMENT_URL,
+                "lock": "lock-123",
+                "bestandsdelen": [
+                    {
+                        "url": f"{DOCUMENTEN_ROOT}bestandsdelen/2",
+                        "volgnummer": 2,
+                        "omvang": 5,
+                    },
+                    {
+                        "url": f"{DOCUMENTEN_ROOT}bestandsdelen/1",
+                        "volgnummer": 1,
+                        "omvang": 10,
+                    },
+                ],
+            },
+        )
+        m.put(f"{DOCUMENTEN_ROOT}bestandsdelen/1", json={})
+        m.put(f"{DOCUMENTEN_ROOT}bestandsdelen/2", json={})
+        m.post(f"{DOCUMENT_URL}/unlock", status_code=204)
+        m.get(DOCUMENT_URL, json={"url": DOCUMENT_URL, "locked": False})
+
+        with self.client:
+            document = self.client.create_document(
+                content=BytesIO(b"0123456789abcde"), **DOCUMENT_KWARGS
+            )
+
+        self.assertEqual(document, {"url": DOCUMENT_URL, "locked": False})
+        create, part1, part2, unlock, fetch = m.request_history
+        self.assertIsNone(create.json()["inhoud"])
+        self.assertEqual(create.json()["bestandsomvang"], 15)
+        self.assertEqual(part1.url, f"{DOCUMENTEN_ROOT}bestandsdelen/1")
+        self.assertTrue(
+            part1.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        )
+        # the bodies are file-like objects, not read by requests_mock
+        part1_body, part2_body = part1.body.read(), part2.body.read()
+        self.assertIn(b"\r\n0123456789\r\n", part1_body)
+        self.assertIn(b"lock-123", part1_body)
+        self.assertIn(b"\r\nabcde\r\n", part2_body)
+        self.assertEqual(unlock.json(), {"lock": "lock-123"})
+        self.assertEqual(fetch.url, DOCUMENT_URL)
+
+    @override_settings(ZGW_DOCUMENTEN_CHUNKED_UPLOAD_THRESHOLD=10)
+    def test_incomplete_document_deleted(self, m):
+        m.post(
+            f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten",
+            json={
+                "url": DOCUMENT_URL,
+                "lock": "lock-123",
+                "bestandsdelen": [
+                    {
+                        "url": f"{DOCUMENTEN_ROOT}bestandsdelen/1",
+                        "volgnummer": 1,
+                        "omvang": 10,
+                    },
+                    {
+                        "url": f"{DOCUMENTEN_ROOT}bestandsdelen/2",
+                        "volgnummer": 2,
+                        "omvang": 5,
+                    },
+                ],
+            },
+        )
+        m.put(f"{DOCUMENTEN_ROOT}bestandsdelen/1", json={})
+        m.put(f"{DOCUMENTEN_ROOT}bestandsdelen/2", status_code=500)
+        m.post(f"{DOCUMENT_URL}/unlock", status_code=204)
+        m.delete(DOCUMENT_URL, status_code=204)
+
+        with self.client, self.assertRaises(HTTPError):
+            self.client.create_document(
+                content=BytesIO(b"0123456789abcde"), **DOCUMENT_KWARGS
+            )
+
+        *_, unlock, delete = m.request_history
+        self.assertEqual(unlock.url, f"{DOCUMENT_URL}/unlock")
+        self.assertEqual(unlock.json(), {"lock": "lock-123"})
+        self.assertEqual(delete.method, "DELETE")
+        self.assertEqual(delete.url, DOCUMENT_URL)
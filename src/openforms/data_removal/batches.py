@@ -0,0 +1,240 @@
+"""
+Remove the submission data in batches.
+
+Rather than deleting (or anonymizing) all submissions matching the removal criteria in
+one go, the primary keys of the submissions are collected in fixed-size batches
+(``settings.DATA_REMOVAL_BATCH_SIZE``). Every batch is processed in its own
+transaction, which keeps the locks (and the cascading deletes over steps, variables,
+attachments and logs) short.
+
+The progress is checkpointed in the cache: the primary key of the last submission
+handed out is remembered per removal action and category. A run that is interrupted
+(e.g. by the task time limits) resumes where it left off instead of starting over.
+The checkpoint is cleared once all the batches of a category have been handed out.
+
+With ``settings.DATA_REMOVAL_FAN_OUT`` enabled, the batches are dispatched as separate
+Celery tasks so that they can be processed by multiple workers.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from openforms.submissions.constants import RegistrationStatuses
+from openforms.submissions.models import Submission
+from openforms.submissions.query import SubmissionQuerySet
+
+from .constants import RemovalMethods
+
+if TYPE_CHECKING:  # pragma: nocover
+    from celery import Task
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TIMEOUT = 60 * 60 * 24  # 1 day
+
+
+def _get_submissions(
+    limit_field: str, method_field: str = "", method: str = "", **filters
+) -> SubmissionQuerySet:
+    queryset = Submission.objects.annotate_removal_fields(
+        limit_field, method_field=method_field
+    )
+    if method:
+        filters["removal_method"] = method
+    return queryset.filter(
+        time_since_creation__gt=(timedelta(days=1) * F("removal_limit")), **filters
+    )
+
+
+def _get_successful_submissions(**kwargs) -> SubmissionQuerySet:
+    return _get_submissions(
+        "successful_submissions_removal_limit",
+        method_field="successful_submissions_removal_method",
+        registration_status=RegistrationStatuses.success,
+        **kwargs,
+    )
+
+
+def _get_incomplete_submissions(**kwargs) -> SubmissionQuerySet:
+    return _get_submissions(
+        "incomplete_submissions_removal_limit",
+        method_field="incomplete_submissions_removal_method",
+        registration_status__in=[
+            RegistrationStatuses.pending,
+            RegistrationStatuses.in_progress,
+        ],
+        **kwargs,
+    )
+
+
+def _get_errored_submissions(**kwargs) -> SubmissionQuerySet:
+    return _get_submissions(
+        "errored_submissions_removal_limit",
+        method_field="errored_submissions_removal_method",
+        registration_status=RegistrationStatuses.failed,
+        **kwargs,
+    )
+
+
+# category -> queryset of the submissions to delete, in order of processing
+SUBMISSIONS_TO_DELETE: dict[str, Callable[[], SubmissionQuerySet]] = {
+    "successful": lambda: _get_successful_submissions(
+        method=RemovalMethods.delete_permanently
+    ),
+    "incomplete": lambda: _get_incomplete_submissions(
+        method=RemovalMethods.delete_permanently
+    ),
+    "errored": lambda: _get_errored_submissions(
+        method=RemovalMethods.delete_permanently
+    ),
+    # regardless of the registration status
+    "other": lambda: _get_submissions("all_submissions_removal_limit"),
+}
+
+# category -> queryset of the submissions to anonymize, in order of processing
+SUBMISSIONS_TO_ANONYMIZE: dict[str, Callable[[], SubmissionQuerySet]] = {
+    "successful": lambda: _get_successful_submissions(
+        method=RemovalMethods.make_anonymous, _is_cleaned=False
+    ),
+    "incomplete": lambda: _get_incomplete_submissions(
+        method=RemovalMethods.make_anonymous, _is_cleaned=False
+    ),
+    "errored": lambda: _get_errored_submissions(
+        method=RemovalMethods.make_anonymous, _is_cleaned=False
+    ),
+}
+
+
+@dataclass
+class Checkpoint:
+    action: str
+    category: str
+
+    @property
+    def cache_key(self) -> str:
+        return f"data-removal-checkpoint:{self.action}:{self.category}"
+
+    def get(self) -> int:
+        return cache.get(self.cache_key, 0)
+
+    def set(self, last_pk: int) -> None:
+        cache.set(self.cache_key, last_pk, timeout=CHECKPOINT_TIMEOUT)
+
+    def clear(self) -> None:
+        cache.delete(self.cache_key)
+
+
+def iter_id_batches(
+    queryset: SubmissionQuerySet, checkpoint: Checkpoint, batch_size: int = 0
+) -> Iterator[List[int]]:
+    """
+    Yield the primary keys of the submissions in the queryset in batches.
+
+    Keyset pagination on the primary key is used, starting after the checkpoint. The
+    checkpoint is advanced after a batch has been processed by the consumer and is
+    cleared once the queryset is exhausted.
+    """
+    batch_size = batch_size or settings.DATA_REMOVAL_BATCH_SIZE
+    last_pk = checkpoint.get()
+    while True:
+        ids = list(
+            queryset.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        yield ids
+        last_pk = ids[-1]
+        checkpoint.set(last_pk)
+    checkpoint.clear()
+
+
+def delete_batch(category: str, ids: List[int]) -> int:
+    """
+    Delete the submissions in the batch that (still) match the removal criteria.
+
+    :returns: the number of deleted submissions.
+    """
+    start = time.monotonic()
+    queryset = SUBMISSIONS_TO_DELETE[category]().filter(pk__in=ids)
+    with transaction.atomic():
+        num_rows, num_rows_per_model = queryset.delete()
+    num_deleted = num_rows_per_model.get(Submission._meta.label, 0)
+    logger.info(
+        "Deleted %d of %d %s submissions in batch (%d rows in total: %r) in %.3fs",
+        num_deleted,
+        len(ids),
+        category,
+        num_rows,
+        num_rows_per_model,
+        time.monotonic() - start,
+    )
+    return num_deleted
+
+
+def anonymize_batch(category: str, ids: List[int]) -> int:
+    """
+    Remove the sensitive data of the submissions in the batch that (still) match the
+    removal criteria.
+
+    :returns: the number of anonymized submissions.
+    """
+    start = time.monotonic()
+    queryset = SUBMISSIONS_TO_ANONYMIZE[category]().filter(pk__in=ids)
+    num_anonymized = 0
+    with transaction.atomic():
+        for submission in queryset.select_related("auth_info"):
+            submission.remove_sensitive_data()
+            num_anonymized += 1
+    logger.info(
+        "Anonymized %d of %d %s submissions in batch in %.3fs",
+        num_anonymized,
+        len(ids),
+        category,
+        time.monotonic() - start,
+    )
+    return num_anonymized
+
+
+def process_in_batches(
+    action: str,
+    querysets: dict[str, Callable[[], SubmissionQuerySet]],
+    process_batch: Callable[[str, List[int]], int],
+    batch_task: Optional["Task"] = None,
+) -> None:
+    """
+    Process the submissions of every category in batches.
+
+    :param batch_task: if provided, the batches are dispatched to this Celery task
+      (called with the category and the submission IDs) rather than processed in-line.
+    """
+    for category, get_queryset in querysets.items():
+        checkpoint = Checkpoint(action=action, category=category)
+        start = time.monotonic()
+        num_batches, num_processed = 0, 0
+
+        for ids in iter_id_batches(get_queryset(), checkpoint):
+            num_batches += 1
+            if batch_task is not None:
+                batch_task.delay(category, ids)
+                num_processed += len(ids)
+            else:
+                num_processed += process_batch(category, ids)
+
+        logger.info(
+            "%s: %s %d %s submissions in %d batches in %.3fs",
+            action,
+            "dispatched" if batch_task is not None else "processed",
+            num_processed,
+            category,
+            num_batches,
+            time.monotonic() - start,
+        )
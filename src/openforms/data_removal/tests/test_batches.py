@@ -0,0 +1,115 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from openforms.config.models import GlobalConfiguration
+from openforms.submissions.models import Submission
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from ..batches import SUBMISSIONS_TO_DELETE, Checkpoint, iter_id_batches
+from ..constants import RemovalMethods
+from ..tasks import delete_submissions, make_sensitive_data_anonymous
+
+
+class BatchedRemovalTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(cache.clear)
+
+    def _create_old_submissions(self, num: int, **kwargs):
+        config = GlobalConfiguration.get_solo()
+        submissions = SubmissionFactory.create_batch(
+            num, registration_success=True, **kwargs
+        )
+        Submission.objects.filter(pk__in=[s.pk for s in submissions]).update(
+            created_on=timezone.now()
+            - timedelta(days=config.successful_submissions_removal_limit + 1)
+        )
+        return submissions
+
+    def test_iter_id_batches_advances_and_clears_checkpoint(self):
+        submissions = self._create_old_submissions(5)
+        ids = sorted(submission.pk for submission in submissions)
+        checkpoint = Checkpoint(action="delete", category="successful")
+
+        batches = iter_id_batches(
+            SUBMISSIONS_TO_DELETE["successful"](), checkpoint, batch_size=2
+        )
+
+        self.assertEqual(next(batches), ids[:2])
+        self.assertEqual(next(batches), ids[2:4])
+        self.assertEqual(checkpoint.get(), ids[1])
+        self.assertEqual(list(batches), [ids[4:]])
+        self.assertEqual(checkpoint.get(), 0)
+
+    @override_settings(DATA_REMOVAL_BATCH_SIZE=2)
+    def test_delete_submissions_in_batches(self):
+        self._create_old_submissions(5)
+        recent_submission = SubmissionFactory.create(registration_success=True)
+
+        with self.assertLogs("openforms.data_removal.batches", "INFO") as logs:
+            delete_submissions()
+
+        self.assertEqual(list(Submission.objects.all()), [recent_submission])
+        batch_logs = [
+            record
+            for record in logs.records
+            if record.msg.startswith("Deleted %d of %d")
+        ]
+        self.assertEqual(
+            [record.args[:3] for record in batch_logs],
+            [(2, 2, "successful"), (2, 2, "successful"), (1, 1, "successful")],
+        )
+
+    def test_run_resumes_from_checkpoint(self):
+        submissions = self._create_old_submissions(3)
+        first, *others = sorted(submissions, key=lambda submission: submission.pk)
+        Checkpoint(action="delete", category="successful").set(first.pk)
+
+        delete_submissions()
+
+        self.assertTrue(Submission.objects.filter(pk=first.pk).exists())
+        self.assertFalse(
+            Submission.objects.filter(pk__in=[s.pk for s in others]).exists()
+        )
+
+        with self.subTest("checkpoint cleared after a complete run"):
+            delete_submissions()
+
+            self.assertFalse(Submission.objects.exists())
+
+    @override_settings(DATA_REMOVAL_BATCH_SIZE=2, DATA_REMOVAL_FAN_OUT=True)
+    def test_fan_out_dispatches_batches(self):
+        submissions = self._create_old_submissions(
+            3, form__successful_submissions_removal_method=RemovalMethods.make_anonymous
+        )
+        ids = sorted(submission.pk for submission in submissions)
+
+        with patch(
+            "openforms.data_removal.tasks.make_sensitive_data_anonymous_batch"
+        ) as mock_batch_task:
+            make_sensitive_data_anonymous()
+
+        self.assertEqual(
+            [call.args for call in mock_batch_task.delay.call_args_list],
+            [("successful", ids[:2]), ("successful", ids[2:])],
+        )
+        self.assertFalse(Submission.objects.filter(_is_cleaned=True).exists())
+
+    @override_settings(
+        DATA_REMOVAL_BATCH_SIZE=2,
+        DATA_REMOVAL_FAN_OUT=True,
+        CELERY_TASK_ALWAYS_EAGER=True,
+    )
+    def test_fan_out_anonymizes_submissions(self):
+        self._create_old_submissions(
+            3, form__successful_submissions_removal_method=RemovalMethods.make_anonymous
+        )
+
+        make_sensitive_data_anonymous()
+
+        self.assertEqual(Submission.objects.filter(_is_cleaned=True).count(), 3)
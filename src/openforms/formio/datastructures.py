@@ -1,11 +1,14 @@
 import re
 from collections import UserDict
 from collections.abc import Hashable
-from typing import Dict, Iterator, Optional, cast
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Optional, cast
 
 from glom import PathAccessError, assign, glom
 
 from openforms.typing import DataMapping, JSONObject, JSONValue
+from openforms.utils.cache import LRUCache
 
 from .typing import Component
 from .utils import flatten_by_path, is_visible_in_frontend, iter_components
@@ -14,6 +17,172 @@ from .utils import flatten_by_path, is_visible_in_frontend, iter_components
 
 RE_PATH = re.compile(r"(components|columns|rows)\.([0-9]+)")
 
+CONFIGURATION_INDEX_CACHE_SIZE = 512
+
+# a single lookup step in the configuration tree, e.g. ``("components", 0)``
+NodeStep = tuple[str, int]
+
+
+@dataclass(frozen=True)
+class ConfigurationIndex:
+    """
+    Immutable structural indexes derived from a Formio configuration.
+
+    The indexes only depend on the structure of the configuration (component keys,
+    nesting and conditionals), and not on the component objects themselves, so they
+    can be shared between all (mutated) copies of the same configuration.
+    """
+
+    # component key -> configuration path
+    paths: Mapping[str, str]
+    # component key -> lookup steps of the ancestor nodes and the component itself,
+    # leftmost is root, rightmost is leaf
+    node_steps: Mapping[str, tuple[NodeStep, ...]]
+    # component key -> keys of the parent components, leftmost is root
+    parents: Mapping[str, tuple[str, ...]]
+    # component key -> keys of the components that the (inherited) simple
+    # conditionals depend on
+    conditional_dependencies: Mapping[str, frozenset[str]]
+
+    @classmethod
+    def from_configuration(cls, configuration: JSONObject) -> "ConfigurationIndex":
+        paths, node_steps, parents, conditional_dependencies = {}, {}, {}, {}
+        for path, component in flatten_by_path(configuration).items():
+            key = component["key"]
+            steps = tuple(
+                (attribute, int(index)) for attribute, index in RE_PATH.findall(path)
+            )
+            nodes = list(_iter_nodes(configuration, steps))
+            paths[key] = path
+            node_steps[key] = steps
+            parents[key] = tuple(
+                node["key"]
+                for (attribute, _), node in zip(steps[:-1], nodes[:-1])
+                if attribute == "components"
+            )
+            conditional_dependencies[key] = frozenset(
+                trigger_key
+                for node in nodes
+                if (conditional := node.get("conditional"))
+                and conditional.get("show") not in [None, ""]
+                and (trigger_key := conditional.get("when"))
+            )
+        return cls(
+            paths=MappingProxyType(paths),
+            node_steps=MappingProxyType(node_steps),
+            parents=MappingProxyType(parents),
+            conditional_dependencies=MappingProxyType(conditional_dependencies),
+        )
+
+
+def _iter_nodes(
+    configuration: JSONObject, steps: tuple[NodeStep, ...]
+) -> Iterator[Component]:
+    node = configuration
+    for attribute, index in steps:
+        node = node[attribute][index]
+        yield cast(Component, node)
+
+
+_configuration_index_cache: LRUCache[Hashable, ConfigurationIndex] = LRUCache(
+    maxsize=CONFIGURATION_INDEX_CACHE_SIZE
+)
+
+
+def clear_configuration_index_cache() -> None:
+    _configuration_index_cache.clear()
+
+
+def _copy_on_write(value, owner: object):
+    # containers copied for the same overlay are returned as-is, anything else
+    # (including copies made by another overlay) is treated as read-only
+    if isinstance(value, (CopyOnWriteDict, CopyOnWriteList)) and value._owner is owner:
+        return value
+    if isinstance(value, dict):
+        return CopyOnWriteDict(value, owner=owner)
+    if isinstance(value, list):
+        return CopyOnWriteList(value, owner=owner)
+    return value
+
+
+class CopyOnWriteDict(dict):
+    """
+    Shallow copy of a dictionary that copies nested containers when they're accessed.
+
+    Only the containers on the path to a (possible) mutation are copied, the
+    untouched parts of the tree are shared with the original. Accessing a nested
+    dict or list through the regular (mapping) interface returns a copy-on-write copy,
+    so mutations never end up in the original datastructure.
+
+    .. warning:: Low level access bypassing the mapping interface (e.g. ``dict(obj)``
+       or ``{**obj}``) returns the shared, nested containers - these must be treated
+       as read-only.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, base, owner: object | None = None):
+        super().__init__(base)
+        self._owner = owner if owner is not None else object()
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if (copied := _copy_on_write(value, self._owner)) is not value:
+            super().__setitem__(key, copied)
+        return copied
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super().pop(key, *args)
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+
+class CopyOnWriteList(list):
+    """
+    Shallow copy of a list that copies nested containers when they're accessed.
+
+    See :class:`CopyOnWriteDict`.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, base, owner: object | None = None):
+        super().__init__(base)
+        self._owner = owner if owner is not None else object()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[_index] for _index in range(*index.indices(len(self)))]
+        value = super().__getitem__(index)
+        if (copied := _copy_on_write(value, self._owner)) is not value:
+            super().__setitem__(index, copied)
+        return copied
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def pop(self, index=-1):
+        value = self[index]
+        del self[index]
+        return value
+
 
 class FormioConfigurationWrapper:
     """
@@ -21,16 +190,24 @@ class FormioConfigurationWrapper:
 
     This datastructure caches the internal datastructure to optimize mutations of the
     formio configuration.
+
+    The structural indexes (see :class:`ConfigurationIndex`) are shared between
+    wrapper instances with the same ``cache_key`` in the same process. The key must
+    identify the structure of the configuration, e.g. the form definition ID and the
+    hash of its configuration. In-place mutations of component properties are fine,
+    but the components themselves may not be added, removed or moved.
     """
 
     _configuration: JSONObject
+    _cache_key: Optional[Hashable]
     # depth-first ordered of all components in the formio configuration tree
     _cached_component_map: Optional[Dict[str, Component]] = None
     _flattened_by_path: None | dict[str, Component] = None
-    _reverse_flattened: None | dict[str, str] = None
+    _index: Optional[ConfigurationIndex] = None
 
-    def __init__(self, configuration: JSONObject):
+    def __init__(self, configuration: JSONObject, cache_key: Optional[Hashable] = None):
         self._configuration = configuration
+        self._cache_key = cache_key
 
     @property
     def component_map(self) -> Dict[str, Component]:
@@ -55,13 +232,34 @@ class FormioConfigurationWrapper:
         self, other_wrapper: "FormioConfigurationWrapper"
     ) -> "FormioConfigurationWrapper":
         self._configuration["components"] += other_wrapper._configuration["components"]
-        self.component_map.update(other_wrapper.component_map)
+        # the structure changed, so the derived datastructures must be re-created
+        self._cached_component_map = None
+        self._flattened_by_path = None
+        self._index = None
+        self._cache_key = (
+            (self._cache_key, other_wrapper._cache_key)
+            if self._cache_key is not None and other_wrapper._cache_key is not None
+            else None
+        )
         return self
 
     @property
     def configuration(self) -> JSONObject:
         return self._configuration
 
+    def copy_on_write(self) -> "FormioConfigurationWrapper":
+        """
+        Create a wrapper that records the mutations in a copy-on-write overlay.
+
+        The configuration of this wrapper is used as read-only base and is shared with
+        the returned wrapper - only the parts of the configuration that are accessed
+        through the returned wrapper are (shallowly) copied. This is much cheaper than
+        a deep copy and allows the base configuration to be shared between requests.
+        """
+        return type(self)(
+            CopyOnWriteDict(self._configuration), cache_key=self._cache_key
+        )
+
     @property
     def flattened_by_path(self) -> dict[str, Component]:
         if self._flattened_by_path is None:
@@ -69,22 +267,24 @@ class FormioConfigurationWrapper:
         return self._flattened_by_path
 
     @property
-    def reverse_flattened(self) -> dict[str, str]:
-        if self._reverse_flattened is None:
-            self._reverse_flattened = {
-                component["key"]: path
-                for path, component in self.flattened_by_path.items()
-            }
-        return self._reverse_flattened
+    def index(self) -> ConfigurationIndex:
+        if self._index is None:
+            if self._cache_key is None:
+                self._index = ConfigurationIndex.from_configuration(self.configuration)
+            else:
+                self._index = _configuration_index_cache.get_or_set(
+                    self._cache_key,
+                    lambda: ConfigurationIndex.from_configuration(self.configuration),
+                )
+        return self._index
+
+    @property
+    def reverse_flattened(self) -> Mapping[str, str]:
+        return self.index.paths
 
     def is_visible_in_frontend(self, key: str, values: DataMapping) -> bool:
-        config_path = self.reverse_flattened[key]
-        path_bits = [".".join(bit) for bit in RE_PATH.findall(config_path)]
-        nodes = []  # leftmost is root, rightmost is leaf
-        for depth in range(len(path_bits)):
-            path = ".".join(path_bits[: depth + 1])
-            component = cast(Component, glom(self.configuration, path))
-            nodes.append(component)
+        # leftmost is root, rightmost is leaf
+        nodes = _iter_nodes(self.configuration, self.index.node_steps[key])
         return all(is_visible_in_frontend(node, values) for node in nodes)
 
 
@@ -28,13 +28,14 @@ from .registry import register
 from .typing import Component
 from .utils import iter_components, iterate_data_with_components
 from .validation import validate_formio_data
-from .variables import inject_variables
+from .variables import get_injection_plan, inject_variables
 
 __all__ = [
     "get_dynamic_configuration",
     "normalize_value_for_component",
     "iter_components",
     "inject_variables",
+    "get_injection_plan",
     "format_value",
     "rewrite_formio_components_for_request",
     "FormioData",
@@ -1,6 +1,34 @@
+import json
+from copy import deepcopy
 from unittest import TestCase
 
-from ..datastructures import FormioData
+from ..datastructures import (
+    CopyOnWriteDict,
+    FormioConfigurationWrapper,
+    FormioData,
+    clear_configuration_index_cache,
+)
+
+NESTED_CONFIGURATION = {
+    "components": [
+        {
+            "type": "fieldset",
+            "key": "fieldset",
+            "conditional": {"show": False, "when": "toggle", "eq": "true"},
+            "components": [
+                {
+                    "type": "columns",
+                    "key": "columns",
+                    "columns": [
+                        {"components": []},
+                        {"components": [{"type": "textfield", "key": "nested"}]},
+                    ],
+                }
+            ],
+        },
+        {"type": "checkbox", "key": "toggle"},
+    ]
+}
 
 
 class FormioDataTests(TestCase):
@@ -86,3 +114,119 @@ class FormioDataTests(TestCase):
         }
 
         self.assertEqual(formio_data, expected)
+
+
+class FormioConfigurationWrapperTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_configuration_index_cache()
+        self.addCleanup(clear_configuration_index_cache)
+
+    def test_structural_indexes(self):
+        wrapper = FormioConfigurationWrapper(NESTED_CONFIGURATION)
+
+        index = wrapper.index
+
+        self.assertEqual(
+            index.paths["nested"],
+            "components.0.components.0.columns.1.components.0",
+        )
+        self.assertEqual(index.parents["nested"], ("fieldset", "columns"))
+        self.assertEqual(index.parents["toggle"], ())
+        self.assertEqual(index.conditional_dependencies["nested"], {"toggle"})
+        self.assertEqual(index.conditional_dependencies["toggle"], set())
+        with self.assertRaises(TypeError):
+            index.paths["nested"] = "components.0"  # type: ignore
+
+    def test_visibility_takes_ancestors_into_account(self):
+        wrapper = FormioConfigurationWrapper(NESTED_CONFIGURATION)
+
+        self.assertTrue(wrapper.is_visible_in_frontend("nested", {"toggle": False}))
+        self.assertFalse(wrapper.is_visible_in_frontend("nested", {"toggle": True}))
+        self.assertTrue(wrapper.is_visible_in_frontend("toggle", {"toggle": True}))
+
+    def test_index_shared_between_wrappers_with_same_cache_key(self):
+        wrapper1 = FormioConfigurationWrapper(
+            deepcopy(NESTED_CONFIGURATION), cache_key=(1, "abc")
+        )
+        wrapper2 = FormioConfigurationWrapper(
+            deepcopy(NESTED_CONFIGURATION), cache_key=(1, "abc")
+        )
+        # mutating the component properties does not affect the shared index
+        wrapper2["nested"]["hidden"] = True
+
+        self.assertIs(wrapper1.index, wrapper2.index)
+        self.assertTrue(wrapper1.is_visible_in_frontend("nested", {}))
+        self.assertFalse(wrapper2.is_visible_in_frontend("nested", {}))
+
+    def test_index_reset_when_adding_wrappers(self):
+        wrapper = FormioConfigurationWrapper(
+            {"components": [{"type": "textfield", "key": "first"}]}, cache_key=(1, "a")
+        )
+        self.assertNotIn("second", wrapper.index.paths)
+
+        wrapper += FormioConfigurationWrapper(
+            {"components": [{"type": "textfield", "key": "second"}]},
+            cache_key=(2, "b"),
+        )
+
+        self.assertEqual(wrapper.reverse_flattened["second"], "components.1")
+
+
+class CopyOnWriteTests(TestCase):
+    def test_mutations_do_not_affect_base(self):
+        base = deepcopy(NESTED_CONFIGURATION)
+        overlay = CopyOnWriteDict(base)
+
+        overlay["components"][0]["label"] = "Changed"
+        overlay["components"][0]["conditional"]["eq"] = "false"
+        overlay["components"][1:][0]["hidden"] = True
+        for column in overlay["components"][0]["components"][0]["columns"]:
+            column["components"].append({"type": "textfield", "key": "extra"})
+
+        self.assertEqual(base, NESTED_CONFIGURATION)
+        self.assertEqual(overlay["components"][0]["label"], "Changed")
+        self.assertEqual(overlay["components"][0]["conditional"]["eq"], "false")
+        self.assertTrue(overlay["components"][1]["hidden"])
+
+    def test_untouched_parts_are_shared(self):
+        base = deepcopy(NESTED_CONFIGURATION)
+        overlay = CopyOnWriteDict(base)
+
+        overlay["components"][1]["hidden"] = True
+
+        self.assertIs(list.__getitem__(overlay["components"], 0), base["components"][0])
+
+    def test_overlay_of_overlay(self):
+        base = deepcopy(NESTED_CONFIGURATION)
+        overlay1 = CopyOnWriteDict(base)
+        overlay1["components"][1]["hidden"] = True
+        overlay2 = CopyOnWriteDict(overlay1)
+
+        overlay2["components"][1]["hidden"] = False
+
+        self.assertTrue(overlay1["components"][1]["hidden"])
+        self.assertNotIn("hidden", base["components"][1])
+
+    def test_serializes_like_dict(self):
+        overlay = CopyOnWriteDict(deepcopy(NESTED_CONFIGURATION))
+        overlay["components"][1]["hidden"] = True
+        expected = deepcopy(NESTED_CONFIGURATION)
+        expected["components"][1]["hidden"] = True
+
+        self.assertEqual(json.loads(json.dumps(overlay)), expected)
+        self.assertEqual(deepcopy(overlay), expected)
+
+    def test_wrapper_copy_on_write(self):
+        base = deepcopy(NESTED_CONFIGURATION)
+        wrapper = FormioConfigurationWrapper(base)
+
+        copy = wrapper.copy_on_write()
+        copy["nested"]["hidden"] = True
+        copy["fieldset"]["conditional"]["show"] = True
+
+        self.assertEqual(base, NESTED_CONFIGURATION)
+        self.assertTrue(copy.configuration["components"][0]["conditional"]["show"])
+        self.assertFalse(copy.is_visible_in_frontend("nested", {}))
+        self.assertTrue(wrapper.is_visible_in_frontend("nested", {}))
@@ -1,13 +1,24 @@
+import hashlib
 from copy import deepcopy
 from datetime import date
+from unittest.mock import patch
 
 from django.test import SimpleTestCase, override_settings
 from django.utils import timezone
 
 from freezegun import freeze_time
 
+from openforms.forms.models import FormDefinition
+
 from ..datastructures import FormioConfigurationWrapper
-from ..variables import inject_variables, render
+from ..variables import (
+    SUPPORTED_TEMPLATE_PROPERTIES,
+    InjectionPlan,
+    clear_injection_plan_cache,
+    get_injection_plan,
+    inject_variables,
+    render,
+)
 
 VARIABLES = {
     "html_variable": "<span>HTML injection!</span>",
@@ -184,3 +195,135 @@ class VariableInjectionTests(SimpleTestCase):
             result,
             {"topLevel": {"nested": "yepp"}},
         )
+
+
+@override_settings(LANGUAGE_CODE="nl")
+@freeze_time("2022-08-16T11:57:02+02:00")
+class InjectionPlanTests(SimpleTestCase):
+    def test_static_properties_recorded(self):
+        configuration = {
+            "components": [
+                {
+                    "type": "textfield",
+                    "key": "textfield1",
+                    "label": "Static label",
+                    "description": "Hello {{ name }}",
+                    "placeholder": "Translated",
+                }
+            ]
+        }
+
+        plan = InjectionPlan.from_configuration(
+            configuration, translate=lambda s: {"Translated": "Vertaald"}.get(s, s)
+        )
+
+        static_properties = {
+            property_name: value
+            for property_name, value in plan.properties["textfield1"]
+            if isinstance(value, str)
+        }
+        self.assertEqual(
+            [property_name for property_name, _ in plan.properties["textfield1"]],
+            list(SUPPORTED_TEMPLATE_PROPERTIES),
+        )
+        self.assertEqual(static_properties, {"label": "Static label"})
+
+    def test_same_result_with_and_without_plan(self):
+        configuration1 = deepcopy(CONFIGURATION)
+        configuration2 = deepcopy(CONFIGURATION)
+        plan = InjectionPlan.from_configuration(CONFIGURATION)
+
+        inject_variables(FormioConfigurationWrapper(configuration1), VARIABLES)
+        inject_variables(
+            FormioConfigurationWrapper(configuration2), VARIABLES, plan=plan
+        )
+
+        self.assertEqual(configuration1, configuration2)
+
+    def test_dynamically_modified_property_is_processed(self):
+        configuration = {
+            "components": [
+                {"type": "textfield", "key": "textfield1", "label": "Static label"}
+            ]
+        }
+        plan = InjectionPlan.from_configuration(configuration)
+        # e.g. modified by a logic action after the plan was built
+        configuration["components"][0]["label"] = "Hello {{ name }}"
+
+        inject_variables(
+            FormioConfigurationWrapper(configuration), {"name": "World"}, plan=plan
+        )
+
+        self.assertEqual(configuration["components"][0]["label"], "Hello World")
+
+    def test_dynamically_added_property_is_processed(self):
+        configuration = {"components": [{"type": "textfield", "key": "textfield1"}]}
+        plan = InjectionPlan.from_configuration(configuration)
+        # e.g. added by the dynamic configuration of the component
+        configuration["components"][0]["description"] = "Hello {{ name }}"
+
+        inject_variables(
+            FormioConfigurationWrapper(configuration), {"name": "World"}, plan=plan
+        )
+
+        self.assertEqual(configuration["components"][0]["description"], "Hello World")
+
+    def test_dynamically_added_component_is_processed(self):
+        configuration = {"components": [{"type": "textfield", "key": "textfield1"}]}
+        plan = InjectionPlan.from_configuration(configuration)
+        configuration["components"].append(
+            {"type": "textfield", "key": "textfield2", "label": "Hello {{ name }}"}
+        )
+
+        inject_variables(
+            FormioConfigurationWrapper(configuration), {"name": "World"}, plan=plan
+        )
+
+        self.assertEqual(configuration["components"][1]["label"], "Hello World")
+
+
+class GetInjectionPlanTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_injection_plan_cache()
+        self.addCleanup(clear_injection_plan_cache)
+
+    def test_plan_cached_by_configuration_hash(self):
+        form_definition = FormDefinition(
+            pk=1,
+            configuration={
+                "components": [
+                    {"type": "textfield", "key": "textfield1", "label": "Hi {{ x }}"}
+                ]
+            },
+        )
+
+        with patch(
+            "openforms.forms.models.form_definition.hashlib.md5", wraps=hashlib.md5
+        ) as m_md5:
+            plan1 = get_injection_plan(form_definition)
+            plan2 = get_injection_plan(form_definition, "")
+
+        # the hash is computed once for the same configuration
+        m_md5.assert_called_once()
+        self.assertIs(plan1, plan2)
+
+        with self.subTest("configuration changed without saving"):
+            # e.g. updated with ``QuerySet.update()`` and fetched again
+            updated = FormDefinition(
+                pk=1,
+                configuration={
+                    "components": [
+                        {"type": "textfield", "key": "textfield1", "label": "Hi"}
+                    ]
+                },
+            )
+
+            self.assertIsNot(get_injection_plan(updated), plan1)
+
+        with self.subTest("configuration replaced"):
+            form_definition.configuration = deepcopy(form_definition.configuration)
+            form_definition.configuration["components"][0]["label"] = "Hi"
+
+            self.assertIsNot(get_injection_plan(form_definition), plan1)
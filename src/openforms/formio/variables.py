@@ -1,17 +1,25 @@
 import logging
-from typing import Callable, Dict, Iterator, Tuple
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Mapping, Optional, Tuple
 
 from django.template import TemplateSyntaxError
 
-from openforms.template import parse, render_from_string
+from openforms.template import has_template_syntax, parse, render_from_string
 from openforms.typing import DataMapping, JSONObject, JSONValue
+from openforms.utils.cache import LRUCache
 
 from .datastructures import FormioConfigurationWrapper
 from .typing import Component
-from .utils import flatten_by_path
+from .utils import flatten_by_path, iter_components
+
+if TYPE_CHECKING:  # pragma: no cover
+    from openforms.forms.models import FormDefinition
 
 logger = logging.getLogger(__name__)
 
+INJECTION_PLAN_CACHE_SIZE = 512
+
 
 SUPPORTED_TEMPLATE_PROPERTIES = (
     "label",
@@ -95,10 +103,159 @@ def validate_configuration(configuration: JSONObject) -> Dict[str, str]:
     return errored_components
 
 
+def _iter_strings(formio_bit: JSONValue) -> Iterator[str]:
+    if isinstance(formio_bit, str):
+        yield formio_bit
+    elif isinstance(formio_bit, list):
+        for nested_bit in formio_bit:
+            yield from _iter_strings(nested_bit)
+    elif isinstance(formio_bit, dict):
+        for nested_bit in formio_bit.values():
+            yield from _iter_strings(nested_bit)
+
+
+def _is_static(property_value: JSONValue, translate: Callable[[str], str]) -> bool:
+    """
+    Determine if translating and templating leaves the property value unmodified.
+
+    Mirrors the processing done in :func:`inject_variables`.
+    """
+    match property_value:
+        case str():
+            if translate(property_value) != property_value:
+                return False
+        case [str(), *_]:
+            if not all(
+                isinstance(item, str) and translate(item) == item
+                for item in property_value
+            ):
+                return False
+        case [{"label": _}, *_] | {"values": [*_]}:
+            items = (
+                property_value
+                if isinstance(property_value, list)
+                else property_value["values"]
+            )
+            for item in items:
+                if not isinstance(item, dict):
+                    return False
+                if "label" in item and translate(item["label"]) != item["label"]:
+                    return False
+    return not any(has_template_syntax(bit) for bit in _iter_strings(property_value))
+
+
+# marker for planned properties that must always be translated and rendered
+_DYNAMIC = object()
+
+
+@dataclass(frozen=True)
+class InjectionPlan:
+    """
+    Precomputed knowledge of which template properties need processing.
+
+    For every component, the template-enabled properties are recorded. The properties
+    of which the value is not affected by translation and doesn't contain any template
+    syntax (including the absent ones) are recorded together with that value - they
+    only need to be translated and rendered if they have a different value at request
+    time (e.g. because of dynamic configuration). All other properties, and all
+    properties of the components that are not in the plan, are always processed.
+    """
+
+    # component key -> (property name, static value or ``_DYNAMIC``) pairs
+    properties: Mapping[str, Tuple[Tuple[str, JSONValue], ...]]
+
+    @classmethod
+    def from_configuration(
+        cls, configuration: JSONObject, translate: Callable[[str], str] = str
+    ) -> "InjectionPlan":
+        properties = {
+            component["key"]: tuple(
+                (
+                    property_name,
+                    property_value
+                    if _is_static(property_value, translate)
+                    else _DYNAMIC,
+                )
+                for property_name, property_value in iter_template_properties(component)
+            )
+            for component in iter_components(configuration, recursive=True)
+        }
+        return cls(properties=MappingProxyType(properties))
+
+    def iter_properties(
+        self, configuration: FormioConfigurationWrapper
+    ) -> Iterator[Tuple[Component, str, JSONValue]]:
+        """
+        Iterate over the planned component properties that need processing.
+        """
+        for component in configuration:
+            planned = self.properties.get(component["key"])
+            if planned is None:
+                yield from (
+                    (component, property_name, property_value)
+                    for property_name, property_value in iter_template_properties(
+                        component
+                    )
+                )
+                continue
+            for property_name, static_value in planned:
+                # compare the stored value, without triggering copy-on-write copies
+                current_value = dict.get(component, property_name)
+                if static_value is not _DYNAMIC and (
+                    current_value is static_value or current_value == static_value
+                ):
+                    continue
+                yield component, property_name, component.get(property_name)
+
+
+_injection_plan_cache: LRUCache[tuple, InjectionPlan] = LRUCache(
+    maxsize=INJECTION_PLAN_CACHE_SIZE
+)
+
+
+def get_injection_plan(
+    form_definition: "FormDefinition", language_code: str = ""
+) -> InjectionPlan:
+    """
+    Get the (cached) injection plan for a form definition and language.
+
+    The plans are cached per form definition, using the hash of its configuration and
+    component translations.
+
+    :arg form_definition: The form definition holding the configuration and component
+      translations.
+    :arg language_code: The language to translate the components to, or an empty
+      string if no translation should happen.
+    """
+
+    def build_plan() -> InjectionPlan:
+        translations = (
+            form_definition.component_translations.get(language_code, {})
+            if language_code
+            else {}
+        )
+        return InjectionPlan.from_configuration(
+            form_definition.configuration_wrapper.configuration,
+            translate=lambda s: translations.get(s) or s,
+        )
+
+    if form_definition.pk is None:
+        return build_plan()
+    return _injection_plan_cache.get_or_set(
+        (form_definition.pk, form_definition.get_configuration_hash(), language_code),
+        build_plan,
+    )
+
+
+def clear_injection_plan_cache() -> None:
+    _injection_plan_cache.clear()
+
+
 def inject_variables(
     configuration: FormioConfigurationWrapper,
     values: DataMapping,
     translate: Callable[[str], str] = str,
+    plan: Optional[InjectionPlan] = None,
 ) -> None:
     """
     Inject the variable values into the Formio configuration.
@@ -111,40 +268,52 @@ def inject_variables(
     :arg configuration: A dictionary containing the static Formio configuration (from
       the form designer)
     :arg values: A mapping of variable key to its value (Python native objects)
+    :arg translate: Translation function for the component strings.
+    :arg plan: Optional :class:`InjectionPlan`, built with the same translations as
+      ``translate``. Only the planned properties are visited, and the properties known
+      to be static are skipped.
     :returns: None - this function mutates the datastructures in place
 
     .. todo:: Support getting non-string based configuration from variables, such as
        `validate.required` etc.
     """
-    for component in configuration:
-        for property_name, property_value in iter_template_properties(component):
-            if not property_value:
-                continue
+    if plan is None:
+        properties = (
+            (component, property_name, property_value)
+            for component in configuration
+            for property_name, property_value in iter_template_properties(component)
+        )
+    else:
+        properties = plan.iter_properties(configuration)
 
-            match property_value:
-                case str():
-                    property_value = translate(property_value)
-                case [str(), *_]:
-                    property_value = [
-                        translate(s) for s in property_value if isinstance(s, str)
-                    ]
-                case [{"label": _}, *_]:
-                    for item in property_value:
-                        if "label" in item:
-                            item["label"] = translate(item["label"])
-                case {"values": [*defined_values]}:
-                    for item in defined_values:
-                        if "label" in item:
-                            item["label"] = translate(item["label"])
+    for component, property_name, property_value in properties:
+        if not property_value:
+            continue
 
-            try:
-                templated_value = render(property_value, values)
-            except TemplateSyntaxError as exc:
-                logger.debug(
-                    "Error during formio configuration 'template' rendering",
-                    exc_info=exc,
-                )
-                # keep the original value on error
-                continue
+        match property_value:
+            case str():
+                property_value = translate(property_value)
+            case [str(), *_]:
+                property_value = [
+                    translate(s) for s in property_value if isinstance(s, str)
+                ]
+            case [{"label": _}, *_]:
+                for item in property_value:
+                    if "label" in item:
+                        item["label"] = translate(item["label"])
+            case {"values": [*defined_values]}:
+                for item in defined_values:
+                    if "label" in item:
+                        item["label"] = translate(item["label"])
+
+        try:
+            templated_value = render(property_value, values)
+        except TemplateSyntaxError as exc:
+            logger.debug(
+                "Error during formio configuration 'template' rendering",
+                exc_info=exc,
+            )
+            # keep the original value on error
+            continue
 
-            component[property_name] = templated_value
+        component[property_name] = templated_value
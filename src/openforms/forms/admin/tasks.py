@@ -31,24 +31,19 @@ logger = logging.getLogger(__name__)
 @app.task
 def process_forms_export(forms_uuids: list, user_id: int) -> None:
     forms = Form.objects.filter(uuid__in=forms_uuids)
+    num_forms = forms.count()
 
     user = User.objects.get(id=user_id)
 
     # This deletes the temp dir once the context manager is exited
     with tempfile.TemporaryDirectory(dir=settings.PRIVATE_MEDIA_ROOT) as temp_dir:
-        output_files = []
-        for form in forms:
-            output_files.append(
-                export_form(
-                    form_id=form.pk,
-                    archive_name=Path(temp_dir, f"form_{form.slug}.zip"),
-                )
-            )
-
         zip_filepath = Path(temp_dir, f"forms-export_{uuid4()}.zip")
-        with ZipFile(zip_filepath, "w") as zipfile:
-            for output_file in output_files:
-                zipfile.write(output_file, arcname=Path(output_file).name)
+        # the export of every form is streamed directly into the bulk archive
+        with ZipFile(zip_filepath, "w") as zip_file:
+            for index, form in enumerate(forms.iterator(), start=1):
+                with zip_file.open(f"form_{form.slug}.zip", "w") as form_file:
+                    export_form(form.pk, form_file)
+                logger.info("Exported form %s (%d/%d)", form.slug, index, num_forms)
 
         with open(zip_filepath, "rb") as zipfile:
             forms_export = FormsExport.objects.create(
@@ -79,20 +74,26 @@ def process_forms_export(forms_uuids: list, user_id: int) -> None:
 def process_forms_import(import_file: str, user_id: int) -> None:
     user = User.objects.get(id=user_id)
     failed_files = []
-    # This deletes the temp dir once the context manager is exited
-    with tempfile.TemporaryDirectory() as temp_dir:
-        with zipfile.ZipFile(private_media_storage.open(import_file), "r") as zip_file:
-            for zipped_form_file in zip_file.infolist():
-                try:
-                    # This normalises the path before extracting the files (to avoid writing outside the temp_dir)
+    # reusable form definitions are shared between the forms of the bulk import
+    reusable_form_definitions = {}
+    with zipfile.ZipFile(private_media_storage.open(import_file), "r") as zip_file:
+        zipped_form_files = zip_file.infolist()
+        for index, zipped_form_file in enumerate(zipped_form_files, start=1):
+            filename = Path(zipped_form_file.filename).name
+            try:
+                # the form archive is read directly from the bulk archive, without
+                # extracting it first
+                with zip_file.open(zipped_form_file) as form_file:
                     import_form(
-                        zip_file.extract(member=zipped_form_file, path=temp_dir)
+                        form_file, reusable_form_definitions=reusable_form_definitions
                     )
-                except ValidationError as exc:
-                    filename = Path(zipped_form_file.filename).name
-                    failed_files.append((filename, exc.detail))
-                    logger.error("Could not import form %s", filename)
-                    continue
+            except ValidationError as exc:
+                failed_files.append((filename, exc.detail))
+                logger.error("Could not import form %s", filename)
+                continue
+            logger.info(
+                "Imported form %s (%d/%d)", filename, index, len(zipped_form_files)
+            )
 
     logevent.bulk_forms_imported(user=user, failed_files=failed_files)
     private_media_storage.delete(import_file)
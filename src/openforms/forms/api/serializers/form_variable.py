@@ -33,6 +33,38 @@ class FormVariableListSerializer(ListWithChildSerializer):
 
         return map(save_fetch_config, validated_data)
 
+    def update(self, instance, validated_data):
+        """
+        Synchronize the existing variables of the form with the submitted variables.
+
+        Variables are matched on their key. Existing variables are replaced in place
+        (keeping their primary key), so that the submission variables referencing them
+        stay coupled. Variables that are no longer submitted are deleted.
+        """
+        existing_variables = {variable.key: variable for variable in instance}
+        fields = [
+            field.name
+            for field in FormVariable._meta.concrete_fields
+            if not field.primary_key
+        ]
+
+        variables, to_create, to_update = [], [], []
+        for data_dict in self.preprocess_validated_data(validated_data):
+            variable = self.process_object(FormVariable(**data_dict))
+            if existing_variable := existing_variables.pop(variable.key, None):
+                variable.pk = existing_variable.pk
+                to_update.append(variable)
+            else:
+                to_create.append(variable)
+            variables.append(variable)
+
+        FormVariable.objects.filter(
+            pk__in=[variable.pk for variable in existing_variables.values()]
+        ).delete()
+        FormVariable.objects.bulk_update(to_update, fields=fields)
+        FormVariable.objects.bulk_create(to_create)
+        return variables
+
     def validate(self, attrs):
         static_data_keys = [item.key for item in get_static_variables()]
 
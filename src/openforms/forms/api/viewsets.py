@@ -530,12 +530,12 @@ class FormViewSet(viewsets.ModelViewSet):
     @transaction.atomic
     def variables_bulk_update(self, request, *args, **kwargs):
         form = self.get_object()
-        form_variables = form.formvariable_set.all()
         # We expect that all the variables that should be associated with a form come in the request.
-        # So we can delete any existing variables because they will be replaced.
-        form_variables.delete()
+        # The existing variables are locked and synchronized with them: updated, created or deleted.
+        form_variables = form.formvariable_set.select_for_update()
 
         serializer = FormVariableSerializer(
+            instance=form_variables,
             data=request.data,
             many=True,
             context={
@@ -483,7 +483,7 @@ class Form(models.Model):
 
             logic.save()
 
-        FormVariable.objects.create_for_form(copy)
+        FormVariable.objects.synchronize_for(copy)
         for variable in self.formvariable_set.filter(
             source=FormVariableSources.user_defined
         ):
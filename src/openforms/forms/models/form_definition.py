@@ -3,7 +3,7 @@ import json
 import uuid
 from copy import deepcopy
 from functools import partial
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -15,6 +15,7 @@ from django.utils.translation import gettext_lazy as _, override
 from autoslug import AutoSlugField
 
 from openforms.formio.utils import iter_components
+from openforms.typing import JSONObject
 from openforms.utils.helpers import get_charfield_max_length, truncate_str_if_needed
 
 from ..models import Form
@@ -78,6 +79,8 @@ class FormDefinition(models.Model):
         default=dict,
     )
 
+    _configuration_hash: Optional[Tuple[JSONObject, JSONObject, str]] = None
+
     class Meta:
         verbose_name = _("Form definition")
         verbose_name_plural = _("Form definitions")
@@ -179,11 +182,36 @@ class FormDefinition(models.Model):
             json.dumps(self.configuration, sort_keys=True).encode("utf-8")
         ).hexdigest()
 
+    def get_configuration_hash(self) -> str:
+        """
+        Hash the configuration and component translations, identifying the data
+        derived from them.
+
+        The hash is computed from the current values rather than stored, so that it
+        doesn't go stale when they are updated without saving the instance
+        (``QuerySet.update()``, data migrations...). It is remembered for as long as
+        the values are not replaced.
+        """
+        configuration, translations = self.configuration, self.component_translations
+        memo = self._configuration_hash
+        if memo is None or memo[0] is not configuration or memo[1] is not translations:
+            value = hashlib.md5(
+                json.dumps([configuration, translations], sort_keys=True).encode(
+                    "utf-8"
+                )
+            ).hexdigest()
+            # keep the values referenced, so that their ids can't be reused
+            memo = self._configuration_hash = (configuration, translations, value)
+        return memo[2]
+
     @cached_property
     def configuration_wrapper(self) -> "FormioConfigurationWrapper":
         from openforms.formio.service import FormioConfigurationWrapper
 
-        return FormioConfigurationWrapper(self.configuration)
+        return FormioConfigurationWrapper(
+            self.configuration,
+            cache_key=(self.pk, self.get_configuration_hash()),
+        )
 
     def iter_components(self, configuration=None, recursive=True, **kwargs):
         if configuration is None:
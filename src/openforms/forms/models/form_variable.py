@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, List
+from functools import partial
+from typing import TYPE_CHECKING, Iterator, List
 
 from django.core.validators import RegexValidator
 from django.db import models, transaction
@@ -8,8 +9,8 @@ from django.utils.translation import gettext_lazy as _
 
 from glom import Path, glom
 
+from openforms.formio.typing import Component
 from openforms.formio.utils import (
-    component_in_editgrid,
     get_component_datatype,
     get_component_default_value,
     is_layout_component,
@@ -37,74 +38,155 @@ variable_key_validator = RegexValidator(
 )
 
 
+# the fields of component variables that are derived from the component configuration
+COMPONENT_VARIABLE_FIELDS = (
+    "form_definition",
+    "name",
+    "prefill_plugin",
+    "prefill_attribute",
+    "prefill_identifier_role",
+    "is_sensitive_data",
+    "data_type",
+    "initial_value",
+)
+
+
+def _iter_variable_components(configuration: dict) -> Iterator[Component]:
+    """
+    Yield the components of a configuration that hold a value.
+
+    Layout and content components don't hold a value, and neither do the components
+    inside an editgrid - their values are part of the editgrid value.
+    """
+    components = list(iter_components(configuration=configuration, recursive=True))
+    editgrid_keys = {
+        nested_component["key"]
+        for component in components
+        if component["type"] == "editgrid"
+        for nested_component in iter_components(configuration=component)
+    }
+    for component in components:
+        if (
+            (is_layout_component(component) and not component["type"] == "editgrid")
+            or component["type"] == "content"
+            or component["key"] in editgrid_keys
+        ):
+            continue
+        yield component
+
+
 class FormVariableManager(models.Manager):
     use_in_migrations = True
 
     @transaction.atomic
-    def create_for_form(self, form: "Form") -> None:
-        form_steps = form.formstep_set.select_related("form_definition")
+    def synchronize_for(self, form: "Form") -> None:
+        """
+        Synchronize the component variables of a form with its form definitions.
 
+        The desired component variables of all steps are computed in a single pass over
+        the configurations and compared with the existing component variables, which
+        are then created, updated or deleted in bulk. Existing variables are updated in
+        place, so that the submission variables referencing them stay coupled.
+        """
+        desired_variables = {}
+        form_steps = form.formstep_set.select_related("form_definition")
         for form_step in form_steps:
-            self.create_for_formstep(form_step)
+            form_definition = form_step.form_definition
+            for component in _iter_variable_components(form_definition.configuration):
+                desired_variables[component["key"]] = self._build_component_variable(
+                    form, form_definition, component
+                )
 
-    def create_for_formstep(self, form_step: "FormStep") -> List["FormVariable"]:
-        form_definition_configuration = form_step.form_definition.configuration
-        component_keys = [
-            component["key"]
-            for component in iter_components(
-                configuration=form_definition_configuration, recursive=True
+        # lock the existing variables, they may be updated concurrently from the API
+        existing_variables = {
+            variable.key: variable
+            for variable in self.select_for_update().filter(
+                form=form, source=FormVariableSources.component
             )
+        }
+
+        to_delete = [
+            variable.pk
+            for key, variable in existing_variables.items()
+            if key not in desired_variables
         ]
-        existing_form_variables_keys = form_step.form.formvariable_set.filter(
-            key__in=component_keys,
-            form_definition=form_step.form_definition,
-        ).values_list("key", flat=True)
-
-        form_variables = []
-        for component in iter_components(
-            configuration=form_definition_configuration, recursive=True
-        ):
-            if (
-                (is_layout_component(component) and not component["type"] == "editgrid")
-                or component["type"] == "content"
-                or component["key"] in existing_form_variables_keys
-                or component_in_editgrid(form_definition_configuration, component)
-            ):
+        to_create, to_update = [], []
+        for key, desired_variable in desired_variables.items():
+            variable = existing_variables.get(key)
+            if variable is None:
+                to_create.append(desired_variable)
                 continue
+            changed = False
+            for field in COMPONENT_VARIABLE_FIELDS:
+                value = getattr(desired_variable, field)
+                if getattr(variable, field) != value:
+                    setattr(variable, field, value)
+                    changed = True
+            if changed:
+                to_update.append(variable)
 
-            form_variables.append(
-                self.model(
-                    form=form_step.form,
-                    form_definition=form_step.form_definition,
-                    prefill_plugin=glom(
-                        component,
-                        Path("prefill", "plugin"),
-                        default="",
-                        skip_exc=KeyError,
-                    ),
-                    prefill_attribute=glom(
-                        component,
-                        Path("prefill", "attribute"),
-                        default="",
-                        skip_exc=KeyError,
-                    ),
-                    prefill_identifier_role=glom(
-                        component,
-                        Path("prefill", "identifierRole"),
-                        default=IdentifierRoles.main,
-                        skip_exc=KeyError,
-                    ),
-                    key=component["key"],
-                    name=component.get("label") or component["key"],
-                    is_sensitive_data=component.get("isSensitiveData", False),
-                    source=FormVariableSources.component,
-                    data_type=get_component_datatype(component),
-                    initial_value=get_component_default_value(component),
-                )
+        if to_delete:
+            from ..tasks import recouple_submission_variables_to_form_variables
+
+            self.filter(pk__in=to_delete).delete()
+            # the submission variables of the deleted variables are decoupled
+            transaction.on_commit(
+                partial(recouple_submission_variables_to_form_variables.delay, form.id)
             )
+        if to_update:
+            self.bulk_update(to_update, fields=COMPONENT_VARIABLE_FIELDS)
+        if to_create:
+            self.bulk_create(to_create)
+
+    def create_for_formstep(self, form_step: "FormStep") -> List["FormVariable"]:
+        form_definition = form_step.form_definition
+        components = list(_iter_variable_components(form_definition.configuration))
+        existing_form_variables_keys = set(
+            form_step.form.formvariable_set.filter(
+                key__in=[component["key"] for component in components],
+                form_definition=form_definition,
+            ).values_list("key", flat=True)
+        )
 
+        form_variables = [
+            self._build_component_variable(form_step.form, form_definition, component)
+            for component in components
+            if component["key"] not in existing_form_variables_keys
+        ]
         return self.bulk_create(form_variables)
 
+    def _build_component_variable(
+        self, form: "Form", form_definition: FormDefinition, component: Component
+    ) -> "FormVariable":
+        return self.model(
+            form=form,
+            form_definition=form_definition,
+            prefill_plugin=glom(
+                component,
+                Path("prefill", "plugin"),
+                default="",
+                skip_exc=KeyError,
+            ),
+            prefill_attribute=glom(
+                component,
+                Path("prefill", "attribute"),
+                default="",
+                skip_exc=KeyError,
+            ),
+            prefill_identifier_role=glom(
+                component,
+                Path("prefill", "identifierRole"),
+                default=IdentifierRoles.main,
+                skip_exc=KeyError,
+            ),
+            key=component["key"],
+            name=component.get("label") or component["key"],
+            is_sensitive_data=component.get("isSensitiveData", False),
+            source=FormVariableSources.component,
+            data_type=get_component_datatype(component),
+            initial_value=get_component_default_value(component),
+        )
+
 
 class FormVariable(models.Model):
     form = models.ForeignKey(
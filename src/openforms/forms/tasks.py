@@ -56,9 +56,9 @@ def detect_formiojs_configuration_snake_case(
 def recouple_submission_variables_to_form_variables(form_id: int) -> None:
     """Recouple SubmissionValueVariable to FormVariable
 
-    When the FormVariable bulk create/update endpoint is called, all existing FormVariable related to the form are
-    deleted and new are created. If there are existing submissions for this form, the SubmissionValueVariables don't
-    have a related FormVariable anymore. This task tries to recouple them.
+    When the FormVariable bulk create/update endpoint is called, the FormVariables that are no longer present are
+    deleted and new ones are created. If there are existing submissions for this form, the SubmissionValueVariables
+    of deleted FormVariables don't have a related FormVariable anymore. This task tries to recouple them.
     """
     from openforms.submissions.models import SubmissionValueVariable
 
@@ -67,23 +67,28 @@ def recouple_submission_variables_to_form_variables(form_id: int) -> None:
         form_variable__isnull=True, submission__form=form
     )
 
-    form_variables = {
-        variable.key: variable for variable in form.formvariable_set.all()
-    }
-
-    submission_variables_to_update = []
-    for submission_variable in submission_variables_to_recouple:
-        if form_variable := form_variables.get(submission_variable.key):
-            submission_variable.form_variable = form_variable
-            submission_variables_to_update.append(submission_variable)
-
     try:
-        SubmissionValueVariable.objects.bulk_update(
-            submission_variables_to_update, fields=["form_variable"]
-        )
+        with transaction.atomic():
+            # Issue #1970: lock the form variables, so that a concurrent save of the form from the bulk update
+            # endpoint waits until this task is done instead of deleting them while they are being coupled.
+            form_variables = {
+                variable.key: variable
+                for variable in form.formvariable_set.select_for_update()
+            }
+
+            submission_variables_to_update = []
+            for submission_variable in submission_variables_to_recouple:
+                if form_variable := form_variables.get(submission_variable.key):
+                    submission_variable.form_variable = form_variable
+                    submission_variables_to_update.append(submission_variable)
+
+            SubmissionValueVariable.objects.bulk_update(
+                submission_variables_to_update, fields=["form_variable"]
+            )
     except IntegrityError:
         # Issue #1970: If the form is saved again from the form editor while this task was running, the form variables
         # retrieved don't exist anymore. Another task will be scheduled from the endpoint, so nothing more to do here.
+        # Deletions that don't take the lock (cascades, the admin...) can still cause this.
         logger.info("Form variables were updated while this task was runnning.")
 
 
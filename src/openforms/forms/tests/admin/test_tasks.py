@@ -1,6 +1,7 @@
 import zipfile
 from pathlib import Path
 from unittest.mock import patch
+from uuid import uuid4
 
 from django.core import mail
 from django.test import TestCase, override_settings
@@ -17,8 +18,9 @@ from openforms.logging.models import TimelineLogProxy
 from openforms.utils.urls import build_absolute_uri
 
 from ...admin.tasks import process_forms_export, process_forms_import
+from ...models import FormDefinition
 from ...models.form import Form, FormsExport
-from ..factories import FormFactory
+from ..factories import FormDefinitionFactory, FormFactory, FormStepFactory
 
 
 @temp_private_root()
@@ -122,3 +124,26 @@ class ImportFormsTaskTests(TestCase):
 
         for item in failed_forms:
             self.assertEqual(item[1], ["Something went wrong"])
+
+    def test_reusable_form_definition_imported_once(self):
+        form_definition = FormDefinitionFactory.create(is_reusable=True)
+        form1, form2 = FormFactory.create_batch(2)
+        FormStepFactory.create(form=form1, form_definition=form_definition)
+        FormStepFactory.create(form=form2, form_definition=form_definition)
+        process_forms_export(
+            forms_uuids=[form1.uuid, form2.uuid],
+            user_id=self.user.id,
+        )
+        export_content = FormsExport.objects.latest("pk").export_content
+        filename = private_media_storage.save(
+            "imports/tmp_import_file.zip", export_content
+        )
+        # simulate importing into another environment, where the form definition
+        # doesn't exist yet
+        FormDefinition.objects.filter(pk=form_definition.pk).update(uuid=uuid4())
+
+        process_forms_import(filename, self.user.id)
+
+        imported_definitions = FormDefinition.objects.exclude(pk=form_definition.pk)
+        self.assertEqual(imported_definitions.count(), 1)
+        self.assertEqual(imported_definitions.get().used_in.count(), 2)
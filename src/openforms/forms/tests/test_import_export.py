@@ -121,6 +121,23 @@ class ImportExportTests(TestCase):
                 FormVariableSources.user_defined, form_variables[0]["source"]
             )
 
+    @freeze_time()  # export metadata contains a timestamp
+    def test_streamed_export_matches_form_to_json(self):
+        form = FormFactory.create()
+        FormStepFactory.create_batch(2, form=form)
+        FormLogicFactory.create_batch(2, form=form)
+        FormVariableFactory.create(form=form, user_defined=True, key="var1")
+        FormVariableFactory.create(form=form, user_defined=True, key="var2")
+
+        call_command("export", form.pk, self.filepath)
+        resources = form_to_json(form.pk)
+
+        with zipfile.ZipFile(self.filepath, "r") as f:
+            self.assertEqual(f.namelist(), [f"{name}.json" for name in resources])
+            for name, data in resources.items():
+                with self.subTest(resource=name):
+                    self.assertEqual(f.read(f"{name}.json").decode(), data)
+
     def test_import(self):
         product = ProductFactory.create()
         merchant = OgoneMerchantFactory.create()
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from django.test import TestCase
@@ -5,6 +7,7 @@ from django.test import TestCase
 from openforms.variables.constants import FormVariableDataTypes, FormVariableSources
 from openforms.variables.tests.factories import ServiceFetchConfigurationFactory
 
+from ...models import FormVariable
 from ..factories import FormFactory, FormVariableFactory
 
 
@@ -201,3 +204,103 @@ class FormVariableModelTests(TestCase):
                     self.assertEqual(
                         expected_values[data_type][index], variable.initial_value
                     )
+
+
+class SynchronizeComponentVariablesTests(TestCase):
+    def test_component_variables_synchronized(self):
+        form = FormFactory.create(
+            generate_minimal_setup=True,
+            formstep__form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "unchanged", "label": "Unchanged"},
+                    {"type": "textfield", "key": "changed", "label": "Changed"},
+                    {"type": "textfield", "key": "removed", "label": "Removed"},
+                ]
+            },
+        )
+        user_defined = FormVariableFactory.create(
+            form=form, user_defined=True, key="userDefined"
+        )
+        variables = {
+            variable.key: variable.pk for variable in form.formvariable_set.all()
+        }
+        form_definition = form.formstep_set.get().form_definition
+        form_definition.configuration = {
+            "components": [
+                {"type": "textfield", "key": "unchanged", "label": "Unchanged"},
+                {"type": "number", "key": "changed", "label": "Changed"},
+                {"type": "textfield", "key": "added", "label": "Added"},
+            ]
+        }
+        form_definition.save()
+
+        FormVariable.objects.synchronize_for(form)
+
+        self.assertEqual(
+            set(form.formvariable_set.values_list("key", flat=True)),
+            {"unchanged", "changed", "added", user_defined.key},
+        )
+        changed = form.formvariable_set.get(key="changed")
+        self.assertEqual(changed.pk, variables["changed"])
+        self.assertEqual(changed.data_type, FormVariableDataTypes.float)
+        self.assertEqual(
+            form.formvariable_set.get(key="unchanged").pk, variables["unchanged"]
+        )
+
+    def test_editgrid_and_layout_components(self):
+        form = FormFactory.create(
+            generate_minimal_setup=True,
+            formstep__form_definition__configuration={
+                "components": [
+                    {
+                        "type": "fieldset",
+                        "key": "fieldset",
+                        "components": [{"type": "textfield", "key": "name"}],
+                    },
+                    {"type": "content", "key": "content", "html": "<p>Hi</p>"},
+                    {
+                        "type": "editgrid",
+                        "key": "repeatingGroup",
+                        "components": [{"type": "textfield", "key": "item"}],
+                    },
+                ]
+            },
+        )
+        form.formvariable_set.all().delete()
+
+        FormVariable.objects.synchronize_for(form)
+
+        self.assertEqual(
+            set(form.formvariable_set.values_list("key", flat=True)),
+            {"name", "repeatingGroup"},
+        )
+
+    @patch("openforms.forms.tasks.recouple_submission_variables_to_form_variables")
+    def test_submission_variables_recoupled_after_removal(self, mock_recouple):
+        form = FormFactory.create(
+            generate_minimal_setup=True,
+            formstep__form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "name"},
+                    {"type": "textfield", "key": "removed"},
+                ]
+            },
+        )
+        form_definition = form.formstep_set.get().form_definition
+
+        with self.subTest("no variables removed"):
+            with self.captureOnCommitCallbacks(execute=True):
+                FormVariable.objects.synchronize_for(form)
+
+            mock_recouple.delay.assert_not_called()
+
+        with self.subTest("variables removed"):
+            form_definition.configuration = {
+                "components": [{"type": "textfield", "key": "name"}]
+            }
+            form_definition.save()
+
+            with self.captureOnCommitCallbacks(execute=True):
+                FormVariable.objects.synchronize_for(form)
+
+            mock_recouple.delay.assert_called_once_with(form.id)
@@ -21,6 +21,7 @@ from openforms.forms.tests.factories import (
     FormStepFactory,
     FormVariableFactory,
 )
+from openforms.submissions.tests.factories import SubmissionStepFactory
 from openforms.variables.constants import (
     DataMappingTypes,
     FormVariableDataTypes,
@@ -130,6 +131,51 @@ class FormVariableViewsetTest(APITestCase):
         self.assertFalse(form_variables.filter(key="variable2").exists())
         self.assertTrue(form_variables.filter(key="variable3").exists())
 
+    def test_bulk_update_keeps_existing_variables(self):
+        user = StaffUserFactory.create(user_permissions=["change_form"])
+        form = FormFactory.create(
+            generate_minimal_setup=True,
+            formstep__form_definition__configuration={
+                "components": [{"type": "textfield", "key": "test"}]
+            },
+        )
+        form_step = form.formstep_set.get()
+        component_variable = form.formvariable_set.get(key="test")
+        submission_step = SubmissionStepFactory.create(
+            submission__form=form, form_step=form_step, data={"test": "foo"}
+        )
+        form_path = reverse("api:form-detail", kwargs={"uuid_or_slug": form.uuid})
+        form_definition_path = reverse(
+            "api:formdefinition-detail",
+            kwargs={"uuid": form_step.form_definition.uuid},
+        )
+        data = [
+            {
+                "form": f"http://testserver{form_path}",
+                "form_definition": f"http://testserver{form_definition_path}",
+                "key": "test",
+                "name": "Updated name",
+                "source": FormVariableSources.component,
+                "data_type": FormVariableDataTypes.string,
+                "initial_value": "",
+            },
+        ]
+
+        self.client.force_authenticate(user)
+        response = self.client.put(
+            reverse("api:form-variables", kwargs={"uuid_or_slug": form.uuid}),
+            data=data,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        variable = form.formvariable_set.get()
+        self.assertEqual(variable.pk, component_variable.pk)
+        self.assertEqual(variable.name, "Updated name")
+        submission_variable = (
+            submission_step.submission.submissionvaluevariable_set.get(key="test")
+        )
+        self.assertEqual(submission_variable.form_variable, variable)
+
     def test_it_accepts_inline_service_fetch_configs(self):
         designer = StaffUserFactory.create(user_permissions=["change_form"])
         service = ServiceFactory.create(
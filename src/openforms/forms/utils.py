@@ -3,7 +3,8 @@ import logging
 import random
 import string
 import zipfile
-from typing import Any
+from collections.abc import Iterable, Iterator, Mapping
+from typing import IO, Any
 from uuid import uuid4
 
 from django.conf import settings
@@ -48,6 +49,9 @@ SERIALIZERS = {
     "formVariables": FormVariableSerializer,
 }
 
+# resources that only relate to the form and its steps, these are inserted in bulk
+BULK_IMPORT_RESOURCES = ("formVariables", "formLogic")
+
 
 def _get_mock_request():
     factory = APIRequestFactory()
@@ -64,7 +68,13 @@ def to_json(obj: Any):
     return json.dumps(obj, cls=DjangoJSONEncoder)
 
 
-def form_to_json(form_id: int) -> dict:
+def _iter_form_resources(form_id: int) -> Iterator[tuple[str, Iterable[dict]]]:
+    """
+    Yield the export resources of a form, one at a time.
+
+    The entries of each resource are serialized lazily, so that a resource can be
+    written out (or discarded) before the next one is serialized.
+    """
     form = Form.objects.get(pk=form_id)
 
     # Ignore products in the export
@@ -87,61 +97,110 @@ def form_to_json(form_id: int) -> dict:
         source=FormVariableSources.user_defined
     )
 
-    request = _get_mock_request()
+    context = {"request": _get_mock_request()}
+
+    yield "forms", [FormExportSerializer(instance=form, context=context).data]
+    yield "formSteps", (
+        FormStepSerializer(instance=form_step, context=context).data
+        for form_step in form_steps.iterator()
+    )
+    yield "formDefinitions", (
+        FormDefinitionSerializer(instance=form_definition, context=context).data
+        for form_definition in form_definitions.iterator()
+    )
+    yield "formLogic", (
+        FormLogicSerializer(instance=rule, context=context).data
+        for rule in form_logic.iterator()
+    )
+    yield "formVariables", (
+        FormVariableSerializer(instance=variable, context=context).data
+        for variable in form_variables.iterator()
+    )
 
-    forms = [FormExportSerializer(instance=form, context={"request": request}).data]
-    form_definitions = FormDefinitionSerializer(
-        instance=form_definitions,
-        many=True,
-        context={"request": request},
-    ).data
-    form_steps = FormStepSerializer(
-        instance=form_steps, many=True, context={"request": request}
-    ).data
-    form_logic = FormLogicSerializer(
-        instance=form_logic, many=True, context={"request": request}
-    ).data
-    form_variables = FormVariableSerializer(
-        instance=form_variables, many=True, context={"request": request}
-    ).data
 
-    resources = {
-        "forms": to_json(forms),
-        "formSteps": to_json(form_steps),
-        "formDefinitions": to_json(form_definitions),
-        "formLogic": to_json(form_logic),
-        "formVariables": to_json(form_variables),
-        EXPORT_META_KEY: to_json(
-            {
-                "of_release": settings.RELEASE,
-                "of_git_sha": settings.GIT_SHA,
-                "created": timezone.now().isoformat(),
-            }
-        ),
+def _get_export_meta() -> dict:
+    return {
+        "of_release": settings.RELEASE,
+        "of_git_sha": settings.GIT_SHA,
+        "created": timezone.now().isoformat(),
     }
 
+
+def _write_json_array(fp: IO[bytes], entries: Iterable[Any]) -> None:
+    # produces the same output as ``to_json(list(entries))``, without holding all the
+    # encoded entries in memory
+    fp.write(b"[")
+    for index, entry in enumerate(entries):
+        if index:
+            fp.write(b", ")
+        fp.write(to_json(entry).encode())
+    fp.write(b"]")
+
+
+def form_to_json(form_id: int) -> dict:
+    resources = {
+        name: to_json(list(entries)) for name, entries in _iter_form_resources(form_id)
+    }
+    resources[EXPORT_META_KEY] = to_json(_get_export_meta())
     return resources
 
 
 def export_form(form_id, archive_name=None, response=None):
-    resources = form_to_json(form_id)
+    """
+    Write the export archive of a form to ``archive_name`` or ``response``.
 
+    Every resource is streamed into its archive member as it is serialized, so the
+    target may also be a non-seekable file-like object (e.g. a member of another
+    archive).
+    """
     outfile = response or archive_name
     with zipfile.ZipFile(outfile, "w") as zip_file:
-        for name, data in resources.items():
-            zip_file.writestr(f"{name}.json", data)
+        for name, entries in _iter_form_resources(form_id):
+            with zip_file.open(f"{name}.json", "w") as resource_file:
+                _write_json_array(resource_file, entries)
+        zip_file.writestr(f"{EXPORT_META_KEY}.json", to_json(_get_export_meta()))
     return outfile
 
 
+class ArchiveResources(Mapping):
+    """
+    Read-only view on the resources of an export archive.
+
+    A resource is only read (and decoded) from the archive when it is accessed, so
+    the import keeps at most one resource in memory at a time.
+    """
+
+    def __init__(self, zip_file: zipfile.ZipFile):
+        self.zip_file = zip_file
+        names = set(zip_file.namelist())
+        self._resources = [
+            resource for resource in IMPORT_ORDER if f"{resource}.json" in names
+        ]
+
+    def __getitem__(self, resource: str) -> str:
+        if resource not in self._resources:
+            raise KeyError(resource)
+        return self.zip_file.read(f"{resource}.json").decode()
+
+    def __iter__(self):
+        return iter(self._resources)
+
+    def __len__(self):
+        return len(self._resources)
+
+
 @transaction.atomic
-def import_form(import_file, existing_form_instance=None):
-    import_data = {}
+def import_form(
+    import_file,
+    existing_form_instance=None,
+    reusable_form_definitions: dict[tuple[str, str], FormDefinition] | None = None,
+):
     with zipfile.ZipFile(import_file, "r") as zip_file:
-        for resource in IMPORT_ORDER.keys():
-            if f"{resource}.json" in zip_file.namelist():
-                import_data[resource] = zip_file.read(f"{resource}.json").decode()
-
-    import_form_data(import_data, existing_form_instance)
+        import_form_data(
+            ArchiveResources(zip_file),
+            existing_form_instance,
+            reusable_form_definitions=reusable_form_definitions,
+        )
 
 
 def check_form_definition(uuid: str, attrs: dict[str, Any], for_existing_form: bool):
@@ -171,17 +230,81 @@ def check_form_definition(uuid: str, attrs: dict[str, Any], for_existing_form: b
     return None
 
 
+def _get_reusable_key(attrs: dict[str, Any]) -> tuple[str, str] | None:
+    if not attrs.get("is_reusable"):
+        return None
+    configuration_hash = FormDefinition(configuration=attrs["configuration"]).get_hash()
+    return (configuration_hash, attrs.get("name", ""))
+
+
+def _bulk_import_resource(
+    resource: str, entries: list[dict], form: Form, request
+) -> None:
+    """
+    Validate and insert all the entries of a (form-level) resource at once.
+
+    Form variables and logic rules only relate to the form and its steps, so they are
+    validated in one go and created with a single ``bulk_create`` query, like the
+    bulk API endpoints do.
+    """
+    context = {
+        "request": request,
+        "form": form,
+        "is_import": True,
+        # context for :class:`openforms.api.fields.RelatedFieldFromContext` lookups
+        "forms": {str(form.uuid): form},
+        "form_definitions": {
+            str(fd.uuid): fd
+            for fd in FormDefinition.objects.filter(formstep__form=form).distinct()
+        },
+    }
+    if resource == "formLogic":
+        context.update(
+            {
+                "form_variables": FormVariableWrapper(form),
+                "form_steps": {
+                    form_step.uuid: form_step for form_step in form.formstep_set.all()
+                },
+            }
+        )
+
+    for entry in entries:
+        # The transferring between systems case is very tricky
+        # better not import these, we don't know where this came from.
+        # services and ids may point to different things
+        # in different OF instances.
+        entry.pop("service_fetch_configuration", None)
+        if resource == "formLogic" and "order" not in entry:
+            entry["order"] = 0
+
+    serializer = SERIALIZERS[resource](data=entries, many=True, context=context)
+    serializer.is_valid(raise_exception=True)
+    serializer.save()
+
+
 @transaction.atomic
 @override(language=settings.LANGUAGE_CODE)
 def import_form_data(
-    import_data: dict,
+    import_data: Mapping[str, str],
     existing_form_instance: Form | None = None,
+    reusable_form_definitions: dict[tuple[str, str], FormDefinition] | None = None,
 ) -> None:
+    """
+    Import the resources of a form export.
+
+    :param import_data: mapping of resource name to the JSON data of the resource.
+    :param existing_form_instance: the form to replace the configuration of, if any.
+    :param reusable_form_definitions: registry of the reusable form definitions that
+      were imported before (keyed by configuration hash and name), shared between the
+      imports of a bulk import. Identical reusable form definitions are then imported
+      only once, rather than once for every form using them.
+    """
     uuid_mapping = {}
 
     request = _get_mock_request()
 
     created_form = None
+    imported_reusable_form_definitions = {}
 
     # when restoring a previous version, delete the current form configuration,
     # it will be replaced with the import data.
@@ -211,7 +334,17 @@ def import_form_data(
         except KeyError:
             raise ValidationError(f"Unknown resource {resource}")
 
-        for entry in json.loads(data):
+        entries = json.loads(data)
+        del data
+        logger.debug("Importing %d entries of resource %s", len(entries), resource)
+
+        if resource in BULK_IMPORT_RESOURCES:
+            # by now, the form resource has been created (or it was an existing one)
+            _form = existing_form_instance or created_form
+            _bulk_import_resource(resource, entries, _form, request)
+            continue
+
+        for entry in entries:
             if old_uuid := entry.get("uuid"):
                 entry["uuid"] = str(uuid4())
 
@@ -235,12 +368,24 @@ def import_form_data(
                 },
             }
 
+            reusable_key = None
             if resource == "formDefinitions":
                 existing_form_definition_instance = check_form_definition(
                     old_uuid,
                     entry,
                     for_existing_form=existing_form_instance is not None,
                 )
+                reusable_key = _get_reusable_key(entry)
+                if (
+                    existing_form_definition_instance is None
+                    and reusable_key is not None
+                    and reusable_form_definitions is not None
+                ):
+                    # An identical reusable form definition was imported for another
+                    # form in this (bulk) import, use that one instead of a copy.
+                    existing_form_definition_instance = reusable_form_definitions.get(
+                        reusable_key
+                    )
                 if existing_form_definition_instance:
                     # The form definition that is being imported is identical to
                     # the existing form definition with the same UUID, use
@@ -250,51 +395,14 @@ def import_form_data(
                     # Note that the mapping will include the same UUID  here often,
                     # which is okay for find-and-replace.
                     serializer_kwargs["instance"] = existing_form_definition_instance
-                    entry["uuid"] = old_uuid
-                    uuid_mapping[old_uuid] = old_uuid
+                    entry["uuid"] = str(existing_form_definition_instance.uuid)
+                    uuid_mapping[old_uuid] = entry["uuid"]
 
             if resource == "forms" and existing_form_instance:
                 serializer_kwargs["instance"] = existing_form_instance
 
-            if resource in ("formVariables", "formLogic"):
-                # by now, the form resource has been created (or it was an existing one)
-                _form = existing_form_instance or created_form
-                serializer_kwargs["context"].update(
-                    {
-                        "forms": {str(_form.uuid): _form},
-                        "form_definitions": {
-                            str(fd.uuid): fd
-                            for fd in FormDefinition.objects.filter(
-                                formstep__form=_form
-                            )
-                        },
-                    }
-                )
-                if "service_fetch_configuration" in entry:
-                    # The transferring between systems case is very tricky
-                    # better not import these, we don't know where this came from.
-                    # services and ids may point to different things
-                    # in different OF instances.
-                    del entry["service_fetch_configuration"]
-
-            if resource == "formLogic":
-                # by now, the form resource has been created (or it was an existing one)
-                _form = existing_form_instance or created_form
-                serializer_kwargs["context"].update(
-                    {
-                        "form_variables": FormVariableWrapper(_form),
-                        "form_steps": {
-                            form_step.uuid: form_step
-                            for form_step in _form.formstep_set.all()
-                        },
-                    }
-                )
-
             deserialized = serializer(**serializer_kwargs)
 
-            if resource == "formLogic" and "order" not in entry:
-                entry["order"] = 0
-
             try:
                 is_create = (
                     deserialized.instance is None or not deserialized.instance.pk
@@ -303,12 +411,10 @@ def import_form_data(
                 instance = deserialized.save()
                 if resource == "forms":
                     created_form = deserialized.instance
-                if resource == "formSteps":
-                    # Once the form steps have been created, we create the component FormVariables
-                    # based on the form definition configurations.
-                    FormVariable.objects.create_for_form(created_form)
                 if resource == "formDefinitions" and is_create:
                     uuid_mapping[old_uuid] = str(instance.uuid)
+                if reusable_key is not None:
+                    imported_reusable_form_definitions[reusable_key] = instance
 
                 # The FormSerializer/FormStepSerializer/FormLogicSerializer have the uuid as a read only field.
                 # So the mapping between the old uuid and the new needs to be done after the instance is saved.
@@ -337,6 +443,14 @@ def import_form_data(
                 else:
                     raise e
 
+        if resource == "formSteps":
+            # Once the form steps have been created, we create the component FormVariables
+            # based on the form definition configurations.
+            FormVariable.objects.synchronize_for(created_form)
+
+    if reusable_form_definitions is not None:
+        reusable_form_definitions.update(imported_reusable_form_definitions)
+
 
 def remove_key_from_dict(dictionary, key):
     for dict_key in list(dictionary.keys()):
@@ -5,3 +5,8 @@ from django.utils.translation import gettext_lazy as _
 class TimelineLogTags(models.TextChoices):
     AVG = "avg", _("AVG")
     hijack = "hijack", _("Hijack")
+
+
+class LogicLoggingModes(models.TextChoices):
+    immediate = "immediate", _("Log every evaluation")
+    buffered = "buffered", _("Log one consolidated entry per step save/completion")
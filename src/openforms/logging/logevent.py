@@ -15,6 +15,7 @@ from openforms.payments.constants import PaymentStatus
 from openforms.plugins.plugin import AbstractBasePlugin
 from openforms.typing import JSONObject
 
+from . import logic_buffer
 from .tasks import log_logic_evaluation
 
 if TYPE_CHECKING:  # pragma: nocover
@@ -504,7 +505,13 @@ def submission_logic_evaluated(
 ):
     """
     Convert into JSON-serializable data types and schedule the celery task.
+
+    In buffered mode, the evaluation is recorded and only logged when
+    :func:`submission_logic_evaluations_flush` is called.
     """
+    if not logic_buffer.is_sampled(submission):
+        return
+
     timestamp = timezone.now().isoformat()
     _evaluated_rules = []
     for evaluated_rule in map(asdict, evaluated_rules):
@@ -512,6 +519,16 @@ def submission_logic_evaluated(
         del evaluated_rule["rule"]
         _evaluated_rules.append(evaluated_rule)
 
+    if logic_buffer.is_buffered():
+        logic_buffer.add_evaluation(
+            submission,
+            timestamp=timestamp,
+            evaluated_rules=_evaluated_rules,
+            initial_data=initial_data,
+            resolved_data=resolved_data,
+        )
+        return
+
     log_logic_evaluation.delay(
         submission_id=submission.id,
         timestamp=timestamp,
@@ -521,6 +538,27 @@ def submission_logic_evaluated(
     )
 
 
+def submission_logic_evaluations_flush(submission: "Submission") -> None:
+    """
+    Schedule the logging of the buffered logic evaluations as a single entry.
+    """
+    if not logic_buffer.is_buffered():
+        return
+
+    buffer = logic_buffer.pop_evaluations(submission)
+    if buffer is None:
+        return
+
+    log_logic_evaluation.delay(
+        submission_id=submission.id,
+        timestamp=buffer["timestamp"],
+        evaluated_rules=list(buffer["evaluated_rules"].values()),
+        initial_data=buffer["initial_data"],
+        data_diff=buffer["data_diff"],
+        num_evaluations=buffer["num_evaluations"],
+    )
+
+
 def logic_evaluation_failed(
     rule: "FormLogic",
     error: Exception,
@@ -24,8 +24,16 @@ def log_logic_evaluation(
     submission: Submission,
     evaluated_rules: List["EvaluatedRule"],
     initial_data: dict[str, JSON],
-    resolved_data: JSONObject,
+    resolved_data: Optional[JSONObject] = None,
+    data_diff: Optional[JSONObject] = None,
+    num_evaluations: int = 1,
 ) -> Optional["TimelineLogProxy"]:
+    """
+    Log the evaluated rules.
+
+    Either the full ``resolved_data`` or the ``data_diff`` (the data changed by the
+    logic, for consolidated entries of ``num_evaluations`` evaluations) is stored.
+    """
     if not evaluated_rules:
         return
     evaluated_rules_list = []
@@ -75,12 +83,18 @@ def log_logic_evaluation(
     # de-duplication of input data
     deduplicated_input_data = {node.key: asdict(node) for node in input_data}
 
+    extra_data = {
+        "evaluated_rules": evaluated_rules_list,
+        "input_data": deduplicated_input_data,
+    }
+    if resolved_data is not None:
+        extra_data["resolved_data"] = resolved_data
+    if data_diff is not None:
+        extra_data["data_diff"] = data_diff
+        extra_data["num_evaluations"] = num_evaluations
+
     return _create_log(
         submission,
         "submission_logic_evaluated",
-        extra_data={
-            "evaluated_rules": evaluated_rules_list,
-            "input_data": deduplicated_input_data,
-            "resolved_data": resolved_data,
-        },
+        extra_data=extra_data,
     )
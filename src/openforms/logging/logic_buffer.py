@@ -0,0 +1,109 @@
+"""
+Buffer the logic evaluation logging per submission.
+
+Logic is evaluated on every logic check while a form is being filled out. Rather than
+creating a log entry for each evaluation, the evaluations can be buffered (in the
+cache) and consolidated into a single log entry when the submission step is saved or
+the submission is completed. See ``settings.SUBMISSION_LOGIC_LOGGING_MODE``.
+
+The consolidated entry contains the most recent outcome of every evaluated rule and
+the data changes caused by the logic, rather than full snapshots of the data.
+
+Note that concurrent logic checks for the same submission may overwrite each other's
+buffered evaluations - this is acceptable for audit logging purposes.
+"""
+from typing import TYPE_CHECKING, List, Optional, TypedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from openforms.typing import JSONObject
+
+from .constants import LogicLoggingModes
+
+if TYPE_CHECKING:  # pragma: nocover
+    from openforms.submissions.models import Submission
+
+    from .tasks import EvaluatedRuleDict
+
+BUFFER_TIMEOUT = 60 * 60 * 24  # 1 day
+
+
+class BufferedEvaluations(TypedDict):
+    timestamp: str  # ISO-8601 timestamp of the most recent evaluation
+    # rule ID (as string, it must be JSON serializable) -> most recent outcome
+    evaluated_rules: dict[str, "EvaluatedRuleDict"]
+    initial_data: JSONObject
+    data_diff: JSONObject
+    num_evaluations: int
+
+
+def is_buffered() -> bool:
+    return settings.SUBMISSION_LOGIC_LOGGING_MODE == LogicLoggingModes.buffered
+
+
+def is_sampled(submission: "Submission") -> bool:
+    """
+    Determine if the logic evaluation of the submission must be logged.
+
+    The decision is deterministic for a submission, so that either all or none of the
+    evaluations of a submission are logged.
+    """
+    sample_rate = settings.SUBMISSION_LOGIC_LOGGING_SAMPLE_RATE
+    if sample_rate >= 1:
+        return True
+    if sample_rate <= 0:
+        return False
+    return (submission.uuid.int % 10_000) < sample_rate * 10_000
+
+
+def get_data_diff(initial_data: JSONObject, resolved_data: JSONObject) -> JSONObject:
+    """
+    Determine the (top-level) keys of which the value was changed by the logic.
+    """
+    missing = object()
+    return {
+        key: value
+        for key, value in resolved_data.items()
+        if initial_data.get(key, missing) != value
+    }
+
+
+def _get_cache_key(submission: "Submission") -> str:
+    return f"logic-evaluation-buffer:{submission.uuid}"
+
+
+def add_evaluation(
+    submission: "Submission",
+    timestamp: str,
+    evaluated_rules: List["EvaluatedRuleDict"],
+    initial_data: JSONObject,
+    resolved_data: JSONObject,
+) -> None:
+    cache_key = _get_cache_key(submission)
+    buffer: Optional[BufferedEvaluations] = cache.get(cache_key)
+    if buffer is None:
+        buffer = {
+            "timestamp": timestamp,
+            "evaluated_rules": {},
+            "initial_data": {},
+            "data_diff": {},
+            "num_evaluations": 0,
+        }
+
+    buffer["timestamp"] = timestamp
+    buffer["initial_data"] = initial_data
+    buffer["num_evaluations"] += 1
+    buffer["data_diff"].update(get_data_diff(initial_data, resolved_data))
+    for evaluated_rule in evaluated_rules:
+        buffer["evaluated_rules"][str(evaluated_rule["rule_id"])] = evaluated_rule
+
+    cache.set(cache_key, buffer, timeout=BUFFER_TIMEOUT)
+
+
+def pop_evaluations(submission: "Submission") -> Optional[BufferedEvaluations]:
+    cache_key = _get_cache_key(submission)
+    buffer = cache.get(cache_key)
+    if buffer is not None:
+        cache.delete(cache_key)
+    return buffer
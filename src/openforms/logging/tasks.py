@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, TypedDict
+from typing import List, Optional, TypedDict
 
 from openforms.celery import app
 from openforms.forms.models import FormLogic
@@ -19,7 +19,9 @@ def log_logic_evaluation(
     timestamp: str,  # ISO-8601 timestamp
     evaluated_rules: List[EvaluatedRuleDict],
     initial_data: JSONObject,
-    resolved_data: JSONObject,
+    resolved_data: Optional[JSONObject] = None,
+    data_diff: Optional[JSONObject] = None,
+    num_evaluations: int = 1,
 ):
     from openforms.submissions.logic.rules import EvaluatedRule
     from openforms.submissions.models import Submission
@@ -46,7 +48,12 @@ def log_logic_evaluation(
     ]
 
     log_entry = _log_logic_evaluation(
-        submission, _evaluated_rules, initial_data, resolved_data
+        submission,
+        _evaluated_rules,
+        initial_data,
+        resolved_data,
+        data_diff=data_diff,
+        num_evaluations=num_evaluations,
     )
 
     if not log_entry:
@@ -0,0 +1,106 @@
+from typing import cast
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from openforms.forms.models import FormLogic
+from openforms.forms.tests.factories import FormLogicFactory
+from openforms.submissions.logic.rules import EvaluatedRule
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from .. import logevent
+from ..models import TimelineLogProxy
+from ..tasks import log_logic_evaluation
+
+
+@override_settings(SUBMISSION_LOGIC_LOGGING_MODE="buffered")
+class BufferedLogicLoggingTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(cache.clear)
+
+        patcher = patch("openforms.logging.logevent.log_logic_evaluation")
+        self.mock_task = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_evaluations_consolidated_on_flush(self):
+        submission = SubmissionFactory.create()
+        rule1, rule2 = FormLogicFactory.create_batch(2, form=submission.form)
+
+        logevent.submission_logic_evaluated(
+            submission,
+            [
+                EvaluatedRule(rule=cast(FormLogic, rule1), triggered=False),
+                EvaluatedRule(rule=cast(FormLogic, rule2), triggered=False),
+            ],
+            initial_data={"a": 1, "b": 1},
+            resolved_data={"a": 1, "b": 2},
+        )
+        logevent.submission_logic_evaluated(
+            submission,
+            [EvaluatedRule(rule=cast(FormLogic, rule1), triggered=True)],
+            initial_data={"a": 2, "b": 1},
+            resolved_data={"a": 2, "b": 1, "c": 3},
+        )
+
+        self.mock_task.delay.assert_not_called()
+
+        logevent.submission_logic_evaluations_flush(submission)
+
+        self.mock_task.delay.assert_called_once()
+        kwargs = self.mock_task.delay.call_args.kwargs
+        self.assertEqual(kwargs["num_evaluations"], 2)
+        self.assertEqual(kwargs["initial_data"], {"a": 2, "b": 1})
+        self.assertEqual(kwargs["data_diff"], {"b": 2, "c": 3})
+        self.assertNotIn("resolved_data", kwargs)
+        outcomes = {
+            item["rule_id"]: item["triggered"] for item in kwargs["evaluated_rules"]
+        }
+        self.assertEqual(outcomes, {rule1.id: True, rule2.id: False})
+
+        with self.subTest("buffer is emptied"):
+            self.mock_task.reset_mock()
+
+            logevent.submission_logic_evaluations_flush(submission)
+
+            self.mock_task.delay.assert_not_called()
+
+    @override_settings(SUBMISSION_LOGIC_LOGGING_SAMPLE_RATE=0.0)
+    def test_not_sampled(self):
+        submission = SubmissionFactory.create()
+        rule = FormLogicFactory.create(form=submission.form)
+
+        logevent.submission_logic_evaluated(
+            submission,
+            [EvaluatedRule(rule=cast(FormLogic, rule), triggered=True)],
+            initial_data={},
+            resolved_data={},
+        )
+        logevent.submission_logic_evaluations_flush(submission)
+
+        self.mock_task.delay.assert_not_called()
+
+
+class ConsolidatedLogEntryTests(TestCase):
+    def test_log_entry_stores_data_diff(self):
+        submission = SubmissionFactory.create()
+        rule = FormLogicFactory.create(form=submission.form)
+
+        log_logic_evaluation(
+            submission_id=submission.id,
+            timestamp="2022-08-16T11:57:02+02:00",
+            evaluated_rules=[
+                {"rule_id": rule.id, "triggered": True, "action_log_data": {}}
+            ],
+            initial_data={"a": 1},
+            data_diff={"b": 2},
+            num_evaluations=3,
+        )
+
+        log_entry = TimelineLogProxy.objects.get()
+        self.assertEqual(log_entry.extra_data["data_diff"], {"b": 2})
+        self.assertEqual(log_entry.extra_data["num_evaluations"], 3)
+        self.assertNotIn("resolved_data", log_entry.extra_data)
+        self.assertEqual(len(log_entry.extra_data["evaluated_rules"]), 1)
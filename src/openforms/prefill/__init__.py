@@ -30,9 +30,14 @@ So, to recap:
 
 """
 import logging
+import time
 from collections import defaultdict
 from typing import TYPE_CHECKING, Any, Dict
 
+from django.conf import settings
+from django.core.cache import cache as django_cache
+from django.db import transaction
+
 import elasticapm
 from glom import Path, PathAccessError, assign, glom
 from zgw_consumers.concurrent import parallel
@@ -40,12 +45,20 @@ from zgw_consumers.concurrent import parallel
 from openforms.plugins.exceptions import PluginNotEnabled
 from openforms.variables.constants import FormVariableSources
 
+from .cache import get_cached_values, set_cached_values
+
 if TYPE_CHECKING:  # pragma: nocover
     from openforms.formio.service import FormioConfigurationWrapper
     from openforms.submissions.models import Submission
 
 logger = logging.getLogger(__name__)
 
+# upper bound for the background prefill to complete, including queueing time
+PREFILL_PENDING_TIMEOUT = 5 * 60
+PREFILL_PENDING_POLL_INTERVAL = 0.1
+# the waiting request occupies a web server worker, so it may only wait very briefly
+PREFILL_MAX_WAIT = 3
+
 
 @elasticapm.capture_span(span_type="app.prefill")
 def _fetch_prefill_values(
@@ -65,6 +78,13 @@ def _fetch_prefill_values(
         if not plugin.is_enabled:
             raise PluginNotEnabled()
 
+        identifier = plugin.get_identifier_value(submission, identifier_role)
+        if identifier and (
+            values := get_cached_values(plugin_id, identifier_role, identifier, fields)
+        ):
+            logevent.prefill_retrieve_success(submission, plugin, fields)
+            return plugin_id, identifier_role, values
+
         try:
             values = plugin.get_prefill_values(submission, fields, identifier_role)
         except Exception as e:
@@ -74,6 +94,10 @@ def _fetch_prefill_values(
         else:
             if values:
                 logevent.prefill_retrieve_success(submission, plugin, fields)
+                if identifier:
+                    set_cached_values(
+                        plugin_id, identifier_role, identifier, fields, values
+                    )
             else:
                 logevent.prefill_retrieve_empty(submission, plugin, fields)
 
@@ -187,3 +211,58 @@ def prefill_variables(submission: "Submission", register=None) -> None:
             prefill_data[variable.key] = prefill_value
 
     state.save_prefill_data(prefill_data)
+
+
+def _get_pending_key(submission: "Submission") -> str:
+    return f"prefill-pending:{submission.uuid}"
+
+
+def schedule_prefill_variables(submission: "Submission") -> None:
+    """
+    Mark the prefill of the submission as pending and retrieve it in the background.
+
+    Must be called inside the transaction creating the submission - the task is
+    dispatched when that transaction is committed. Consumers of the prefill data must
+    call :func:`wait_for_prefill` first.
+    """
+    from .tasks import prefill_variables_task
+
+    django_cache.set(
+        _get_pending_key(submission),
+        True,
+        timeout=PREFILL_PENDING_TIMEOUT,
+    )
+    transaction.on_commit(lambda: prefill_variables_task.delay(submission.id))
+
+
+def mark_prefill_done(submission: "Submission") -> None:
+    django_cache.delete(_get_pending_key(submission))
+
+
+def wait_for_prefill(submission: "Submission") -> bool:
+    """
+    Wait (very briefly) until the background prefill of the submission is done.
+
+    The wait is capped at :const:`PREFILL_MAX_WAIT` seconds, as every waiting request
+    ties up a web server worker.
+
+    :return: ``False`` if the prefill is still pending after the timeout.
+    """
+    key = _get_pending_key(submission)
+    if not django_cache.get(key):
+        return True
+
+    wait_timeout = min(settings.PREFILL_ASYNC_WAIT_TIMEOUT, PREFILL_MAX_WAIT)
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+        time.sleep(PREFILL_PENDING_POLL_INTERVAL)
+        if not django_cache.get(key):
+            return True
+
+    logger.warning(
+        "Prefill of submission %s still pending after %s seconds, continuing "
+        "without the prefilled values.",
+        submission.uuid,
+        wait_timeout,
+    )
+    return False
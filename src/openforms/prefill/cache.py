@@ -0,0 +1,73 @@
+"""
+Short-lived cache of the prefill plugin results, per identity.
+
+An end-user restarting a form or starting another form in the same session would
+otherwise trigger the same (slow) lookups in the upstream registries again. The
+retrieved values are personal data, so they are stored encrypted in the (shared) cache
+and the cache keys contain no identifiers in plain text.
+
+The caching is opt-in: it is enabled by configuring a cache timeout with the
+``PREFILL_CACHE_TIMEOUT`` setting, which defaults to ``0`` (disabled).
+"""
+import base64
+import json
+import logging
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.crypto import salted_hmac
+
+from cryptography.fernet import Fernet, InvalidToken
+
+logger = logging.getLogger(__name__)
+
+KEY_SALT = "openforms.prefill.cache"
+
+
+def _get_fernet() -> Fernet:
+    key = salted_hmac(KEY_SALT, "encryption", algorithm="sha256").digest()
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+def _get_cache_key(
+    plugin_id: str, identifier_role: str, identifier: str, attributes: Iterable[str]
+) -> str:
+    value = json.dumps([identifier_role, identifier, sorted(attributes)])
+    digest = salted_hmac(KEY_SALT, value, algorithm="sha256").hexdigest()
+    return f"prefill:{plugin_id}:{digest}"
+
+
+def get_cached_values(
+    plugin_id: str, identifier_role: str, identifier: str, attributes: Iterable[str]
+) -> dict[str, Any] | None:
+    if not settings.PREFILL_CACHE_TIMEOUT:
+        return None
+
+    key = _get_cache_key(plugin_id, identifier_role, identifier, attributes)
+    if (token := cache.get(key)) is None:
+        return None
+
+    try:
+        return json.loads(_get_fernet().decrypt(token))
+    except InvalidToken:
+        # e.g. the SECRET_KEY was rotated
+        logger.info("Discarding undecryptable prefill cache entry %s", key)
+        cache.delete(key)
+        return None
+
+
+def set_cached_values(
+    plugin_id: str,
+    identifier_role: str,
+    identifier: str,
+    attributes: Iterable[str],
+    values: dict[str, Any],
+) -> None:
+    if not settings.PREFILL_CACHE_TIMEOUT:
+        return
+
+    key = _get_cache_key(plugin_id, identifier_role, identifier, attributes)
+    token = _get_fernet().encrypt(json.dumps(values, cls=DjangoJSONEncoder).encode())
+    cache.set(key, token, timeout=settings.PREFILL_CACHE_TIMEOUT)
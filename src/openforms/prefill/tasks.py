@@ -0,0 +1,13 @@
+from openforms.celery import app
+from openforms.submissions.models import Submission
+
+from . import mark_prefill_done, prefill_variables
+
+
+@app.task(ignore_result=True)
+def prefill_variables_task(submission_id: int) -> None:
+    submission = Submission.objects.get(id=submission_id)
+    try:
+        prefill_variables(submission)
+    finally:
+        mark_prefill_done(submission)
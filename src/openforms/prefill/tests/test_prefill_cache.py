@@ -0,0 +1,199 @@
+import itertools
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from openforms.authentication.constants import AuthAttribute
+from openforms.submissions.models import SubmissionValueVariable
+from openforms.submissions.tests.factories import (
+    SubmissionFactory,
+    SubmissionValueVariableFactory,
+)
+from openforms.utils.tests.cache import clear_caches
+
+from .. import (
+    PREFILL_MAX_WAIT,
+    _fetch_prefill_values,
+    mark_prefill_done,
+    schedule_prefill_variables,
+    wait_for_prefill,
+)
+from ..cache import _get_cache_key
+from ..contrib.demo.plugin import DemoPrefill
+from ..registry import Registry
+
+register = Registry()
+
+
+@register("bsn")
+class BSNPrefill(DemoPrefill):
+    requires_auth = AuthAttribute.bsn
+
+    @staticmethod
+    def get_prefill_values(submission, attributes, identifier_role):
+        return {attribute: f"value for {attribute}" for attribute in attributes}
+
+
+GROUPED_FIELDS = {"bsn": {"main": ["random_string"]}}
+
+
+@override_settings(PREFILL_CACHE_TIMEOUT=60)
+class PrefillCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    def test_values_cached_per_identity(self):
+        submission1 = SubmissionFactory.create(auth_info__value="111222333")
+        submission2 = SubmissionFactory.create(auth_info__value="111222333")
+        other_identity = SubmissionFactory.create(auth_info__value="123456782")
+
+        with patch.object(
+            BSNPrefill, "get_prefill_values", wraps=BSNPrefill.get_prefill_values
+        ) as m_get_prefill_values:
+            results1 = _fetch_prefill_values(GROUPED_FIELDS, submission1, register)
+            results2 = _fetch_prefill_values(GROUPED_FIELDS, submission2, register)
+
+            self.assertEqual(m_get_prefill_values.call_count, 1)
+            self.assertEqual(results1, results2)
+            self.assertEqual(
+                results2,
+                {"bsn": {"main": {"random_string": "value for random_string"}}},
+            )
+
+            with self.subTest("other identity"):
+                _fetch_prefill_values(GROUPED_FIELDS, other_identity, register)
+
+                self.assertEqual(m_get_prefill_values.call_count, 2)
+
+    def test_cached_values_are_encrypted(self):
+        submission = SubmissionFactory.create(auth_info__value="111222333")
+
+        _fetch_prefill_values(GROUPED_FIELDS, submission, register)
+
+        key = _get_cache_key("bsn", "main", "111222333", ["random_string"])
+        self.assertNotIn("111222333", key)
+        token = cache.get(key)
+        self.assertIsNotNone(token)
+        self.assertNotIn(b"value for random_string", token)
+
+    def test_empty_values_not_cached(self):
+        submission = SubmissionFactory.create(auth_info__value="111222333")
+
+        with patch.object(
+            BSNPrefill, "get_prefill_values", return_value={}
+        ) as m_get_prefill_values:
+            _fetch_prefill_values(GROUPED_FIELDS, submission, register)
+            _fetch_prefill_values(GROUPED_FIELDS, submission, register)
+
+        self.assertEqual(m_get_prefill_values.call_count, 2)
+
+    @override_settings(PREFILL_CACHE_TIMEOUT=0)
+    def test_caching_disabled(self):
+        submission = SubmissionFactory.create(auth_info__value="111222333")
+
+        with patch.object(
+            BSNPrefill, "get_prefill_values", wraps=BSNPrefill.get_prefill_values
+        ) as m_get_prefill_values:
+            _fetch_prefill_values(GROUPED_FIELDS, submission, register)
+            _fetch_prefill_values(GROUPED_FIELDS, submission, register)
+
+        self.assertEqual(m_get_prefill_values.call_count, 2)
+
+
+class AsyncPrefillTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    @patch("openforms.prefill.tasks.prefill_variables_task.delay")
+    def test_prefill_scheduled_on_commit(self, m_delay):
+        submission = SubmissionFactory.create()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            schedule_prefill_variables(submission)
+
+            m_delay.assert_not_called()
+
+        m_delay.assert_called_once_with(submission.id)
+
+    @override_settings(PREFILL_ASYNC_WAIT_TIMEOUT=0)
+    @patch("openforms.prefill.tasks.prefill_variables_task.delay")
+    def test_wait_for_pending_prefill(self, m_delay):
+        submission = SubmissionFactory.create()
+        self.assertTrue(wait_for_prefill(submission))
+
+        schedule_prefill_variables(submission)
+
+        self.assertFalse(wait_for_prefill(submission))
+
+        mark_prefill_done(submission)
+
+        self.assertTrue(wait_for_prefill(submission))
+
+    @override_settings(PREFILL_ASYNC_WAIT_TIMEOUT=60)
+    @patch("openforms.prefill.tasks.prefill_variables_task.delay")
+    def test_wait_for_pending_prefill_is_capped(self, m_delay):
+        submission = SubmissionFactory.create()
+        schedule_prefill_variables(submission)
+
+        with (
+            patch("openforms.prefill.time.monotonic", side_effect=itertools.count()),
+            patch("openforms.prefill.time.sleep") as m_sleep,
+        ):
+            self.assertFalse(wait_for_prefill(submission))
+
+        self.assertEqual(m_sleep.call_count, PREFILL_MAX_WAIT - 1)
+
+    @patch("openforms.prefill.tasks.prefill_variables")
+    def test_task_marks_prefill_done(self, m_prefill_variables):
+        from ..tasks import prefill_variables_task
+
+        submission = SubmissionFactory.create()
+        with patch("openforms.prefill.tasks.prefill_variables_task.delay"):
+            schedule_prefill_variables(submission)
+
+        prefill_variables_task(submission.id)
+
+        m_prefill_variables.assert_called_once_with(submission)
+        self.assertTrue(wait_for_prefill(submission))
+
+    def test_prefill_keeps_values_saved_in_the_meantime(self):
+        submission = SubmissionFactory.from_components(
+            [
+                {
+                    "type": "textfield",
+                    "key": "name",
+                    "prefill": {"plugin": "demo", "attribute": "random_string"},
+                },
+                {
+                    "type": "textfield",
+                    "key": "other",
+                    "prefill": {"plugin": "demo", "attribute": "random_string"},
+                },
+            ],
+            with_report=False,
+        )
+        # the state of the background prefill is loaded before a step is saved
+        state = submission.load_submission_value_variables_state()
+        self.assertEqual(len(state.get_prefill_variables()), 2)
+        SubmissionValueVariableFactory.create(
+            submission=submission,
+            form_variable=submission.form.formvariable_set.get(key="name"),
+            key="name",
+            value="From user",
+        )
+
+        state.save_prefill_data({"name": "Prefilled", "other": "Prefilled"})
+
+        values = dict(
+            SubmissionValueVariable.objects.filter(submission=submission).values_list(
+                "key", "value"
+            )
+        )
+        self.assertEqual(values, {"name": "From user", "other": "Prefilled"})
@@ -1,4 +1,9 @@
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+
+from .constants import CircuitStates
 from .fields import RegistrationBackendChoiceField
+from .models import RegistrationBackendHealth
 
 
 class RegistrationBackendFieldMixin:
@@ -12,3 +17,37 @@ class RegistrationBackendFieldMixin:
             return field
 
         return super().formfield_for_dbfield(db_field, request, **kwargs)
+
+
+@admin.register(RegistrationBackendHealth)
+class RegistrationBackendHealthAdmin(admin.ModelAdmin):
+    list_display = (
+        "backend",
+        "service",
+        "circuit_state",
+        "retry_at",
+        "consecutive_failures",
+        "num_failures",
+        "last_failure",
+    )
+    list_filter = ("backend", "circuit_state")
+    readonly_fields = (
+        "backend",
+        "service",
+        "circuit_state",
+        "retry_at",
+        "consecutive_failures",
+        "num_failures",
+        "last_failure",
+        "last_error",
+    )
+    actions = ["close_circuit"]
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description=_("Close the circuit (resume registrations)"))
+    def close_circuit(self, request, queryset):
+        queryset.update(
+            circuit_state=CircuitStates.closed, retry_at=None, consecutive_failures=0
+        )
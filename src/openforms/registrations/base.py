@@ -66,6 +66,15 @@ class BasePlugin(ABC, AbstractBasePlugin):
         """Obtain the reference number generated by the registration backend and set it on the submission."""
         pass
 
+    def get_service_key(self, options: dict) -> str:
+        """
+        Identify the service the (raw, not de-serialized) options register with.
+
+        The health of a registration backend is tracked per service, so that a failing
+        service does not block the registrations with the other services.
+        """
+        return ""
+
     def get_custom_templatetags_libraries(self) -> list[str]:
         """
         Return a list of custom templatetags libraries that will be added to the 'sandboxed' Django templates backend.
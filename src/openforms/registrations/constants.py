@@ -40,3 +40,9 @@ class RegistrationAttribute(models.TextChoices):
 
     # Location
     locatie_coordinaat = "locatie_coordinaat", _("Location > Coordinate")
+
+
+class CircuitStates(models.TextChoices):
+    closed = "closed", _("Closed")
+    open = "open", _("Open")
+    half_open = "half_open", _("Half open")
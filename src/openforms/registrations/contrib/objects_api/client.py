@@ -26,8 +26,9 @@ def get_objects_client() -> NLXClient:
     return build_client(service)
 
 
-def get_documents_client() -> DocumentenClient:
-    config = ObjectsAPIConfig.get_solo()
+def get_documents_client(config: ObjectsAPIConfig | None = None) -> DocumentenClient:
+    if config is None:
+        config = ObjectsAPIConfig.get_solo()
     assert isinstance(config, ObjectsAPIConfig)
     if not (service := config.drc_service):
         raise NoServiceConfigured("No Documents API service configured!")
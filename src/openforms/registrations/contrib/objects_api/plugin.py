@@ -1,5 +1,6 @@
 import json
 import sys
+from functools import partial
 from typing import Any, Dict, NoReturn
 
 from django.conf import settings
@@ -17,7 +18,11 @@ from openforms.contrib.zgw.service import (
 )
 from openforms.submissions.exports import create_submission_export
 from openforms.submissions.mapping import SKIP, FieldConf, apply_data_mapping
-from openforms.submissions.models import Submission, SubmissionReport
+from openforms.submissions.models import (
+    Submission,
+    SubmissionFileAttachment,
+    SubmissionReport,
+)
 from openforms.submissions.public_references import set_submission_reference
 from openforms.template import openforms_backend, render_from_string
 from openforms.translations.utils import to_iso639_2b
@@ -27,6 +32,7 @@ from ...base import BasePlugin
 from ...constants import REGISTRATION_ATTRIBUTE, RegistrationAttribute
 from ...exceptions import NoSubmissionReference
 from ...registry import register
+from ...utils import execute_concurrently_unless_results_exist, thread_local_clients
 from .checks import check_config
 from .client import get_documents_client, get_objects_client
 from .config import ObjectsAPIOptionsSerializer
@@ -80,7 +86,7 @@ class ObjectsAPIRegistration(BasePlugin):
         config.apply_defaults_to(options)
 
         # Prepare all documents to relate to the Objects API record
-        with get_documents_client() as documents_client:
+        with get_documents_client(config) as documents_client:
 
             # Create the document for the PDF summary
             submission_report = SubmissionReport.objects.get(submission=submission)
@@ -100,11 +106,24 @@ class ObjectsAPIRegistration(BasePlugin):
                 options=submission_report_options,
             )
 
+            def register_attachment(
+                intermediate: dict, attachment: SubmissionFileAttachment, options: dict
+            ) -> None:
+                if not intermediate.get("document"):
+                    intermediate["document"] = create_attachment_document(
+                        client=get_thread_documents_client(),
+                        name=submission.form.admin_name,
+                        submission_attachment=attachment,
+                        options=options,
+                    )
+
             # Register the attachments
-            # TODO turn attachments into dictionary when giving users more options then
-            # just urls.
-            attachments = []
-            for attachment in submission.attachments:
+            attachment_callbacks = {}
+            # the attachments are registered in worker threads, which may not access
+            # the database - fetch everything they need up front
+            for attachment in submission.attachments.select_related(
+                "submission_step__submission"
+            ):
                 attachment_options = build_options(
                     options,
                     {
@@ -125,13 +144,28 @@ class ObjectsAPIRegistration(BasePlugin):
                     if value:
                         attachment_options[key] = value
 
-                attachment_document = create_attachment_document(
-                    client=documents_client,
-                    name=submission.form.admin_name,
-                    submission_attachment=attachment,
+                attachment_callbacks[
+                    f"intermediate.documents.{attachment.id}"
+                ] = partial(
+                    register_attachment,
+                    attachment=attachment,
                     options=attachment_options,
                 )
-                attachments.append(attachment_document["url"])
+
+            # the client may not be shared by the threads registering the attachments
+            with thread_local_clients(
+                partial(get_documents_client, config), documents_client
+            ) as get_thread_documents_client:
+                attachment_results = execute_concurrently_unless_results_exist(
+                    attachment_callbacks,
+                    submission,
+                    max_workers=settings.OBJECTS_API_ATTACHMENT_CONCURRENCY,
+                )
+            # TODO turn attachments into dictionary when giving users more options then
+            # just urls.
+            attachments = [
+                result["document"]["url"] for result in attachment_results.values()
+            ]
 
             # Create the CSV submission export, if requested.
             # If no CSV is being uploaded, then `assert csv_url == ""` applies.
@@ -640,6 +640,8 @@ class ObjectsAPIBackendTests(TestCase):
             self.assertEqual(object_create.url, "https://objecten.nl/api/v1/objects")
             self.assertEqual(object_create_body["record"], expected_record_data)
 
+    # the assertions rely on the order in which the attachments are registered
+    @override_settings(OBJECTS_API_ATTACHMENT_CONCURRENCY=1)
     def test_submission_with_objects_api_backend_attachments(self, m):
         # Form.io configuration is irrelevant for this test, but normally you'd have
         # set up some file upload components.
@@ -786,6 +788,8 @@ class ObjectsAPIBackendTests(TestCase):
         with self.assertRaises(NoSubmissionReference):
             extract_submission_reference(submission)
 
+    # the assertions rely on the order in which the attachments are registered
+    @override_settings(OBJECTS_API_ATTACHMENT_CONCURRENCY=1)
     def test_submission_with_objects_api_backend_attachments_specific_iotypen(self, m):
         submission = SubmissionFactory.from_components(
             [
@@ -2,6 +2,7 @@ import logging
 from functools import partial, wraps
 from typing import Any
 
+from django.conf import settings
 from django.urls import reverse
 from django.utils.translation import gettext, gettext_lazy as _
 
@@ -18,7 +19,11 @@ from openforms.contrib.zgw.service import (
     create_report_document,
 )
 from openforms.submissions.mapping import SKIP, FieldConf, apply_data_mapping
-from openforms.submissions.models import Submission, SubmissionReport
+from openforms.submissions.models import (
+    Submission,
+    SubmissionFileAttachment,
+    SubmissionReport,
+)
 from openforms.utils.mixins import JsonSchemaSerializerMixin
 from openforms.utils.validators import validate_rsin
 
@@ -26,7 +31,11 @@ from ...base import BasePlugin
 from ...constants import REGISTRATION_ATTRIBUTE, RegistrationAttribute
 from ...exceptions import RegistrationFailed
 from ...registry import register
-from ...utils import execute_unless_result_exists
+from ...utils import (
+    execute_concurrently_unless_results_exist,
+    execute_unless_result_exists,
+    thread_local_clients,
+)
 from .checks import check_config
 from .client import get_catalogi_client, get_documents_client, get_zaken_client
 from .models import ZGWApiGroupConfig, ZgwConfig
@@ -175,6 +184,10 @@ class ZGWRegistration(BasePlugin):
             zgw = config.default_zgw_api_group
         return zgw
 
+    def get_service_key(self, options: dict) -> str:
+        # the default API group is used when none is configured
+        return str(options.get("zgw_api_group") or "")
+
     @wrap_api_errors
     def pre_register_submission(self, submission: "Submission", options: dict) -> None:
         """
@@ -324,8 +337,28 @@ class ZGWRegistration(BasePlugin):
                 "intermediate.status",
             )
 
-            # TODO: threading? asyncio?
-            for attachment in submission.attachments:
+            def register_attachment(
+                intermediate: dict, attachment: SubmissionFileAttachment, options: dict
+            ) -> None:
+                if not intermediate.get("document"):
+                    intermediate["document"] = create_attachment_document(
+                        client=get_thread_documents_client(),
+                        name=submission.form.admin_name,
+                        submission_attachment=attachment,
+                        options=options,
+                    )
+                if not intermediate.get("relation"):
+                    thread_zaken_client = get_thread_zaken_client()
+                    intermediate["relation"] = thread_zaken_client.relate_document(
+                        zaak=zaak, document=intermediate["document"]
+                    )
+
+            attachment_callbacks = {}
+            # the attachments are registered in worker threads, which may not access
+            # the database - fetch everything they need up front
+            for attachment in submission.attachments.select_related(
+                "submission_step__submission"
+            ):
                 # collect attributes of the attachment and add them to the configuration
                 # attribute names conform to the Documenten API specification
                 iot = attachment.informatieobjecttype or options["informatieobjecttype"]
@@ -352,25 +385,25 @@ class ZGWRegistration(BasePlugin):
                         "doc_vertrouwelijkheidaanduiding"
                     ] = vertrouwelijkheidaanduiding
 
-                attachment_document = execute_unless_result_exists(
-                    partial(
-                        create_attachment_document,
-                        client=documents_client,
-                        name=submission.form.admin_name,
-                        submission_attachment=attachment,
-                        options=doc_options,
-                    ),
-                    submission,
-                    f"intermediate.documents.{attachment.id}.document",
+                attachment_callbacks[
+                    f"intermediate.documents.{attachment.id}"
+                ] = partial(
+                    register_attachment, attachment=attachment, options=doc_options
                 )
-                execute_unless_result_exists(
-                    partial(
-                        zaken_client.relate_document,
-                        zaak=zaak,
-                        document=attachment_document,
-                    ),
+
+            # the clients may not be shared by the threads registering the attachments
+            with (
+                thread_local_clients(
+                    partial(get_documents_client, zgw), documents_client
+                ) as get_thread_documents_client,
+                thread_local_clients(
+                    partial(get_zaken_client, zgw), zaken_client
+                ) as get_thread_zaken_client,
+            ):
+                execute_concurrently_unless_results_exist(
+                    attachment_callbacks,
                     submission,
-                    f"intermediate.documents.{attachment.id}.relation",
+                    max_workers=settings.ZGW_APIS_ATTACHMENT_CONCURRENCY,
                 )
 
             result.update(
@@ -1107,6 +1107,8 @@ class ZGWBackendTests(TestCase):
         self.assertEqual("abcd1234", reference)
 
     @tag("sentry-334882")
+    # the assertions rely on the order in which the attachments are registered
+    @override_settings(ZGW_APIS_ATTACHMENT_CONCURRENCY=1)
     def test_submission_with_zgw_backend_override_fields(self, m):
         """Assert that override of default values for the ZGW backend works"""
         submission = SubmissionFactory.from_components(
@@ -0,0 +1,97 @@
+# Generated by Django 3.2.21 on 2023-09-04 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="RegistrationBackendHealth",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "backend",
+                    models.CharField(
+                        max_length=100, verbose_name="registration backend"
+                    ),
+                ),
+                (
+                    "service",
+                    models.CharField(
+                        blank=True,
+                        help_text="Identifies the service the backend registers with, if the backend supports multiple services.",
+                        max_length=100,
+                        verbose_name="service",
+                    ),
+                ),
+                (
+                    "circuit_state",
+                    models.CharField(
+                        choices=[
+                            ("closed", "Closed"),
+                            ("open", "Open"),
+                            ("half_open", "Half open"),
+                        ],
+                        default="closed",
+                        help_text="Registrations are only attempted while the circuit is closed. An open circuit lets a single registration through (half open) after the 'retry at' moment to probe if the backend has recovered.",
+                        max_length=20,
+                        verbose_name="circuit state",
+                    ),
+                ),
+                (
+                    "retry_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Moment after which a registration is attempted again.",
+                        null=True,
+                        verbose_name="retry at",
+                    ),
+                ),
+                (
+                    "consecutive_failures",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="consecutive failures"
+                    ),
+                ),
+                (
+                    "num_failures",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="number of failures"
+                    ),
+                ),
+                (
+                    "last_failure",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="last failure"
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, verbose_name="last error"),
+                ),
+            ],
+            options={
+                "verbose_name": "registration backend health",
+                "verbose_name_plural": "registration backend health",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="registrationbackendhealth",
+            constraint=models.UniqueConstraint(
+                fields=("backend", "service"), name="unique_backend_service_health"
+            ),
+        ),
+    ]
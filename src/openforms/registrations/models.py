@@ -0,0 +1,60 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .constants import CircuitStates
+
+
+class RegistrationBackendHealth(models.Model):
+    """
+    Track the health of a registration backend (and service) to stop hammering it.
+
+    See :mod:`openforms.registrations.scheduling`.
+    """
+
+    backend = models.CharField(_("registration backend"), max_length=100)
+    service = models.CharField(
+        _("service"),
+        max_length=100,
+        blank=True,
+        help_text=_(
+            "Identifies the service the backend registers with, if the backend "
+            "supports multiple services."
+        ),
+    )
+    circuit_state = models.CharField(
+        _("circuit state"),
+        max_length=20,
+        choices=CircuitStates.choices,
+        default=CircuitStates.closed,
+        help_text=_(
+            "Registrations are only attempted while the circuit is closed. An open "
+            "circuit lets a single registration through (half open) after the "
+            "'retry at' moment to probe if the backend has recovered."
+        ),
+    )
+    retry_at = models.DateTimeField(
+        _("retry at"),
+        null=True,
+        blank=True,
+        help_text=_("Moment after which a registration is attempted again."),
+    )
+    consecutive_failures = models.PositiveIntegerField(
+        _("consecutive failures"), default=0
+    )
+    num_failures = models.PositiveIntegerField(_("number of failures"), default=0)
+    last_failure = models.DateTimeField(_("last failure"), null=True, blank=True)
+    last_error = models.TextField(_("last error"), blank=True)
+
+    class Meta:
+        verbose_name = _("registration backend health")
+        verbose_name_plural = _("registration backend health")
+        constraints = [
+            models.UniqueConstraint(
+                fields=("backend", "service"), name="unique_backend_service_health"
+            ),
+        ]
+
+    def __str__(self):
+        if not self.service:
+            return self.backend
+        return f"{self.backend} ({self.service})"
@@ -0,0 +1,259 @@
+"""
+Protect the registration backends against (retried) registrations while they are down.
+
+When a registration backend is unavailable, every submission registered with it fails
+and is retried by :func:`openforms.submissions.tasks.retry_processing_submissions`.
+To avoid hammering the backend with all of those submissions in lockstep:
+
+* the health of every registration backend (and service) is tracked in
+  :class:`openforms.registrations.models.RegistrationBackendHealth`. Only failures of
+  the backend itself count - transport errors and server errors (HTTP 5xx), not
+  configuration or validation errors. After
+  ``REGISTRATION_CIRCUIT_FAILURE_THRESHOLD`` consecutive failures the circuit opens and
+  no registrations are attempted until ``REGISTRATION_CIRCUIT_RESET_TIMEOUT`` has
+  passed. A single registration then probes the backend (half open) - a success closes
+  the circuit again, a failure keeps it open for another timeout.
+* failed submissions are retried with jittered exponential backoff, based on their
+  number of registration attempts.
+* the retry flow keeps at most ``REGISTRATION_BACKEND_MAX_CONCURRENCY`` registrations
+  per backend (and service) in progress.
+"""
+import logging
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from requests.exceptions import ConnectionError, HTTPError, Timeout
+
+from openforms.submissions.constants import RegistrationStatuses
+from openforms.submissions.models import Submission
+
+from .constants import CircuitStates
+from .models import RegistrationBackendHealth
+
+logger = logging.getLogger(__name__)
+
+BackendKey = tuple[str, str]
+
+
+def get_backend_key(submission: Submission) -> BackendKey | None:
+    """
+    Determine the registration backend and service the submission is registered with.
+    """
+    backend_config = submission.registration_backend
+    if not backend_config or not backend_config.backend:
+        return None
+
+    registry = backend_config._meta.get_field("backend").registry
+    try:
+        plugin = registry[backend_config.backend]
+    except KeyError:
+        return None
+    return (backend_config.backend, plugin.get_service_key(backend_config.options))
+
+
+def get_retry_delay(submission: Submission) -> timedelta:
+    attempts = max(submission.registration_attempts, 1)
+    delay = min(
+        settings.REGISTRATION_RETRY_BACKOFF_BASE * 2 ** (attempts - 1),
+        settings.REGISTRATION_RETRY_BACKOFF_MAX,
+    )
+    # "equal jitter", seeded so that the delay is stable between runs of the retry task
+    jitter = random.Random(f"{submission.pk}-{attempts}").random()
+    return timedelta(seconds=delay / 2 * (1 + jitter))
+
+
+def is_retry_due(submission: Submission, now: datetime) -> bool:
+    if submission.last_register_date is None:
+        return True
+    return now >= submission.last_register_date + get_retry_delay(submission)
+
+
+def is_backend_failure(error: BaseException) -> bool:
+    """
+    Check if the registration failed because the backend is unavailable.
+
+    Plugins typically wrap the errors of their clients in
+    :class:`openforms.registrations.exceptions.RegistrationFailed`, so the chain of
+    causes is inspected.
+    """
+    seen = set()
+    exc: BaseException | None = error
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(exc, (ConnectionError, Timeout)):
+            return True
+        if isinstance(exc, HTTPError) and exc.response is not None:
+            return exc.response.status_code >= 500
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def _get_health(key: BackendKey) -> RegistrationBackendHealth | None:
+    # the row is shared by all registrations with the backend, it's only locked when
+    # it must be updated
+    backend, service = key
+    return RegistrationBackendHealth.objects.filter(
+        backend=backend, service=service
+    ).first()
+
+
+def _get_health_for_update(key: BackendKey) -> RegistrationBackendHealth:
+    backend, service = key
+    health, _ = RegistrationBackendHealth.objects.select_for_update().get_or_create(
+        backend=backend, service=service
+    )
+    return health
+
+
+def allow_registration(key: BackendKey) -> bool:
+    """
+    Check if a registration may be attempted with the backend.
+
+    Once the timeout of an open circuit has passed, the first caller is allowed to probe
+    the backend and the circuit becomes half open.
+    """
+    now = timezone.now()
+    health = _get_health(key)
+    if health is None or health.circuit_state == CircuitStates.closed:
+        return True
+    if health.retry_at and now < health.retry_at:
+        return False
+
+    with transaction.atomic():
+        # check again, another registration may have started probing the backend
+        health = _get_health_for_update(key)
+        if health.circuit_state == CircuitStates.closed:
+            return True
+        if health.retry_at and now < health.retry_at:
+            return False
+
+        health.circuit_state = CircuitStates.half_open
+        # while the probe is in progress no other registrations are let through
+        health.retry_at = now + timedelta(
+            seconds=settings.REGISTRATION_CIRCUIT_RESET_TIMEOUT
+        )
+        health.save(update_fields=["circuit_state", "retry_at"])
+
+    logger.info("Probing registration backend %s with a single registration", health)
+    return True
+
+
+def record_success(key: BackendKey) -> None:
+    health = _get_health(key)
+    if health is None or (
+        health.circuit_state == CircuitStates.closed
+        and health.consecutive_failures == 0
+    ):
+        return
+
+    with transaction.atomic():
+        health = _get_health_for_update(key)
+        was_closed = health.circuit_state == CircuitStates.closed
+        health.circuit_state = CircuitStates.closed
+        health.retry_at = None
+        health.consecutive_failures = 0
+        health.save(update_fields=["circuit_state", "retry_at", "consecutive_failures"])
+
+    if not was_closed:
+        logger.info("Registration backend %s recovered, circuit closed", health)
+
+
+def record_failure(key: BackendKey, error: Exception) -> None:
+    now = timezone.now()
+    threshold = settings.REGISTRATION_CIRCUIT_FAILURE_THRESHOLD
+    with transaction.atomic():
+        health = _get_health_for_update(key)
+        health.consecutive_failures += 1
+        health.num_failures += 1
+        health.last_failure = now
+        health.last_error = str(error)
+
+        opens = threshold > 0 and (
+            health.circuit_state == CircuitStates.half_open
+            or health.consecutive_failures >= threshold
+        )
+        if opens:
+            health.circuit_state = CircuitStates.open
+            health.retry_at = now + timedelta(
+                seconds=settings.REGISTRATION_CIRCUIT_RESET_TIMEOUT
+            )
+        health.save()
+
+    if opens:
+        logger.warning(
+            "Registration backend %s failed %d times in a row, circuit open until %s",
+            health,
+            health.consecutive_failures,
+            health.retry_at,
+        )
+
+
+class RetryScheduler:
+    """
+    Decide which failed submissions to retry in a single run of the retry task.
+    """
+
+    def __init__(self, now: datetime | None = None):
+        self.now = now or timezone.now()
+        self.stats = Counter()
+        self._budgets: dict[BackendKey, int] = {}
+        self._health = {
+            (health.backend, health.service): health
+            for health in RegistrationBackendHealth.objects.all()
+        }
+        self._in_progress = self._count_in_progress()
+
+    def _count_in_progress(self) -> Counter:
+        # registrations running longer than the task time limit have been aborted
+        cutoff = self.now - timedelta(seconds=settings.CELERY_TASK_TIME_LIMIT)
+        submissions = Submission.objects.filter(
+            registration_status=RegistrationStatuses.in_progress,
+            last_register_date__gte=cutoff,
+        ).select_related("form")
+        return Counter(
+            key for submission in submissions if (key := get_backend_key(submission))
+        )
+
+    def _get_budget(self, key: BackendKey) -> int:
+        if key not in self._budgets:
+            health = self._health.get(key)
+            if health is None or health.circuit_state == CircuitStates.closed:
+                budget = (
+                    settings.REGISTRATION_BACKEND_MAX_CONCURRENCY
+                    - self._in_progress[key]
+                )
+            elif health.retry_at and self.now < health.retry_at:
+                budget = 0
+            else:
+                # a single submission probes the backend
+                budget = 1
+            self._budgets[key] = budget
+        return self._budgets[key]
+
+    def should_retry(self, submission: Submission) -> bool:
+        # the registration itself succeeded, a later stage is being retried
+        if submission.registration_status == RegistrationStatuses.success:
+            self.stats["scheduled"] += 1
+            return True
+
+        if not is_retry_due(submission, self.now):
+            self.stats["backoff"] += 1
+            return False
+
+        if (key := get_backend_key(submission)) is not None:
+            if self._get_budget(key) <= 0:
+                health = self._health.get(key)
+                circuit_open = (
+                    health is not None and health.circuit_state != CircuitStates.closed
+                )
+                self.stats["circuit_open" if circuit_open else "capped"] += 1
+                return False
+            self._budgets[key] -= 1
+
+        self.stats["scheduled"] += 1
+        return True
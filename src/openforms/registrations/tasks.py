@@ -15,6 +15,13 @@ from openforms.submissions.public_references import set_submission_reference
 
 from ..config.models import GlobalConfiguration
 from .exceptions import RegistrationFailed
+from .scheduling import (
+    allow_registration,
+    get_backend_key,
+    is_backend_failure,
+    record_failure,
+    record_success,
+)
 from .service import get_registration_plugin
 
 logger = logging.getLogger(__name__)
@@ -122,9 +129,28 @@ def register_submission(submission_id: int) -> None:
         submission.save()
         logevent.registration_attempts_limited(submission)
         return
-    else:
-        submission.registration_attempts += 1
-        submission.save(update_fields=["registration_attempts"])
+
+    # checked after the attempt limit, so that a submission that gives up does not
+    # take the single registration probing a recovering backend
+    backend_key = get_backend_key(submission)
+    if backend_key is not None and not allow_registration(backend_key):
+        # the backend is failing, don't count this as an attempt of the submission
+        logger.info(
+            "Skipping registration for submission '%s', the circuit of backend %r is open",
+            submission,
+            backend_key,
+        )
+        e = RegistrationFailed("Registration backend is unavailable (circuit open)")
+        submission.save_registration_status(
+            RegistrationStatuses.failed, {"traceback": str(e)}
+        )
+        logevent.registration_failure(submission, e)
+        if is_retrying:
+            raise e
+        return
+
+    submission.registration_attempts += 1
+    submission.save(update_fields=["registration_attempts"])
 
     logevent.registration_start(submission)
 
@@ -187,6 +213,8 @@ def register_submission(submission_id: int) -> None:
         )
     # downstream tasks can still execute, so we return rather than failing.
     except RegistrationFailed as e:
+        if backend_key is not None and is_backend_failure(e):
+            record_failure(backend_key, e)
         logger.warning(
             "Registration using plugin '%r' for submission '%s' failed",
             plugin,
@@ -203,6 +231,8 @@ def register_submission(submission_id: int) -> None:
         return
     # unexpected exceptions should fail the entire chain and show up in error monitoring
     except Exception as e:
+        if backend_key is not None and is_backend_failure(e):
+            record_failure(backend_key, e)
         logger.error(
             "Registration using plugin '%r' for submission '%s' unexpectedly errored",
             plugin,
@@ -219,6 +249,8 @@ def register_submission(submission_id: int) -> None:
             raise
         return
     else:
+        if backend_key is not None:
+            record_success(backend_key)
         logger.info(
             "Registration using plugin '%r' for submission '%s' succeeded",
             plugin,
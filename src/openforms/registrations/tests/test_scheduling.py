@@ -0,0 +1,338 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+import requests
+from freezegun import freeze_time
+
+from openforms.config.models import GlobalConfiguration
+from openforms.submissions.constants import RegistrationStatuses
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from ..constants import CircuitStates
+from ..exceptions import RegistrationFailed
+from ..models import RegistrationBackendHealth
+from ..scheduling import (
+    RetryScheduler,
+    allow_registration,
+    get_backend_key,
+    get_retry_delay,
+    is_backend_failure,
+    record_failure,
+    record_success,
+)
+from ..tasks import register_submission
+
+KEY = ("email", "")
+
+
+@override_settings(
+    REGISTRATION_CIRCUIT_FAILURE_THRESHOLD=2,
+    REGISTRATION_CIRCUIT_RESET_TIMEOUT=60,
+)
+class CircuitBreakerTests(TestCase):
+    def test_circuit_opens_after_consecutive_failures(self):
+        with freeze_time("2023-09-01T12:00:00Z"):
+            record_failure(KEY, Exception("down"))
+            self.assertTrue(allow_registration(KEY))
+
+            record_failure(KEY, Exception("still down"))
+            self.assertFalse(allow_registration(KEY))
+
+        health = RegistrationBackendHealth.objects.get(backend="email", service="")
+        self.assertEqual(health.circuit_state, CircuitStates.open)
+        self.assertEqual(health.consecutive_failures, 2)
+        self.assertEqual(health.last_error, "still down")
+
+    def test_success_resets_consecutive_failures(self):
+        record_failure(KEY, Exception("down"))
+        record_success(KEY)
+        record_failure(KEY, Exception("down"))
+
+        self.assertTrue(allow_registration(KEY))
+        health = RegistrationBackendHealth.objects.get()
+        self.assertEqual(health.consecutive_failures, 1)
+        self.assertEqual(health.num_failures, 2)
+
+    def test_healthy_backend_not_locked_or_updated(self):
+        RegistrationBackendHealth.objects.create(backend="email", service="")
+
+        # a single query checking the state, without locking the row
+        with self.assertNumQueries(1):
+            self.assertTrue(allow_registration(KEY))
+        with self.assertNumQueries(1):
+            record_success(KEY)
+
+        with self.subTest("unknown backend"):
+            with self.assertNumQueries(1):
+                self.assertTrue(allow_registration(("demo", "")))
+            with self.assertNumQueries(1):
+                record_success(("demo", ""))
+
+        self.assertFalse(
+            RegistrationBackendHealth.objects.filter(backend="demo").exists()
+        )
+
+    def test_single_probe_after_reset_timeout(self):
+        with freeze_time("2023-09-01T12:00:00Z"):
+            record_failure(KEY, Exception("down"))
+            record_failure(KEY, Exception("down"))
+
+        with freeze_time("2023-09-01T12:01:01Z"):
+            self.assertTrue(allow_registration(KEY))
+            self.assertFalse(allow_registration(KEY))
+            self.assertEqual(
+                RegistrationBackendHealth.objects.get().circuit_state,
+                CircuitStates.half_open,
+            )
+
+            with self.subTest("failed probe opens the circuit again"):
+                record_failure(KEY, Exception("down"))
+
+                self.assertFalse(allow_registration(KEY))
+                self.assertEqual(
+                    RegistrationBackendHealth.objects.get().circuit_state,
+                    CircuitStates.open,
+                )
+
+        with freeze_time("2023-09-01T12:02:02Z"):
+            self.assertTrue(allow_registration(KEY))
+
+            with self.subTest("successful probe closes the circuit"):
+                record_success(KEY)
+
+                self.assertTrue(allow_registration(KEY))
+                self.assertTrue(allow_registration(KEY))
+
+    @override_settings(REGISTRATION_CIRCUIT_FAILURE_THRESHOLD=0)
+    def test_circuit_breaker_disabled(self):
+        for _ in range(3):
+            record_failure(KEY, Exception("down"))
+
+        self.assertTrue(allow_registration(KEY))
+
+    def test_registration_skipped_while_circuit_open(self):
+        submission = SubmissionFactory.create(
+            completed=True,
+            pre_registration_completed=True,
+            form__registration_backend="demo",
+        )
+        self.assertEqual(get_backend_key(submission), ("demo", ""))
+        record_failure(("demo", ""), Exception("down"))
+        record_failure(("demo", ""), Exception("down"))
+
+        with patch(
+            "openforms.registrations.contrib.demo.plugin.DemoRegistration.register_submission"
+        ) as m_register:
+            register_submission(submission.id)
+
+        m_register.assert_not_called()
+        submission.refresh_from_db()
+        self.assertEqual(submission.registration_status, RegistrationStatuses.failed)
+        self.assertEqual(submission.registration_attempts, 0)
+        self.assertTrue(submission.needs_on_completion_retry)
+
+    def test_registration_outcome_recorded(self):
+        submission = SubmissionFactory.create(
+            completed=True,
+            pre_registration_completed=True,
+            form__registration_backend="demo",
+        )
+        error = RegistrationFailed("down")
+        error.__cause__ = requests.ConnectionError("Connection refused")
+
+        with patch(
+            "openforms.registrations.contrib.demo.plugin.DemoRegistration.register_submission",
+            side_effect=error,
+        ):
+            register_submission(submission.id)
+
+        health = RegistrationBackendHealth.objects.get()
+        self.assertEqual(health.consecutive_failures, 1)
+        self.assertEqual(health.last_error, "down")
+
+    def test_registration_errors_not_caused_by_backend_not_recorded(self):
+        submission = SubmissionFactory.create(
+            completed=True,
+            pre_registration_completed=True,
+            form__registration_backend="demo",
+        )
+
+        with patch(
+            "openforms.registrations.contrib.demo.plugin.DemoRegistration.register_submission",
+            side_effect=RegistrationFailed("Invalid configuration"),
+        ):
+            register_submission(submission.id)
+
+        submission.refresh_from_db()
+        self.assertEqual(submission.registration_status, RegistrationStatuses.failed)
+        self.assertFalse(RegistrationBackendHealth.objects.exists())
+
+    def test_attempt_limit_checked_before_probing(self):
+        submission = SubmissionFactory.create(
+            completed=True,
+            pre_registration_completed=True,
+            registration_failed=True,
+            registration_attempts=5,
+            form__registration_backend="demo",
+        )
+        RegistrationBackendHealth.objects.create(
+            backend="demo",
+            service="",
+            circuit_state=CircuitStates.open,
+            retry_at=timezone.now() - timedelta(seconds=1),
+        )
+
+        with patch(
+            "openforms.registrations.tasks.GlobalConfiguration.get_solo",
+            return_value=GlobalConfiguration(registration_attempt_limit=5),
+        ):
+            register_submission(submission.id)
+
+        submission.refresh_from_db()
+        self.assertFalse(submission.needs_on_completion_retry)
+        # the probe is left for a submission that is still registered
+        health = RegistrationBackendHealth.objects.get()
+        self.assertEqual(health.circuit_state, CircuitStates.open)
+        self.assertTrue(allow_registration(("demo", "")))
+
+
+class IsBackendFailureTests(SimpleTestCase):
+    def _http_error(self, status_code: int) -> requests.HTTPError:
+        response = requests.Response()
+        response.status_code = status_code
+        return requests.HTTPError(response=response)
+
+    def test_backend_failures(self):
+        cases = (
+            requests.ConnectionError("Connection refused"),
+            requests.Timeout("Read timed out"),
+            self._http_error(502),
+        )
+        for error in cases:
+            with self.subTest(error=error):
+                wrapped = RegistrationFailed("Registration failed")
+                wrapped.__cause__ = error
+
+                self.assertTrue(is_backend_failure(error))
+                self.assertTrue(is_backend_failure(wrapped))
+
+    def test_other_errors(self):
+        cases = (
+            RegistrationFailed("Invalid configuration"),
+            KeyError("zaaktype"),
+            self._http_error(400),
+        )
+        for error in cases:
+            with self.subTest(error=error):
+                self.assertFalse(is_backend_failure(error))
+
+
+@override_settings(
+    REGISTRATION_RETRY_BACKOFF_BASE=60, REGISTRATION_RETRY_BACKOFF_MAX=60 * 60
+)
+class RetryBackoffTests(TestCase):
+    def test_delay_grows_exponentially_with_jitter(self):
+        submission = SubmissionFactory.build(pk=1)
+
+        for attempts, max_delay in ((1, 60), (2, 120), (3, 240), (10, 60 * 60)):
+            with self.subTest(attempts=attempts):
+                submission.registration_attempts = attempts
+                delay = get_retry_delay(submission)
+
+                self.assertGreaterEqual(delay, timedelta(seconds=max_delay / 2))
+                self.assertLessEqual(delay, timedelta(seconds=max_delay))
+                # stable between runs of the retry task
+                self.assertEqual(get_retry_delay(submission), delay)
+
+    def test_delays_spread_across_submissions(self):
+        delays = {
+            get_retry_delay(SubmissionFactory.build(pk=pk, registration_attempts=3))
+            for pk in range(1, 11)
+        }
+
+        self.assertGreater(len(delays), 1)
+
+
+@override_settings(
+    REGISTRATION_RETRY_BACKOFF_BASE=60,
+    REGISTRATION_BACKEND_MAX_CONCURRENCY=2,
+    REGISTRATION_CIRCUIT_RESET_TIMEOUT=60,
+)
+class RetrySchedulerTests(TestCase):
+    def _create_failed_submission(self, **kwargs):
+        kwargs = {
+            "last_register_date": timezone.now() - timedelta(minutes=5),
+            "form__registration_backend": "email",
+            **kwargs,
+        }
+        return SubmissionFactory.create(
+            registration_failed=True,
+            needs_on_completion_retry=True,
+            registration_attempts=1,
+            **kwargs,
+        )
+
+    def test_submissions_retried_after_backoff(self):
+        due = self._create_failed_submission()
+        not_due = self._create_failed_submission(last_register_date=timezone.now())
+        scheduler = RetryScheduler()
+
+        self.assertTrue(scheduler.should_retry(due))
+        self.assertFalse(scheduler.should_retry(not_due))
+        self.assertEqual(scheduler.stats, {"scheduled": 1, "backoff": 1})
+
+    def test_retries_capped_per_backend(self):
+        SubmissionFactory.create(
+            registration_in_progress=True, form__registration_backend="email"
+        )
+        submissions = [self._create_failed_submission() for _ in range(3)]
+        other_backend = self._create_failed_submission(
+            form__registration_backend="demo"
+        )
+        scheduler = RetryScheduler()
+
+        retried = [scheduler.should_retry(submission) for submission in submissions]
+
+        self.assertEqual(retried, [True, False, False])
+        self.assertTrue(scheduler.should_retry(other_backend))
+        self.assertEqual(scheduler.stats, {"scheduled": 2, "capped": 2})
+
+    def test_open_circuit_lets_single_probe_through(self):
+        submissions = [self._create_failed_submission() for _ in range(2)]
+        RegistrationBackendHealth.objects.create(
+            backend="email",
+            service="",
+            circuit_state=CircuitStates.open,
+            retry_at=timezone.now() + timedelta(minutes=1),
+        )
+
+        with self.subTest("circuit open"):
+            scheduler = RetryScheduler()
+
+            self.assertFalse(scheduler.should_retry(submissions[0]))
+            self.assertEqual(scheduler.stats, {"circuit_open": 1})
+
+        with self.subTest("reset timeout passed"):
+            scheduler = RetryScheduler(now=timezone.now() + timedelta(minutes=2))
+
+            retried = [scheduler.should_retry(submission) for submission in submissions]
+
+            self.assertEqual(retried, [True, False])
+
+    def test_later_stages_retried_regardless_of_backend_health(self):
+        submission = SubmissionFactory.create(
+            registration_success=True,
+            needs_on_completion_retry=True,
+            form__registration_backend="email",
+        )
+        RegistrationBackendHealth.objects.create(
+            backend="email",
+            service="",
+            circuit_state=CircuitStates.open,
+            retry_at=timezone.now() + timedelta(minutes=1),
+        )
+
+        self.assertTrue(RetryScheduler().should_retry(submission))
@@ -0,0 +1,172 @@
+import threading
+from unittest.mock import MagicMock
+
+from django.test import TestCase
+
+from requests import Session
+
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from ..utils import execute_concurrently_unless_results_exist, thread_local_clients
+
+
+class ExecuteConcurrentlyTests(TestCase):
+    def test_results_stored_on_submission(self):
+        submission = SubmissionFactory.create(registration_result=None)
+        thread_names = set()
+
+        def create_document(intermediate, name):
+            thread_names.add(threading.current_thread().name)
+            intermediate["document"] = {"url": f"https://example.com/{name}"}
+
+        results = execute_concurrently_unless_results_exist(
+            {
+                f"intermediate.documents.{name}": lambda intermediate, name=name: (
+                    create_document(intermediate, name)
+                )
+                for name in ("a", "b", "c")
+            },
+            submission,
+            max_workers=2,
+        )
+
+        self.assertEqual(
+            list(results),
+            [
+                "intermediate.documents.a",
+                "intermediate.documents.b",
+                "intermediate.documents.c",
+            ],
+        )
+        self.assertNotIn(threading.current_thread().name, thread_names)
+        submission.refresh_from_db()
+        self.assertEqual(
+            submission.registration_result,
+            {
+                "intermediate": {
+                    "documents": {
+                        "a": {"document": {"url": "https://example.com/a"}},
+                        "b": {"document": {"url": "https://example.com/b"}},
+                        "c": {"document": {"url": "https://example.com/c"}},
+                    }
+                }
+            },
+        )
+
+    def test_partial_results_saved_on_failure_and_reused(self):
+        submission = SubmissionFactory.create(registration_result=None)
+        calls = []
+
+        def register(intermediate, name, fail=False):
+            if not intermediate.get("document"):
+                calls.append(f"document {name}")
+                intermediate["document"] = {"url": f"https://example.com/{name}"}
+            if not intermediate.get("relation"):
+                calls.append(f"relation {name}")
+                if fail:
+                    raise RuntimeError("relating failed")
+                intermediate["relation"] = {"url": f"https://example.com/rel/{name}"}
+
+        for fail in (True, False):
+            callbacks = {
+                "intermediate.documents.a": lambda intermediate: register(
+                    intermediate, "a"
+                ),
+                "intermediate.documents.b": lambda intermediate, fail=fail: register(
+                    intermediate, "b", fail=fail
+                ),
+            }
+            with self.subTest(fail=fail):
+                if fail:
+                    with self.assertRaises(RuntimeError):
+                        execute_concurrently_unless_results_exist(
+                            callbacks, submission, max_workers=2
+                        )
+                else:
+                    execute_concurrently_unless_results_exist(
+                        callbacks, submission, max_workers=2
+                    )
+
+                submission.refresh_from_db()
+                documents = submission.registration_result["intermediate"]["documents"]
+                self.assertEqual(
+                    documents["b"]["document"], {"url": "https://example.com/b"}
+                )
+                self.assertEqual(
+                    "relation" in documents["b"],
+                    not fail,
+                )
+
+        # nothing is created twice
+        self.assertEqual(
+            sorted(calls),
+            ["document a", "document b", "relation a", "relation b", "relation b"],
+        )
+
+    def test_sequential_execution(self):
+        submission = SubmissionFactory.create(registration_result=None)
+        thread_names = set()
+
+        def create_document(intermediate):
+            thread_names.add(threading.current_thread().name)
+            intermediate["document"] = {"url": "https://example.com/a"}
+
+        execute_concurrently_unless_results_exist(
+            {"intermediate.documents.a": create_document},
+            submission,
+            max_workers=1,
+        )
+
+        self.assertEqual(thread_names, {threading.current_thread().name})
+        submission.refresh_from_db()
+        self.assertEqual(
+            submission.registration_result["intermediate"]["documents"]["a"],
+            {"document": {"url": "https://example.com/a"}},
+        )
+
+
+class ThreadLocalClientsTests(TestCase):
+    def test_client_per_thread(self):
+        submission = SubmissionFactory.create(registration_result=None)
+        main_client = Session()
+        self.addCleanup(main_client.close)
+        built_clients = []
+        used_clients = {}
+        barrier = threading.Barrier(2)
+
+        def build_client():
+            client = MagicMock(spec=Session)
+            built_clients.append(client)
+            return client
+
+        def create_document(intermediate, name):
+            # make sure both threads are running at the same time
+            barrier.wait(timeout=5)
+            client = get_client()
+            # the client is reused by the thread
+            self.assertIs(get_client(), client)
+            used_clients[name] = (threading.current_thread().name, client)
+            intermediate["document"] = {"url": f"https://example.com/{name}"}
+
+        with thread_local_clients(build_client, main_client) as get_client:
+            self.assertIs(get_client(), main_client)
+
+            execute_concurrently_unless_results_exist(
+                {
+                    f"intermediate.documents.{name}": lambda intermediate, name=name: (
+                        create_document(intermediate, name)
+                    )
+                    for name in ("a", "b")
+                },
+                submission,
+                max_workers=2,
+            )
+
+        (thread_a, client_a), (thread_b, client_b) = used_clients.values()
+        self.assertNotEqual(thread_a, thread_b)
+        self.assertIsNot(client_a, client_b)
+        self.assertNotIn(main_client, (client_a, client_b))
+        self.assertEqual(len(built_clients), 2)
+        # the clients built for the worker threads are closed
+        for client in built_clients:
+            client.close.assert_called_once_with()
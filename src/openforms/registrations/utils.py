@@ -1,11 +1,19 @@
-from typing import Any, Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Mapping, TypeVar
+
+from django.db import connections
 
 from glom import assign, glom
+from requests import Session
 
 from openforms.submissions.models import Submission
 
 unset = object()
 
+S = TypeVar("S", bound=Session)
+
 
 def execute_unless_result_exists(
     callback: Callable,
@@ -30,3 +38,113 @@ def execute_unless_result_exists(
     assign(submission.registration_result, spec, result, missing=dict)
     submission.save(update_fields=["registration_result"])
     return callback_result
+
+
+def _run_in_thread(callback: Callable[[dict], None], results: dict) -> None:
+    try:
+        callback(results)
+    finally:
+        # connections are per thread and would otherwise be left open by the worker
+        connections.close_all()
+
+
+def execute_concurrently_unless_results_exist(
+    callbacks: Mapping[str, Callable[[dict], None]],
+    submission: Submission,
+    max_workers: int,
+) -> dict[str, dict]:
+    """
+    Execute independent registration steps concurrently, checkpointing their results.
+
+    ``callbacks`` maps the spec of an (intermediate) result to the callback producing
+    it. Each callback receives a copy of the existing result at its spec (an empty dict
+    if there is none yet) and must store everything it creates in it, skipping the keys
+    that are already present - the equivalent of :func:`execute_unless_result_exists`.
+
+    The callbacks are executed in at most ``max_workers`` threads, so they must not
+    access the database. Their results are stored on the submission as they complete
+    and saved in batches of ``max_workers``. When a callback fails, the callbacks that
+    did not start yet are cancelled, the (partial) results of all the others are saved
+    and the first error is re-raised, so that a retry resumes where this attempt
+    stopped.
+    """
+    if submission.registration_result is None:
+        submission.registration_result = {}
+
+    results = {
+        spec: {**(glom(submission.registration_result, spec, default=None) or {})}
+        for spec in callbacks
+    }
+
+    def store(spec: str) -> None:
+        assign(submission.registration_result, spec, results[spec], missing=dict)
+
+    if max_workers <= 1:
+        for spec, callback in callbacks.items():
+            try:
+                callback(results[spec])
+            finally:
+                store(spec)
+                submission.save(update_fields=["registration_result"])
+        return results
+
+    error, unsaved = None, 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_run_in_thread, callback, results[spec]): spec
+            for spec, callback in callbacks.items()
+        }
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            if (exc := future.exception()) is not None and error is None:
+                error = exc
+                for pending in futures:
+                    pending.cancel()
+            store(futures[future])
+            unsaved += 1
+            if unsaved >= max_workers:
+                submission.save(update_fields=["registration_result"])
+                unsaved = 0
+
+    if unsaved:
+        submission.save(update_fields=["registration_result"])
+    if error is not None:
+        raise error
+    return results
+
+
+@contextmanager
+def thread_local_clients(
+    build_client: Callable[[], S], client: S | None = None
+) -> Iterator[Callable[[], S]]:
+    """
+    Provide the API client to use in the calling thread.
+
+    API clients are :class:`requests.Session` instances holding cookies and
+    authentication state, which may not be shared by the worker threads of
+    :func:`execute_concurrently_unless_results_exist`. Instead, every thread builds its
+    own client, using the (thread-safe) shared connection pools of the service.
+
+    :arg build_client: builds a client - it is called in the worker threads, so it must
+      not access the database. Build a client in the calling thread first, so that the
+      service configuration is loaded.
+    :arg client: the client to use in the calling thread.
+
+    The clients built in the worker threads are closed on exit.
+    """
+    local = threading.local()
+    local.client = client
+    clients: list[S] = []
+
+    def get_client() -> S:
+        if (thread_client := getattr(local, "client", None)) is None:
+            thread_client = local.client = build_client()
+            clients.append(thread_client)
+        return thread_client
+
+    try:
+        yield get_client
+    finally:
+        for thread_client in clients:
+            thread_client.close()
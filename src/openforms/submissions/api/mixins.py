@@ -40,6 +40,7 @@ class SubmissionCompletionMixin:
         # all logic has run; we can fix backend
         submission.save()
 
+        logevent.submission_logic_evaluations_flush(submission)
         logevent.form_submit_success(submission)
 
         remove_submission_from_session(submission, self.request.session)
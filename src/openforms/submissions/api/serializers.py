@@ -272,6 +272,27 @@ class FormDataSerializer(serializers.Serializer):
     )
 
 
+class LogicCheckSerializer(FormDataSerializer):
+    delta = serializers.BooleanField(
+        label=_("delta response"),
+        default=False,
+        help_text=_(
+            "Opt in to receive only the changes compared to the state identified by "
+            "`baseVersion`, rather than the full submission and submission step."
+        ),
+    )
+    base_version = serializers.CharField(
+        label=_("base version"),
+        required=False,
+        allow_blank=True,
+        help_text=_(
+            "The `version` of the last logic check response the client applied. Only "
+            "used for delta responses. If the version is unknown, the full "
+            "representation is returned."
+        ),
+    )
+
+
 class SubmissionSuspensionSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(
         required=True,
@@ -344,6 +365,79 @@ class SubmissionStateLogicSerializer(serializers.Serializer):
     step = SubmissionStepSerializer()
 
 
+class StepStateSerializer(serializers.Serializer):
+    is_applicable = serializers.BooleanField(label=_("is applicable"), read_only=True)
+    completed = serializers.BooleanField(label=_("completed"), read_only=True)
+    can_submit = serializers.BooleanField(label=_("can submit"), read_only=True)
+
+
+class NestedStepStateSerializer(StepStateSerializer):
+    id = serializers.UUIDField(label=_("form step ID"), read_only=True)
+
+
+class SubmissionStateLogicChangesSerializer(serializers.Serializer):
+    submission = serializers.JSONField(
+        label=_("submission changes"),
+        read_only=True,
+        help_text=_(
+            "The submission properties that changed, e.g. `submissionAllowed` or "
+            "`payment`. The `steps` are reported separately."
+        ),
+    )
+    steps = NestedStepStateSerializer(
+        label=_("changed submission steps"),
+        many=True,
+        read_only=True,
+        help_text=_("The submission steps of which the state changed."),
+    )
+    step = StepStateSerializer(
+        label=_("step state"),
+        read_only=True,
+        help_text=_("The state of the submission step."),
+    )
+    configuration = serializers.JSONField(
+        label=_("component changes"),
+        read_only=True,
+        help_text=_(
+            "The changed properties of the Formio components, keyed by component key."
+        ),
+    )
+    data = serializers.JSONField(
+        label=_("data changes"),
+        read_only=True,
+        help_text=_("The step data values that changed (e.g. set by logic)."),
+    )
+
+
+class SubmissionStateLogicDeltaSerializer(serializers.Serializer):
+    version = serializers.CharField(
+        label=_("version"),
+        read_only=True,
+        help_text=_(
+            "Identifies the state of this response. Pass it as `baseVersion` in the "
+            "next logic check to receive the changes relative to this state."
+        ),
+    )
+    changes = SubmissionStateLogicChangesSerializer(
+        label=_("changes"),
+        read_only=True,
+        allow_null=True,
+        help_text=_(
+            "The changes compared to the base version, or `null` if the full "
+            "representation is returned."
+        ),
+    )
+    full = SubmissionStateLogicSerializer(
+        label=_("full representation"),
+        read_only=True,
+        allow_null=True,
+        help_text=_(
+            "The full submission and submission step, returned when the base version "
+            "is unknown or the changes cannot be expressed as a delta."
+        ),
+    )
+
+
 @dataclass
 class SubmissionStateLogic:
     submission: Submission
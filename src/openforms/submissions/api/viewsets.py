@@ -3,12 +3,18 @@ import logging
 from typing import Tuple
 from uuid import UUID
 
+from django.conf import settings
 from django.db import transaction
 from django.db.models import Exists, OuterRef
 from django.utils.translation import gettext_lazy as _
 
 from drf_spectacular.types import OpenApiTypes
-from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    PolymorphicProxySerializer,
+    extend_schema,
+    extend_schema_view,
+)
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound, PermissionDenied
@@ -25,12 +31,17 @@ from openforms.authentication.service import is_authenticated_with_plugin
 from openforms.formio.service import FormioData
 from openforms.forms.models import FormStep
 from openforms.logging import logevent
-from openforms.prefill import prefill_variables
+from openforms.prefill import (
+    prefill_variables,
+    schedule_prefill_variables,
+    wait_for_prefill,
+)
 from openforms.utils.patches.rest_framework_nested.viewsets import NestedViewSetMixin
 
 from ..attachments import attach_uploads_to_submission_step
 from ..exceptions import FormDeactivated, FormMaintenance
 from ..form_logic import check_submission_logic, evaluate_form_logic
+from ..logic.delta import get_delta
 from ..models import Submission, SubmissionStep
 from ..models.submission_step import DirtyData
 from ..parsers import (
@@ -55,13 +66,14 @@ from .permissions import (
 )
 from .serializers import (
     CosignValidationSerializer,
-    FormDataSerializer,
+    LogicCheckSerializer,
     SubmissionCompletionSerializer,
     SubmissionCoSignStatusSerializer,
     SubmissionProcessingStatusSerializer,
     SubmissionReportUrlSerializer,
     SubmissionSerializer,
     SubmissionStateLogic,
+    SubmissionStateLogicDeltaSerializer,
     SubmissionStateLogicSerializer,
     SubmissionStepSerializer,
     SubmissionStepSummarySerialzier,
@@ -88,6 +100,14 @@ def cleanup_deactivated_form_session(request: Request, submission: Submission):
         raise
 
 
+def _get_wait_time(request: Request) -> int:
+    try:
+        wait = int(request.query_params.get("wait", 0))
+    except ValueError:
+        return 0
+    return max(0, min(wait, settings.SUBMISSION_STATUS_MAX_WAIT))
+
+
 @extend_schema_view(
     list=extend_schema(
         summary=_("List active submissions"),
@@ -176,7 +196,10 @@ class SubmissionViewSet(
 
         logevent.submission_start(serializer.instance)
 
-        prefill_variables(serializer.instance)
+        if settings.PREFILL_ASYNC:
+            schedule_prefill_variables(serializer.instance)
+        else:
+            prefill_variables(serializer.instance)
         initialise_user_defined_variables(serializer.instance)
 
     @extend_schema(
@@ -330,6 +353,16 @@ class SubmissionViewSet(
                 description=_("Time-based authentication token"),
                 required=True,
             ),
+            OpenApiParameter(
+                "wait",
+                OpenApiTypes.INT,
+                OpenApiParameter.QUERY,
+                description=_(
+                    "Number of seconds to wait for the processing to be done before "
+                    "responding. The wait time is limited by the server."
+                ),
+                required=False,
+            ),
         ],
     )
     @action(
@@ -344,10 +377,15 @@ class SubmissionViewSet(
         Obtain the current submission processing status, after completing it.
 
         The submission is processed asynchronously. Poll this endpoint to receive
-        information on the status of this async processing.
+        information on the status of this async processing. Pass the `wait` query
+        parameter to have the server respond as soon as the processing is done (or the
+        wait time expires), rather than immediately - this reduces the number of
+        requests needed.
         """
         submission = self.get_object()
         status = SubmissionProcessingStatus(request, submission)
+        if wait := _get_wait_time(request):
+            status.wait(wait)
         status.ensure_failure_can_be_managed()
         serializer = SubmissionProcessingStatusSerializer(
             instance=status,
@@ -477,6 +515,9 @@ class SubmissionStepViewSet(
             )
         )
         submission = get_object_or_404(submission_qs, uuid=submission_uuid)
+        # the prefilled values are needed for the step (default values, logic)
+        if settings.PREFILL_ASYNC:
+            wait_for_prefill(submission)
         # leverage the execution state which paints a complete picture of the (submitted)
         # steps, including instances that haven't been saved to the DB yet. This is used
         # throughout the different endpoints, so the benefit is that we save a lot of
@@ -527,6 +568,7 @@ class SubmissionStepViewSet(
         serializer.save()
 
         logevent.submission_step_fill(instance)
+        logevent.submission_logic_evaluations_flush(instance.submission)
         attach_uploads_to_submission_step(instance)
 
         # See #1480 - if there is navigation between steps and original form field values
@@ -594,10 +636,24 @@ class SubmissionStepViewSet(
 
     @extend_schema(
         summary=_("Apply/check form logic"),
-        description=_("Apply/check the logic rules specified on the form step."),
-        request=FormDataSerializer,
+        description=_(
+            "Apply/check the logic rules specified on the form step.\n\n"
+            "By default the full submission and submission step are returned. Clients "
+            "can opt in to delta responses with `delta: true`: the response then "
+            "contains a `version` of the resulting state and, if the `baseVersion` "
+            "passed by the client is known, only the `changes` compared to that state. "
+            "Otherwise the `full` representation is returned."
+        ),
+        request=LogicCheckSerializer,
         responses={
-            200: SubmissionStateLogicSerializer,
+            200: PolymorphicProxySerializer(
+                component_name="SubmissionStateLogicResponse",
+                serializers=[
+                    SubmissionStateLogicSerializer,
+                    SubmissionStateLogicDeltaSerializer,
+                ],
+                resource_type_field_name=None,
+            ),
             403: ExceptionSerializer,
             FormDeactivated.status_code: ExceptionSerializer,
             FormMaintenance.status_code: ExceptionSerializer,
@@ -613,10 +669,10 @@ class SubmissionStepViewSet(
         submission_step = self.get_object()
         submission = submission_step.submission
 
-        form_data_serializer = FormDataSerializer(data=request.data)
-        form_data_serializer.is_valid(raise_exception=True)
+        logic_check_serializer = LogicCheckSerializer(data=request.data)
+        logic_check_serializer.is_valid(raise_exception=True)
 
-        data = form_data_serializer.validated_data["data"]
+        data = logic_check_serializer.validated_data.get("data")
         if data:
             merged_data = FormioData({**submission.data, **data})
             submission_step.data = DirtyData(data)
@@ -634,4 +690,12 @@ class SubmissionStepViewSet(
             instance=SubmissionStateLogic(submission=submission, step=submission_step),
             context={"request": request, "unsaved_data": data},
         )
-        return Response(submission_state_logic_serializer.data)
+        if not logic_check_serializer.validated_data["delta"]:
+            return Response(submission_state_logic_serializer.data)
+
+        delta = get_delta(
+            submission_step,
+            submission_state_logic_serializer.data,
+            base_version=logic_check_serializer.validated_data.get("base_version", ""),
+        )
+        return Response(delta, headers={"ETag": f'"{delta["version"]}"'})
@@ -9,9 +9,9 @@ from typing import Iterable, Iterator, Optional, Tuple
 from urllib.parse import urlparse
 
 from django.conf import settings
+from django.core.files import File
 from django.core.files.temp import NamedTemporaryFile
 from django.core.files.uploadedfile import UploadedFile
-from django.db import transaction
 from django.urls import Resolver404, resolve
 from django.utils.translation import gettext as _
 
@@ -174,9 +174,6 @@ def validate_uploads(submission_step: SubmissionStep, data: Optional[dict]) -> N
 
 
 def attach_uploads_to_submission_step(submission_step: SubmissionStep) -> list:
-    # circular import
-    from .tasks import resize_submission_attachment
-
     result = list()
 
     variable_state = submission_step.submission.load_submission_value_variables_state()
@@ -205,14 +202,6 @@ def attach_uploads_to_submission_step(submission_step: SubmissionStep) -> list:
         # TODO decide what it means if this fails
         assert submission_variable is not None
 
-        # grab resize settings
-        resize_apply = glom(component, "of.image.resize.apply", default=False)
-        resize_size = (
-            glom(component, "of.image.resize.width", default=DEFAULT_IMAGE_MAX_SIZE[0]),
-            glom(
-                component, "of.image.resize.height", default=DEFAULT_IMAGE_MAX_SIZE[1]
-            ),
-        )
         file_max_size = file_size_cast(
             glom(component, "fileMaxSize", default="") or settings.MAX_FILE_UPLOAD_SIZE
         )
@@ -253,13 +242,8 @@ def attach_uploads_to_submission_step(submission_step: SubmissionStep) -> list:
         )
         result.append((attachment, created))
 
-        if created and resize_apply and resize_size:
-            # NOTE there is a possible race-condition if user completes a submission before this resize task is done
-            # see https://github.com/open-formulieren/open-forms/issues/507
-            transaction.on_commit(
-                lambda: resize_submission_attachment.delay(attachment.id, resize_size)
-            )
-
+    # resizing the images happens in the submission completion workflow, see
+    # :func:`resize_submission_attachments`
     return result
 
 
@@ -336,6 +320,22 @@ def resolve_uploads_from_data(configuration: JSONObject, data: dict) -> dict:
     return result
 
 
+def get_image_resize_size(
+    attachment: SubmissionFileAttachment,
+) -> Optional[Tuple[int, int]]:
+    """
+    Get the maximum image size from the component configuration, if resizing applies.
+    """
+    wrapper = attachment.submission_step.form_step.form_definition.configuration_wrapper
+    component = wrapper.flattened_by_path.get(attachment._component_configuration_path)
+    if not component or not glom(component, "of.image.resize.apply", default=False):
+        return None
+    return (
+        glom(component, "of.image.resize.width", default=DEFAULT_IMAGE_MAX_SIZE[0]),
+        glom(component, "of.image.resize.height", default=DEFAULT_IMAGE_MAX_SIZE[1]),
+    )
+
+
 def resize_attachment(
     attachment: SubmissionFileAttachment, size: Tuple[int, int]
 ) -> bool:
@@ -343,31 +343,93 @@ def resize_attachment(
     'safe' resize an attached image that might not be an image or not need resize at all
     """
     try:
-        # this might not actually be an image file; let's open it and see
-        image = Image.open(
-            attachment.content,
-            formats=(
-                "png",
-                "jpeg",
-            ),
-        )
-    except PIL.UnidentifiedImageError:
-        # oops
-        return False
-    except OSError:
-        # more specific
-        return False
-    except ValueError:
-        # more specific
+        return _resize_image(attachment, size)
+    except (OSError, ValueError):
         return False
-    else:
-        # check if we have work
-        if image.width <= size[0] and image.height <= size[1]:
+
+
+def _resize_image(attachment: SubmissionFileAttachment, size: Tuple[int, int]) -> bool:
+    """
+    Resize the attached image, if it is an image larger than the size.
+
+    Errors reading, decoding or storing the image are raised.
+    """
+    # (re)open the content explicitly, it may have been closed by an earlier read
+    with attachment.content.open("rb") as content:
+        try:
+            # this might not actually be an image file; let's open it and see
+            image = Image.open(
+                content,
+                formats=(
+                    "png",
+                    "jpeg",
+                ),
+            )
+        except PIL.UnidentifiedImageError:
+            # oops
             return False
 
-        # TODO SpooledTemporaryFile but what limit?
-        with NamedTemporaryFile() as tmp:
-            image.thumbnail(size)
-            image.save(tmp, image.format)
-            attachment.content.save(attachment.content.name, tmp, save=True)
-            return True
+        with image:
+            # check if we have work
+            if image.width <= size[0] and image.height <= size[1]:
+                return False
+
+            image_format = image.format
+            # JPEG images can be decoded at a reduced scale (still larger than the
+            # target size), which takes a fraction of the memory and time of a full
+            # decode
+            image.draft(None, size)
+            decoded_size = image.width * image.height * len(image.getbands())
+            if decoded_size > settings.ATTACHMENT_RESIZE_MAX_MEMORY:
+                logger.warning(
+                    "Not resizing attachment %s, decoding it requires %d bytes of "
+                    "memory",
+                    attachment.uuid,
+                    decoded_size,
+                )
+                return False
+
+            with NamedTemporaryFile() as tmp:
+                image.thumbnail(size)
+                image.save(tmp, image_format)
+                attachment.content.save(attachment.content.name, tmp, save=True)
+                return True
+
+
+def resize_submission_attachments(submission: Submission) -> None:
+    """
+    Resize the image attachments of the submission, as configured on their components.
+
+    Attachments with the same content and target size (e.g. the same file uploaded in
+    multiple fields) are only resized once.
+    """
+    attachments = SubmissionFileAttachment.objects.filter(
+        submission_step__submission=submission
+    ).select_related("submission_step__form_step__form_definition")
+
+    processed: dict[tuple[str, Tuple[int, int]], SubmissionFileAttachment | None] = {}
+    for attachment in attachments:
+        if not (size := get_image_resize_size(attachment)):
+            continue
+
+        try:
+            key = (attachment.content_hash, size)
+        except OSError:
+            logger.warning("Could not read attachment %s", attachment.uuid)
+            continue
+
+        # resizing is best-effort - a corrupt or unreadable upload may not block the
+        # registration of the submission
+        try:
+            if key not in processed:
+                # mark as not resized until it succeeded
+                processed[key] = None
+                if _resize_image(attachment, size):
+                    processed[key] = attachment
+            elif (resized_attachment := processed[key]) is not None:
+                with resized_attachment.content.open("rb") as content:
+                    attachment.content.save(
+                        attachment.content.name, File(content), save=True
+                    )
+        except Exception:
+            logger.exception("Could not resize attachment %s", attachment.uuid)
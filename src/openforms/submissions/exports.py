@@ -1,19 +1,32 @@
+import csv
 import dataclasses
-from typing import Iterator
+import json
+import tempfile
+from typing import IO, Any, AnyStr, Callable, Dict, Iterable, Iterator, List
 
-from django.http import HttpResponse
+from django.db.models import Prefetch
+from django.http import FileResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
 from django.utils.timezone import make_naive
 
 import tablib
 from lxml import etree
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 from tablib.formats._json import serialize_objects_handler
 
+from openforms.forms.models import Form, FormStep
+
 from .models import Submission
 from .query import SubmissionQuerySet
 from .rendering.base import Node
 from .rendering.constants import RenderModes
 from .rendering.renderer import Renderer
 
+# number of submissions for which the related data is fetched in bulk
+EXPORT_CHUNK_SIZE = 500
+
 
 @dataclasses.dataclass
 class FileType:
@@ -39,56 +52,232 @@ def iter_submission_data_nodes(submission: Submission) -> Iterator[Node]:
             yield node
 
 
+@dataclasses.dataclass
+class ExportColumnPlan:
+    """
+    The columns of a submission export, determined once for all submissions of a form.
+    """
+
+    headers: List[str]
+    include_language_code: bool
+
+    @classmethod
+    def from_submission(cls, submission: Submission) -> "ExportColumnPlan":
+        include_language_code = submission.form.translation_enabled
+        headers = ["Formuliernaam", "Inzendingdatum"]
+        if include_language_code:
+            headers.append("Taalcode")
+
+        for data_node in iter_submission_data_nodes(submission):
+            if hasattr(data_node, "component"):
+                headers.append(data_node.component["key"])
+            elif hasattr(data_node, "variable"):
+                headers.append(data_node.variable.key)
+        return cls(headers=headers, include_language_code=include_language_code)
+
+    def get_row(self, submission: Submission) -> List[Any]:
+        inzending_datum = (
+            make_naive(submission.completed_on) if submission.completed_on else None
+        )
+        row = [submission.form.admin_name, inzending_datum]
+        if self.include_language_code:
+            row.append(submission.language_code)
+        row += [data_node.value for data_node in iter_submission_data_nodes(submission)]
+        return row
+
+
+def iter_submissions_for_export(
+    queryset: SubmissionQuerySet, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[Submission]:
+    """
+    Iterate over the submissions (of a single form) in chunks.
+
+    The steps and variables of the submissions in a chunk are fetched in bulk, and
+    the form, its steps and variables are fetched only once and shared by all
+    submissions, avoiding the N+1 queries of loading the execution and variables
+    state for every submission. The order of the queryset is preserved.
+    """
+    pks = list(queryset.values_list("pk", flat=True))
+    if not pks:
+        return
+
+    form_id = (
+        Submission.objects.filter(pk=pks[0]).values_list("form_id", flat=True).get()
+    )
+    form = Form.objects.prefetch_related(
+        Prefetch(
+            "formstep_set",
+            queryset=FormStep.objects.select_related("form_definition").order_by(
+                "order"
+            ),
+        ),
+        "formvariable_set",
+    ).get(pk=form_id)
+    # rendering mutates the (shared) form definitions, see
+    # :meth:`openforms.submissions.rendering.renderer.Renderer.get_children`
+    form_definitions = [
+        form_step.form_definition for form_step in form.formstep_set.all()
+    ]
+    configurations = [
+        form_definition.configuration for form_definition in form_definitions
+    ]
+
+    for offset in range(0, len(pks), chunk_size):
+        chunk_pks = pks[offset : offset + chunk_size]
+        submissions = Submission.objects.filter(pk__in=chunk_pks).prefetch_related(
+            "submissionstep_set", "submissionvaluevariable_set"
+        )
+        submissions_by_pk = {submission.pk: submission for submission in submissions}
+        for pk in chunk_pks:
+            # the submission may have been deleted in the meantime
+            if (submission := submissions_by_pk.get(pk)) is None:
+                continue
+            submission.form = form
+            yield submission
+
+            for form_definition, configuration in zip(form_definitions, configurations):
+                form_definition.configuration = configuration
+
+
+def iter_export_rows(queryset: SubmissionQuerySet) -> Iterator[List[Any]]:
+    """
+    Produce the header row followed by a row for every submission.
+
+    .. note:: the queryset of submissions must all be of the same form!
+    """
+    plan = None
+    for submission in iter_submissions_for_export(queryset):
+        if plan is None:
+            plan = ExportColumnPlan.from_submission(submission)
+            yield plan.headers
+        yield plan.get_row(submission)
+
+
 def create_submission_export(queryset: SubmissionQuerySet) -> tablib.Dataset:
     """
     Turn a submissions queryset into a tablib dataset for export.
 
     .. note:: the queryset of submissions must all be of the same form!
+
+    The entire dataset is kept in memory - use :func:`export_submissions` for large
+    querysets.
     """
+    rows = iter_export_rows(queryset)
     # queryset *could* be empty
-    if not queryset:
+    if (headers := next(rows, None)) is None:
         return tablib.Dataset()
 
-    first_submission = queryset[0]
-    headers = ["Formuliernaam", "Inzendingdatum"]
-    if first_submission.form.translation_enabled:
-        headers.append("Taalcode")
+    data = tablib.Dataset(headers=headers)
+    for row in rows:
+        data.append(row)
+    return data
+
 
-    for data_node in iter_submission_data_nodes(first_submission):
-        if hasattr(data_node, "component"):
-            headers.append(data_node.component["key"])
-        elif hasattr(data_node, "variable"):
-            headers.append(data_node.variable.key)
+class _Echo:
+    """
+    File-like object that returns the written value, for use with :mod:`csv`.
+    """
 
-    data = tablib.Dataset(headers=headers)
+    def write(self, value: str) -> str:
+        return value
 
-    for submission in queryset:
-        inzending_datum = (
-            make_naive(submission.completed_on) if submission.completed_on else None
+
+def iter_csv(rows: Iterable[List[Any]]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def iter_json(rows: Iterable[List[Any]]) -> Iterator[str]:
+    rows = iter(rows)
+    if (headers := next(rows, None)) is None:
+        yield "[]"
+        return
+
+    yield "["
+    for index, row in enumerate(rows):
+        prefix = ", " if index else ""
+        yield prefix + json.dumps(
+            dict(zip(headers, row)),
+            default=serialize_objects_handler,
+            ensure_ascii=False,
         )
-        submission_data = [
-            submission.form.admin_name,
-            inzending_datum,
-        ]
-        if first_submission.form.translation_enabled:
-            submission_data.append(submission.language_code)
-        submission_data += [
-            data_node.value for data_node in iter_submission_data_nodes(submission)
-        ]
-        data.append(submission_data)
-    return data
+    yield "]"
+
+
+def iter_xml(rows: Iterable[List[Any]]) -> Iterator[bytes]:
+    rows = iter(rows)
+    headers = next(rows, None) or []
+
+    yield b"<?xml version='1.0' encoding='utf8'?>\n<submissions>\n"
+    for row in rows:
+        element = _xml_submission_element(dict(zip(headers, row)))
+        yield etree.tostring(
+            element, encoding="utf8", xml_declaration=False, pretty_print=True
+        )
+    yield b"</submissions>\n"
+
+
+def write_xlsx(rows: Iterable[List[Any]], outfile: IO[bytes]) -> None:
+    """
+    Write the rows to an Excel file, using the constant-memory write-only mode.
+    """
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title="Tablib Dataset")
+    worksheet.freeze_panes = "A2"
+
+    bold = Font(bold=True)
+    for index, row in enumerate(rows):
+        cells = []
+        for value in row:
+            # empty cells are not written in write-only mode, which makes rows with
+            # trailing empty values shorter than the headers
+            if value is None:
+                value = ""
+            try:
+                cell = WriteOnlyCell(worksheet, value=value)
+            except (ValueError, TypeError):
+                cell = WriteOnlyCell(worksheet, value=str(value))
+            if index == 0:
+                cell.font = bold
+            cells.append(cell)
+        worksheet.append(cells)
+
+    workbook.save(outfile)
+
+
+def write_submissions_export(
+    queryset: SubmissionQuerySet, file_type: FileType, outfile: IO[bytes]
+) -> None:
+    """
+    Write the export of the submissions incrementally to a (binary) file.
+    """
+    rows = iter_export_rows(queryset)
+    if file_type is ExportFileTypes.XLSX:
+        write_xlsx(rows, outfile)
+        return
+
+    for chunk in STREAMING_WRITERS[file_type.extension](rows):
+        outfile.write(chunk.encode("utf8") if isinstance(chunk, str) else chunk)
 
 
 def export_submissions(
     queryset: SubmissionQuerySet, file_type: FileType
-) -> HttpResponse:
-    export_data = create_submission_export(queryset)
+) -> HttpResponseBase:
     filename = f"submissions_export.{file_type.extension}"
 
-    response = HttpResponse(
-        export_data.export(file_type.extension),
-        content_type=file_type.content_type,
-    )
+    if file_type is ExportFileTypes.XLSX:
+        # the xlsx (zip) format can't be streamed - write it to a temporary file
+        outfile = tempfile.TemporaryFile()
+        write_submissions_export(queryset, file_type, outfile)
+        outfile.seek(0)
+        response = FileResponse(outfile, content_type=file_type.content_type)
+    else:
+        rows = iter_export_rows(queryset)
+        response = StreamingHttpResponse(
+            STREAMING_WRITERS[file_type.extension](rows),
+            content_type=file_type.content_type,
+        )
     response["Content-Disposition"] = f'attachment; filename="{filename}"'
 
     return response
@@ -116,6 +305,14 @@ def _xml_value(parent, value, wrap_single=False):
         node.text = _xml_basic_value(value)
 
 
+def _xml_submission_element(row: Dict[str, Any]) -> etree._Element:
+    element = etree.Element("submission")
+    for key, value in row.items():
+        field = etree.SubElement(element, "field", name=key)
+        _xml_value(field, value, wrap_single=True)
+    return element
+
+
 class XMLKeyValueExport:
     title = "xml"
 
@@ -141,11 +338,15 @@ class XMLKeyValueExport:
     def export_set(cls, dset):
         root = etree.Element("submissions")
         for row in dset.dict:
-            elem = etree.SubElement(root, "submission")
-            for key, value in row.items():
-                field = etree.SubElement(elem, "field", name=key)
-                _xml_value(field, value, wrap_single=True)
+            root.append(_xml_submission_element(row))
 
         return etree.tostring(
             root, xml_declaration=True, encoding="utf8", pretty_print=True
         )
+
+
+STREAMING_WRITERS: Dict[str, Callable[[Iterable[List[Any]]], Iterator[AnyStr]]] = {
+    ExportFileTypes.CSV.extension: iter_csv,
+    ExportFileTypes.JSON.extension: iter_json,
+    ExportFileTypes.XML.extension: iter_xml,
+}
@@ -7,6 +7,7 @@ import elasticapm
 from openforms.formio.service import (
     FormioData,
     get_dynamic_configuration,
+    get_injection_plan,
     inject_variables,
     translate_function,
 )
@@ -68,8 +69,11 @@ def evaluate_form_logic(
        3. Handle custom formio types (which require variables as input!)
 
     """
-    # grab the configuration that will be mutated
-    config_wrapper = step.form_step.form_definition.configuration_wrapper
+    # grab the configuration that will be mutated - the mutations are recorded in a
+    # copy-on-write overlay so that the form definition configuration is not modified
+    config_wrapper = (
+        step.form_step.form_definition.configuration_wrapper.copy_on_write()
+    )
     # 1. we have `submission` and `step` available and ...
     # 2. the prefilled variables are already recorded in the variables state
     #
@@ -82,7 +86,15 @@ def evaluate_form_logic(
     # ensure this function is idempotent
     _evaluated = getattr(step, "_form_logic_evaluated", False)
     if _evaluated:
-        return config_wrapper.configuration
+        return step._form_logic_configuration
+
+    # look up which template properties need processing before the configuration is
+    # mutated
+    translation_enabled = bool(submission.form.translation_enabled and step.form_step)
+    injection_plan = get_injection_plan(
+        step.form_step.form_definition,
+        submission.language_code if translation_enabled else "",
+    )
 
     # 3. Load the (variables) state
     submission_variables_state = submission.load_submission_value_variables_state()
@@ -171,10 +183,12 @@ def evaluate_form_logic(
     translate = (
         # We need to interpolate the translated string
         translate_function(submission, step)
-        if (submission.form.translation_enabled and step.form_step)
+        if translation_enabled
         else str  # a noop when translation is not enabled
     )
-    inject_variables(config_wrapper, data_container.data, translate)
+    inject_variables(
+        config_wrapper, data_container.data, translate, plan=injection_plan
+    )
 
     # 7.3 Handle custom formio types - TODO: this needs to be lifted out of
     # :func:`get_dynamic_configuration` so that it can use variables.
@@ -206,6 +220,7 @@ def evaluate_form_logic(
         step.data = DirtyData(data_diff.data)
 
     step._form_logic_evaluated = True
+    step._form_logic_configuration = config_wrapper.configuration
 
     return config_wrapper.configuration
 
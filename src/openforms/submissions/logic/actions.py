@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from typing import Any, Callable, Dict, Mapping, Optional, Type, TypedDict
 
 from json_logic import jsonLogic
@@ -8,6 +8,7 @@ from openforms.forms.constants import LogicActionTypes
 from openforms.forms.models import FormLogic, FormVariable
 from openforms.typing import DataMapping, JSONObject, JSONValue
 from openforms.utils.json_logic import ComponentMeta
+from openforms.utils.json_logic.compilation import CompiledExpression
 from openforms.variables.models import ServiceFetchConfiguration
 
 from ..models import Submission, SubmissionStep
@@ -195,6 +196,10 @@ class StepNotApplicableAction(ActionOperation):
 class VariableAction(ActionOperation):
     variable: str
     value: JSONObject
+    # set when the value expression was compiled ahead of time
+    compiled_value: CompiledExpression | None = field(
+        default=None, repr=False, compare=False
+    )
 
     @classmethod
     def from_action(cls, action: ActionDict) -> "VariableAction":
@@ -207,7 +212,12 @@ class VariableAction(ActionOperation):
         submission: Submission,
     ) -> DataMapping:
         with log_errors(self.value, self.rule):
-            log({"value": (value := jsonLogic(self.value, context))})
+            value = (
+                self.compiled_value(context)
+                if self.compiled_value is not None
+                else jsonLogic(self.value, context)
+            )
+            log({"value": value})
             return {self.variable: value}
 
     def get_action_log_data(
@@ -0,0 +1,240 @@
+"""
+Compiled form logic and dependency-driven re-evaluation.
+
+The logic rules of a form are compiled once (per version of the rules) into Python
+callables, see :mod:`openforms.utils.json_logic.compilation`. While compiling, the
+inputs (variables read) and outputs (variables written) of every rule are determined,
+which gives us a variable -> rule dependency index.
+
+The outcome of a logic evaluation is remembered per submission in an
+:class:`EvaluationMemo`. On the next evaluation (typically a logic check with some
+dirty data), only the rules that read from variables that have changed since the
+previous evaluation are evaluated again. If the outcome of such a rule differs from
+the previous time, the variables it writes are marked as changed too, which causes the
+rules depending on those to be re-evaluated as well. All other rules replay their
+remembered outcome.
+
+Rules whose inputs cannot be determined statically, or which have side effects or
+non-deterministic outcomes (like service fetches or ``today``), are always evaluated.
+"""
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Mapping, Sequence
+
+from django.core.cache import cache
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.models import FormLogic
+from openforms.typing import DataMapping, JSONValue
+from openforms.utils.cache import LRUCache
+from openforms.utils.json_logic import introspect_json_logic
+from openforms.utils.json_logic.compilation import (
+    CompiledExpression,
+    compile_expression,
+)
+
+from ..models import Submission
+from .actions import ActionOperation, VariableAction
+
+# upper limit of the number of compiled rule sets kept in memory per process
+COMPILED_LOGIC_CACHE_SIZE = 256
+EVALUATION_MEMO_TIMEOUT = 60 * 30  # 30 minutes
+
+NON_DETERMINISTIC_OPERATORS = frozenset({"today"})
+# action types that only depend on the rule inputs and don't have external side effects
+MEMOIZABLE_ACTION_TYPES = frozenset(
+    {
+        LogicActionTypes.property,
+        LogicActionTypes.disable_next,
+        LogicActionTypes.step_not_applicable,
+        LogicActionTypes.variable,
+        LogicActionTypes.set_registration_backend,
+    }
+)
+# action types that write to a variable
+VARIABLE_ACTION_TYPES = frozenset(
+    {LogicActionTypes.variable, LogicActionTypes.fetch_from_service}
+)
+
+
+def _root(key: str) -> str:
+    # nested data is looked up by the first path segment - dotted variable keys are
+    # stored as nested objects in the data
+    return key.split(".", 1)[0]
+
+
+def _get_input_roots(expression: JSONValue) -> frozenset[str] | None:
+    """
+    Determine the top-level data keys read by ``expression``.
+
+    :returns: ``None`` if the inputs can't be determined or the result is
+      non-deterministic.
+    """
+    try:
+        introspection = introspect_json_logic(expression)
+        input_keys = introspection.input_keys
+        operators = introspection.operators
+    except Exception:
+        return None
+    if input_keys is None or operators & NON_DETERMINISTIC_OPERATORS:
+        return None
+    return frozenset(_root(key) for key in input_keys)
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    trigger: CompiledExpression
+    # action index -> compiled expression of the value of variable actions
+    action_values: Mapping[int, CompiledExpression]
+    # top-level data keys read by the rule, ``None`` if the rule must always be
+    # evaluated
+    input_roots: frozenset[str] | None
+    # top-level data keys that may be written by the rule
+    output_roots: frozenset[str]
+
+    @classmethod
+    def from_rule(cls, rule: FormLogic) -> "CompiledRule":
+        action_values = {}
+        input_roots = _get_input_roots(rule.json_logic_trigger)
+        output_roots = set()
+
+        for index, action in enumerate(rule.actions):
+            action_details = action.get("action", {})
+            action_type = action_details.get("type")
+            if action_type in VARIABLE_ACTION_TYPES:
+                output_roots.add(_root(action.get("variable", "")))
+            if action_type == LogicActionTypes.variable:
+                value = action_details.get("value")
+                action_values[index] = compile_expression(value)
+                value_roots = _get_input_roots(value)
+                if input_roots is not None and value_roots is not None:
+                    input_roots |= value_roots
+                else:
+                    input_roots = None
+            if action_type not in MEMOIZABLE_ACTION_TYPES:
+                input_roots = None
+
+        return cls(
+            trigger=compile_expression(rule.json_logic_trigger),
+            action_values=action_values,
+            input_roots=input_roots,
+            output_roots=frozenset(output_roots),
+        )
+
+    @property
+    def memoizable(self) -> bool:
+        return self.input_roots is not None
+
+    def iter_action_operations(self, rule: FormLogic) -> Iterator[ActionOperation]:
+        for index, operation in enumerate(rule.action_operations):
+            if isinstance(operation, VariableAction):
+                operation.compiled_value = self.action_values.get(index)
+            yield operation
+
+
+@dataclass(frozen=True)
+class CompiledLogic:
+    version: str
+    rules: Sequence[CompiledRule]
+    # top-level data key -> indices of the (memoizable) rules reading it
+    dependents: Mapping[str, frozenset[int]]
+
+    @classmethod
+    def from_rules(cls, rules: Sequence[FormLogic], version: str) -> "CompiledLogic":
+        compiled_rules = [CompiledRule.from_rule(rule) for rule in rules]
+        dependents: dict[str, set[int]] = {}
+        for index, compiled_rule in enumerate(compiled_rules):
+            for root in compiled_rule.input_roots or ():
+                dependents.setdefault(root, set()).add(index)
+        return cls(
+            version=version,
+            rules=compiled_rules,
+            dependents={
+                root: frozenset(indices) for root, indices in dependents.items()
+            },
+        )
+
+    def get_affected_rules(self, changed_roots: Iterable[str]) -> set[int]:
+        affected = set()
+        for root in changed_roots:
+            affected.update(self.dependents.get(root, ()))
+        return affected
+
+
+_compiled_logic_cache: LRUCache[str, CompiledLogic] = LRUCache(
+    maxsize=COMPILED_LOGIC_CACHE_SIZE
+)
+
+
+def get_logic_version(rules: Sequence[FormLogic]) -> str:
+    """
+    Calculate a digest identifying the (ordered) set of rules and their content.
+    """
+    content = [(rule.pk, rule.json_logic_trigger, rule.actions) for rule in rules]
+    return hashlib.md5(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def get_compiled_logic(rules: Sequence[FormLogic]) -> CompiledLogic:
+    """
+    Retrieve the compiled logic for the rules, compiling them if needed.
+
+    The compiled logic is cached in-process, using the logic version as cache key.
+    Any change to the rules results in a different version.
+    """
+    version = get_logic_version(rules)
+    return _compiled_logic_cache.get_or_set(
+        version, lambda: CompiledLogic.from_rules(rules, version=version)
+    )
+
+
+def clear_compiled_logic_cache() -> None:
+    _compiled_logic_cache.clear()
+
+
+@dataclass
+class RuleOutcome:
+    triggered: bool
+    # action index -> variable mutations produced by the action
+    mutations: dict[int, DataMapping] = field(default_factory=dict)
+    action_log_data: dict[int, JSONValue] = field(default_factory=dict)
+
+
+@dataclass
+class EvaluationMemo:
+    """
+    The outcome of the previous evaluation of a set of rules for a submission.
+    """
+
+    version: str
+    initial_data: DataMapping
+    outcomes: dict[int, RuleOutcome] = field(default_factory=dict)
+
+    @staticmethod
+    def get_cache_key(submission: Submission, version: str) -> str:
+        return f"submission-logic-memo:{submission.uuid}:{version}"
+
+    @classmethod
+    def load(cls, submission: Submission, version: str) -> "EvaluationMemo | None":
+        memo = cache.get(cls.get_cache_key(submission, version))
+        if memo is None or memo.version != version:
+            return None
+        return memo
+
+    def save(self, submission: Submission) -> None:
+        cache.set(
+            self.get_cache_key(submission, self.version),
+            self,
+            timeout=EVALUATION_MEMO_TIMEOUT,
+        )
+
+    def get_changed_roots(self, data: DataMapping) -> set[str]:
+        """
+        Determine which top-level data keys differ from the previous evaluation.
+        """
+        missing = object()
+        return {
+            key
+            for key in self.initial_data.keys() | data.keys()
+            if self.initial_data.get(key, missing) != data.get(key, missing)
+        }
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from dataclasses import dataclass, field
 from typing import Any, Tuple
 
@@ -12,15 +13,21 @@ from ..models.submission_value_variable import SubmissionValueVariablesState
 class DataContainer:
     """
     A data container to manage the data/variables lifecycle during logic evaluation.
+
+    The nested data view is built once and then kept in sync with the variables state
+    through :meth:`update`, so that repeated reads during rule evaluation don't need
+    to convert and re-nest all the variable values every time.
     """
 
     state: SubmissionValueVariablesState
 
     _initial_data: Tuple[Tuple[str, Any]] = field(init=False, default_factory=tuple)
+    _data: FormioData | None = field(init=False, default=None)
 
     def __post_init__(self):
-        # ensure the initial data is immutable
-        self._initial_data = tuple(self.data.items())  # record for logging purposes
+        # ensure the initial data is immutable - the nested values of the data view
+        # are patched in place by :meth:`update`, so we need a deep copy
+        self._initial_data = tuple(deepcopy(self.data).items())
 
     @property
     def initial_data(self) -> DataMapping:
@@ -34,21 +41,38 @@ class DataContainer:
         The current view on the submission variable value state is augmented with
         the static variables.
 
+        The returned mapping is shared between calls and kept up to date by
+        :meth:`update` - callers must treat it as read-only.
+
         :return: A datamapping (key: variable key, value: variable value) ready for
           (template context) evaluation.
         """
-        dynamic_values = {
-            key: variable.to_python() for key, variable in self.state.variables.items()
-        }
-        static_values = self.state.static_data()
-        nested_data = FormioData({**dynamic_values, **static_values})
-        return nested_data.data
+        if self._data is None:
+            dynamic_values = {
+                key: variable.to_python()
+                for key, variable in self.state.variables.items()
+            }
+            static_values = self.state.static_data()
+            self._data = FormioData({**dynamic_values, **static_values})
+        return self._data.data
 
     def update(self, updates: DataMapping) -> None:
         """
         Update the dynamic data state.
+
+        Only the variables that are affected by ``updates`` are patched in the data
+        view.
         """
-        self.state.set_values(updates)
+        updated_keys = self.state.set_values(updates)
+        if self._data is None:
+            return
+
+        static_values = self.state.static_data()
+        for key in updated_keys:
+            # static variables take precedence over dynamic values with the same key
+            if key in static_values:
+                continue
+            self._data[key] = self.state.variables[key].to_python()
 
     def get_updated_step_data(self, step: SubmissionStep) -> FormioData:
         relevant_variables = self.state.get_variables_in_submission_step(
@@ -0,0 +1,204 @@
+"""
+Compute the changes in the logic check result compared to an earlier result.
+
+Every logic check returns the full submission and submission step, including the
+complete (logic-mutated) Formio configuration, while usually only a few component
+properties or data values changed since the previous check. Clients can opt in to
+receive only those changes.
+
+The full representation is identified by a version - the hash of its content. Only the
+state of the latest logic check of a submission step is cached for a while, and it is
+overwritten by the next check. A client passes the version of the state it has as base
+version, and receives the changes relative to that state. If the base version is not
+the latest one (or not cached anymore) or the changes cannot be expressed as a delta,
+the full representation is returned instead.
+
+The submission data is not cached - only the (keyed) hashes of the data values are
+kept, which suffices to determine which values changed.
+"""
+import json
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.crypto import salted_hmac
+
+from openforms.formio.utils import iter_components
+from openforms.typing import JSONObject, JSONValue
+
+from ..models import SubmissionStep
+
+KEY_SALT = "openforms.submissions.logic.delta"
+
+STEP_STATE_FIELDS = ("is_applicable", "completed", "can_submit")
+
+
+class DeltaNotPossible(Exception):
+    pass
+
+
+def _get_cache_key(step: SubmissionStep) -> str:
+    return f"submission-logic-state:{step.submission.uuid}:{step.form_step.uuid}"
+
+
+def _dumps(value: JSONValue) -> str:
+    return json.dumps(value, sort_keys=True, cls=DjangoJSONEncoder)
+
+
+def _get_hash(value: JSONValue) -> str:
+    # keyed, so that (short) values can't be recovered by brute-forcing the hash
+    return salted_hmac(KEY_SALT, _dumps(value), algorithm="sha256").hexdigest()
+
+
+def get_version(representation: JSONObject) -> str:
+    return _get_hash(representation)
+
+
+def get_base_state(representation: JSONObject) -> JSONObject:
+    """
+    Reduce the full representation to the state remembered as base of a delta.
+
+    The data values are replaced by their hashes.
+    """
+    step = representation["step"]
+    data_hashes = {key: _get_hash(value) for key, value in (step["data"] or {}).items()}
+    return {**representation, "step": {**step, "data": data_hashes}}
+
+
+def _without(obj: JSONObject, *keys: str) -> JSONObject:
+    return {key: value for key, value in obj.items() if key not in keys}
+
+
+def _get_components(configuration: JSONObject) -> dict[str, JSONObject]:
+    """
+    Map the component keys to their properties, excluding the nested components.
+    """
+    components = {}
+    for component in iter_components(configuration):
+        if (key := component.get("key")) in components:
+            raise DeltaNotPossible(f"Duplicate component key '{key}'")
+        properties = _without(component, "components")
+        if "columns" in properties:
+            properties["columns"] = [
+                _without(column, "components") for column in properties["columns"]
+            ]
+        components[key] = properties
+    return components
+
+
+def _diff_configuration(base: JSONObject, new: JSONObject) -> dict[str, dict[str, Any]]:
+    if _without(base, "components") != _without(new, "components"):
+        raise DeltaNotPossible("Configuration changed outside of the components")
+
+    base_components = _get_components(base)
+    new_components = _get_components(new)
+    if list(base_components) != list(new_components):
+        raise DeltaNotPossible("Components were added, removed or moved")
+
+    changes = {}
+    for key, properties in new_components.items():
+        base_properties = base_components[key]
+        if not base_properties.keys() <= properties.keys():
+            raise DeltaNotPossible(f"Properties were removed from component '{key}'")
+        changed = {
+            name: value
+            for name, value in properties.items()
+            if name not in base_properties or base_properties[name] != value
+        }
+        if changed:
+            changes[key] = changed
+    return changes
+
+
+def _diff_data(base_hashes: dict[str, str], new: JSONObject | None) -> JSONObject:
+    new = new or {}
+    if not base_hashes.keys() <= new.keys():
+        raise DeltaNotPossible("Data keys were removed")
+    return {
+        key: value
+        for key, value in new.items()
+        if base_hashes.get(key) != _get_hash(value)
+    }
+
+
+def _diff_steps(base: list[JSONObject], new: list[JSONObject]) -> list[JSONObject]:
+    if [step["id"] for step in base] != [step["id"] for step in new]:
+        raise DeltaNotPossible("Submission steps changed")
+    return [
+        {"id": step["id"], **{field: step[field] for field in STEP_STATE_FIELDS}}
+        for base_step, step in zip(base, new)
+        if base_step != step
+    ]
+
+
+def get_changes(base: JSONObject, new: JSONObject) -> JSONObject:
+    """
+    Determine the changes between the base state and the full representation of the
+    logic check.
+
+    :arg base: the base state, see :func:`get_base_state`.
+
+    :raises DeltaNotPossible: if a change can only be expressed by the full
+      representation.
+    """
+    base_submission, new_submission = base["submission"], new["submission"]
+    base_step, new_step = base["step"], new["step"]
+
+    base_form_step, new_form_step = base_step["form_step"], new_step["form_step"]
+    if _without(base_form_step, "configuration") != _without(
+        new_form_step, "configuration"
+    ):
+        raise DeltaNotPossible("Form step changed outside of the configuration")
+    if _without(base_step, "form_step", "data", *STEP_STATE_FIELDS) != _without(
+        new_step, "form_step", "data", *STEP_STATE_FIELDS
+    ):
+        raise DeltaNotPossible("Submission step changed")
+
+    return {
+        "submission": {
+            name: value
+            for name, value in _without(new_submission, "steps").items()
+            if base_submission.get(name) != value
+        },
+        "steps": _diff_steps(base_submission["steps"], new_submission["steps"]),
+        "step": {field: new_step[field] for field in STEP_STATE_FIELDS},
+        "configuration": _diff_configuration(
+            base_form_step["configuration"], new_form_step["configuration"]
+        ),
+        "data": _diff_data(base_step["data"], new_step["data"]),
+    }
+
+
+def get_delta(
+    step: SubmissionStep, representation: JSONObject, base_version: str = ""
+) -> JSONObject:
+    """
+    Build the delta response for the full representation of the logic check.
+
+    The base state of the representation replaces the remembered state of the step,
+    so that it can serve as base for the next logic check of the step.
+    """
+    # normalize the serializer output (UUIDs, decimals...) to plain JSON
+    representation = json.loads(json.dumps(representation, cls=DjangoJSONEncoder))
+    version = get_version(representation)
+    cache_key = _get_cache_key(step)
+
+    remembered = cache.get(cache_key) if base_version else None
+    cache.set(
+        cache_key,
+        {"version": version, "state": get_base_state(representation)},
+        timeout=settings.SUBMISSION_LOGIC_STATE_CACHE_TIMEOUT,
+    )
+
+    if remembered is not None and remembered["version"] == base_version:
+        try:
+            return {
+                "version": version,
+                "changes": get_changes(remembered["state"], representation),
+                "full": None,
+            }
+        except DeltaNotPossible:
+            pass
+
+    return {"version": version, "changes": None, "full": representation}
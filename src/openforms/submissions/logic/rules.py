@@ -1,16 +1,17 @@
 import operator
+from copy import deepcopy
 from dataclasses import dataclass, field
 from functools import partial
 from typing import Callable, Iterable, Iterator, List, Optional
 
 import elasticapm
-from json_logic import jsonLogic
 
 from openforms.forms.models import FormLogic, FormStep
 from openforms.typing import JSONValue
 
 from ..models import Submission, SubmissionStep
-from .actions import ActionOperation
+from .actions import ActionOperation, VariableAction
+from .compilation import CompiledRule, EvaluationMemo, RuleOutcome, get_compiled_logic
 from .datastructures import DataContainer
 from .log_utils import log_errors
 
@@ -133,6 +134,11 @@ def iter_evaluate_rules(
     action operator that updates a variable is processed immediately. The caller is
     responsible for processing (all other) actions accordingly.
 
+    The rules are compiled ahead of time and the outcome of the evaluation is
+    remembered for the submission. Rules of which none of the inputs changed since the
+    previous evaluation replay their previous outcome rather than being evaluated
+    again, see :mod:`openforms.submissions.logic.compilation`.
+
     :arg rules: An iterable of form logic rules to evaluate.
     :arg data_container: The :class:`DataContainer` instance wrapping the
       submission/step data and everything contained within. Note that the internal state
@@ -142,29 +148,91 @@ def iter_evaluate_rules(
       sole argument. Useful to gather metadata about rule evaluation.
     :returns: An iterator yielding :class:`ActionOperation` instances.
     """
-    for rule in rules:
+    rules = list(rules)
+    if not rules:
+        return
+
+    compiled_logic = get_compiled_logic(rules)
+    initial_data = data_container.initial_data
+
+    previous = EvaluationMemo.load(submission, compiled_logic.version)
+    memo = EvaluationMemo(version=compiled_logic.version, initial_data=initial_data)
+    changed_roots = previous.get_changed_roots(initial_data) if previous else set()
+    to_evaluate = compiled_logic.get_affected_rules(changed_roots)
+
+    for index, (rule, compiled_rule) in enumerate(zip(rules, compiled_logic.rules)):
+        previous_outcome = previous.outcomes.get(index) if previous else None
+        if (
+            previous_outcome is not None
+            and compiled_rule.memoizable
+            and index not in to_evaluate
+        ):
+            memo.outcomes[index] = previous_outcome
+            yield from _replay_rule(
+                rule, compiled_rule, previous_outcome, data_container, on_rule_check
+            )
+            continue
+
         with elasticapm.capture_span(
             "evaluate_rule",
             span_type="app.submissions.logic",
             labels={"ruleId": rule.pk},
         ):
             triggered = False
+            trigger_failed = True
             with log_errors(rule.json_logic_trigger, rule):
-                triggered = bool(
-                    jsonLogic(rule.json_logic_trigger, data_container.data)
-                )
+                triggered = bool(compiled_rule.trigger(data_container.data))
+                trigger_failed = False
+            # errors must be logged again on the next evaluation
+            memoizable = compiled_rule.memoizable and not trigger_failed
 
             evaluated_rule = EvaluatedRule(rule=rule, triggered=triggered)
+            outcome = RuleOutcome(
+                triggered=triggered, action_log_data=evaluated_rule.action_log_data
+            )
 
-            if not triggered:
-                on_rule_check(evaluated_rule)
-                continue
-
-            for i, operation in enumerate(rule.action_operations):
-                log = partial(operator.setitem, evaluated_rule.action_log_data, i)
-                if mutations := operation.eval(
-                    data_container.data, log=log, submission=submission
+            if triggered:
+                for i, operation in enumerate(
+                    compiled_rule.iter_action_operations(rule)
                 ):
-                    data_container.update(mutations)
-                yield operation
+                    log = partial(operator.setitem, evaluated_rule.action_log_data, i)
+                    mutations = operation.eval(
+                        data_container.data, log=log, submission=submission
+                    )
+                    if mutations:
+                        data_container.update(mutations)
+                        outcome.mutations[i] = deepcopy(mutations)
+                    elif isinstance(operation, VariableAction):
+                        # evaluation error, which is logged by the operation itself
+                        memoizable = False
+                    yield operation
+
+            if not memoizable or outcome != previous_outcome:
+                changed_roots.update(compiled_rule.output_roots)
+                to_evaluate = compiled_logic.get_affected_rules(changed_roots)
+            if memoizable:
+                memo.outcomes[index] = deepcopy(outcome)
             on_rule_check(evaluated_rule)
+
+    if memo != previous:
+        memo.save(submission)
+
+
+def _replay_rule(
+    rule: FormLogic,
+    compiled_rule: CompiledRule,
+    outcome: RuleOutcome,
+    data_container: DataContainer,
+    on_rule_check: Callable[[EvaluatedRule], None],
+) -> Iterator[ActionOperation]:
+    evaluated_rule = EvaluatedRule(
+        rule=rule,
+        triggered=outcome.triggered,
+        action_log_data=deepcopy(outcome.action_log_data),
+    )
+    if outcome.triggered:
+        for i, operation in enumerate(compiled_rule.iter_action_operations(rule)):
+            if mutations := outcome.mutations.get(i):
+                data_container.update(deepcopy(mutations))
+            yield operation
+    on_rule_check(evaluated_rule)
@@ -1,4 +1,7 @@
+import hashlib
 import json
+import logging
+import uuid
 from dataclasses import dataclass
 
 from django.core.cache import cache
@@ -10,8 +13,13 @@ from json_logic import jsonLogic
 from openforms.forms.models import FormVariable
 from openforms.typing import DataMapping, JSONObject, JSONValue
 from openforms.variables.models import DataMappingTypes, ServiceFetchConfiguration
+from openforms.variables.service_fetch_statistics import record_cache_access
 from zgw_consumers_ext.api_client import build_client
 
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "service_fetch"
+
 
 @dataclass
 class FetchResult:
@@ -23,6 +31,48 @@ class FetchResult:
     # response_headers: JSONObject
 
 
+def _get_cache_version(fetch_config: ServiceFetchConfiguration) -> str:
+    # If the version key is evicted, a new version is generated so that possibly stale
+    # entries are never used.
+    return cache.get_or_set(
+        f"{CACHE_PREFIX}:{fetch_config.pk}:version",
+        default=lambda: uuid.uuid4().hex,
+        timeout=None,
+    )
+
+
+def get_cache_key(
+    fetch_config: ServiceFetchConfiguration, submission_uuid: str, request_args: dict
+) -> str:
+    """
+    Build the cache key for the result of a service fetch.
+
+    The key is stable across processes (unlike the builtin :func:`hash`), so that all
+    workers share the cached entries. It is namespaced by the fetch configuration and
+    its cache version, which changes whenever the configuration is edited.
+    """
+    canonical_args = json.dumps(
+        {"submission": submission_uuid, "request": request_args},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    digest = hashlib.sha256(canonical_args.encode("utf-8")).hexdigest()
+    version = _get_cache_version(fetch_config)
+    return f"{CACHE_PREFIX}:{fetch_config.pk}:{version}:{digest}"
+
+
+def invalidate_cache(fetch_config_id: int) -> None:
+    """
+    Invalidate all the cached results for the fetch configuration.
+
+    Rather than looking up all existing entries, the cache version is bumped - the
+    orphaned entries expire by themselves.
+    """
+    cache.set(
+        f"{CACHE_PREFIX}:{fetch_config_id}:version", uuid.uuid4().hex, timeout=None
+    )
+
+
 def perform_service_fetch(
     var: FormVariable, context: DataMapping, submission_uuid: str = ""
 ) -> FetchResult:
@@ -37,7 +87,7 @@ def perform_service_fetch(
     instance.
 
     The value returned by the request is cached using the submission UUID and the
-    arguments to the request (hashed to make a cache key).
+    arguments to the request (hashed to make a cache key), see :func:`get_cache_key`.
     """
 
     if not var.service_fetch_configuration:
@@ -59,13 +109,18 @@ def perform_service_fetch(
     if not submission_uuid:
         raw_value = _do_fetch()
     else:
-        cache_key = hash(submission_uuid + json.dumps(request_args, sort_keys=True))
+        cache_key = get_cache_key(fetch_config, submission_uuid, request_args)
         timeout = (
             _timeout
             if (_timeout := fetch_config.cache_timeout) is not None
             else DEFAULT_TIMEOUT
         )
-        raw_value = cache.get_or_set(cache_key, default=_do_fetch, timeout=timeout)
+        missing = object()
+        raw_value = cache.get(cache_key, default=missing)
+        record_cache_access(fetch_config, hit=raw_value is not missing)
+        if raw_value is missing:
+            raw_value = _do_fetch()
+            cache.set(cache_key, raw_value, timeout=timeout)
 
     match fetch_config.data_mapping_type, fetch_config.mapping_expression:
         case DataMappingTypes.jq, expression:
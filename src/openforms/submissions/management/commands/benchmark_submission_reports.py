@@ -0,0 +1,74 @@
+"""
+Management command to measure the PDF report rendering throughput.
+
+Renders the reports of the given submissions repeatedly (without storing them) and
+reports the number of reports per second, both with a renderer that is kept warm and
+with a fresh renderer for every report.
+"""
+import time
+
+from django.core.management import BaseCommand
+from django.template.loader import render_to_string
+from django.utils.translation import override
+
+from openforms.utils.pdf import PDFRenderer
+
+from ...models import Submission
+from ...report import Report
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the PDF report rendering of (representative) submissions. "
+        "You may want to specify the LOG_LEVEL=WARNING envvar to surpress log output."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "submission_id",
+            type=int,
+            nargs="+",
+            help="Submission ID(s) to render the report of.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=10,
+            help="Number of times each report is rendered. Defaults to 10.",
+        )
+
+    def handle(self, **options):
+        submissions = Submission.objects.filter(
+            id__in=options["submission_id"]
+        ).select_related("auth_info", "form")
+        documents = []
+        for submission in submissions:
+            with override(submission.language_code):
+                documents.append(
+                    render_to_string(
+                        "report/submission_report.html",
+                        context={"report": Report(submission)},
+                    )
+                )
+
+        if not documents:
+            self.stderr.write("No submissions found.")
+            return
+
+        iterations = options["iterations"]
+        warm_renderer = PDFRenderer()
+        renderers = [
+            ("warm renderer", lambda: warm_renderer),
+            ("renderer per report", PDFRenderer),
+        ]
+        for label, get_renderer in renderers:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                for html in documents:
+                    get_renderer().render(html)
+            duration = time.perf_counter() - start
+            num_reports = iterations * len(documents)
+            self.stdout.write(
+                f"{label}: {num_reports} reports in {duration:.2f}s "
+                f"({num_reports / duration:.2f} reports/s)"
+            )
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.20 on 2023-08-21 10:12
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("submissions", "0078_submission_finalised_registration_backend_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submission",
+            name="resolved_snapshot",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                help_text="Outcome of the form logic evaluation at the time of completion, used when rendering the submission.",
+                verbose_name="resolved snapshot",
+            ),
+        ),
+    ]
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Union
 
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models, transaction
 from django.utils.functional import cached_property
 from django.utils.translation import get_language, gettext_lazy as _
@@ -229,6 +230,18 @@ class Submission(models.Model):
         ),
     )
 
+    resolved_snapshot = models.JSONField(
+        _("resolved snapshot"),
+        blank=True,
+        default=dict,
+        encoder=DjangoJSONEncoder,
+        editable=False,
+        help_text=_(
+            "Outcome of the form logic evaluation at the time of completion, used "
+            "when rendering the submission."
+        ),
+    )
+
     # tracking async execution state
     on_completion_task_ids = ArrayField(
         base_field=models.CharField(
@@ -359,11 +372,15 @@ class Submission(models.Model):
             if len(form_steps) == 0:
                 return FormioConfigurationWrapper(configuration={})
 
-            wrapper = FormioConfigurationWrapper(
-                form_steps[0].form_definition.configuration
-            )
+            # combine copy-on-write overlays so that the form definitions are not
+            # modified
+            wrapper = form_steps[
+                0
+            ].form_definition.configuration_wrapper.copy_on_write()
             for form_step in form_steps[1:]:
-                wrapper += form_step.form_definition.configuration_wrapper
+                wrapper += (
+                    form_step.form_definition.configuration_wrapper.copy_on_write()
+                )
             self._total_configuration_wrapper = wrapper
         return self._total_configuration_wrapper
 
@@ -418,6 +435,8 @@ class Submission(models.Model):
         ).delete()
 
         self._is_cleaned = True
+        # the snapshot contains the (sensitive) data as well
+        self.resolved_snapshot = {}
 
         if self.co_sign_data:
             # We do keep the representation, as that is used in PDF and confirmation e-mail
@@ -452,9 +471,16 @@ class Submission(models.Model):
         if hasattr(self, "_execution_state") and not refresh:
             return self._execution_state
 
-        form_steps = list(
-            self.form.formstep_set.select_related("form_definition").order_by("order")
-        )
+        # use the form steps prefetched for bulk operations if available, see
+        # :func:`openforms.submissions.exports.iter_submissions_for_export`
+        if "formstep_set" in getattr(self.form, "_prefetched_objects_cache", {}):
+            form_steps = sorted(self.form.formstep_set.all(), key=lambda s: s.order)
+        else:
+            form_steps = list(
+                self.form.formstep_set.select_related("form_definition").order_by(
+                    "order"
+                )
+            )
         # ⚡️ no select_related/prefetch ON PURPOSE - while processing the form steps,
         # we're doing this in python as we have the objects already from the query
         # above.
@@ -173,9 +173,23 @@ class SubmissionValueVariablesState:
             variable.value = data[variable.key]
             variable.source = SubmissionValueVariableSources.prefill
 
-        SubmissionValueVariable.objects.bulk_create(variables_to_prefill)
+        # when the prefill is retrieved in the background, a step may have been saved
+        # in the meantime - the values submitted by the user are kept
+        existing_keys = set(
+            SubmissionValueVariable.objects.filter(
+                submission=self.submission,
+                key__in=[variable.key for variable in variables_to_prefill],
+            ).values_list("key", flat=True)
+        )
+        SubmissionValueVariable.objects.bulk_create(
+            [
+                variable
+                for variable in variables_to_prefill
+                if variable.key not in existing_keys
+            ]
+        )
 
-    def set_values(self, data: DataMapping) -> None:
+    def set_values(self, data: DataMapping) -> List[str]:
         """
         Apply the values from ``data`` to the current state of the variables.
 
@@ -184,16 +198,20 @@ class SubmissionValueVariablesState:
         variables in the state.
 
         :arg data: mapping of variable key to value.
+        :returns: the keys of the variables that received a value from ``data``.
 
         .. todo:: apply variable.datatype/format to obtain python objects? This also
            needs to properly serialize back to JSON though!
         """
         formio_data = FormioData(data)
+        updated_keys = []
         for key, variable in self.variables.items():
             new_value = formio_data.get(key, default=empty)
             if new_value is empty:
                 continue
             variable.value = new_value
+            updated_keys.append(key)
+        return updated_keys
 
 
 class SubmissionValueVariableManager(models.Manager):
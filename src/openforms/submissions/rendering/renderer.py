@@ -16,6 +16,7 @@ from ..models import Submission
 from .base import Node
 from .constants import RenderModes
 from .nodes import FormNode, SubmissionStepNode
+from .snapshot import apply_resolved_snapshot
 from .utils import get_request
 
 
@@ -66,19 +67,24 @@ class Renderer:
         """
         Produce only the direct child nodes.
         """
-        submission_data = self.submission.data
-        for step in self.steps:
-            new_configuration = evaluate_form_logic(
-                submission=self.submission,
-                step=step,
-                data=submission_data,
-                dirty=False,
-                request=self.dummy_request,
-            )
-            # update the configuration for introspection - note that we are mutating
-            # an instance here without persisting it to the backend on purpose!
-            # this replicates the run-time behaviour while filling out the form
-            step.form_step.form_definition.configuration = new_configuration
+        steps = self.steps
+        # completed submissions have the outcome of the form logic recorded
+        use_snapshot = apply_resolved_snapshot(self.submission, steps)
+        submission_data = self.submission.data if not use_snapshot else None
+        for step in steps:
+            if not use_snapshot:
+                new_configuration = evaluate_form_logic(
+                    submission=self.submission,
+                    step=step,
+                    data=submission_data,
+                    dirty=False,
+                    request=self.dummy_request,
+                )
+                # update the configuration for introspection - note that we are
+                # mutating an instance here without persisting it to the backend on
+                # purpose! this replicates the run-time behaviour while filling out
+                # the form
+                step.form_step.form_definition.configuration = new_configuration
             submission_step_node = SubmissionStepNode(renderer=self, step=step)
             if not submission_step_node.is_visible:
                 continue
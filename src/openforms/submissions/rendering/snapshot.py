@@ -0,0 +1,237 @@
+"""
+Snapshot of the resolved submission, shared by all renderers.
+
+Rendering a submission requires the form logic to be evaluated for every step, so
+that the applicable steps, the dynamic configuration and the variable values are
+known. A completed submission is rendered many times (PDF report, confirmation
+e-mail, registration, exports...), often in separate processes, while the outcome of
+the logic does not change anymore.
+
+When the submission is completed, the outcome of the logic evaluation is recorded
+once in :attr:`openforms.submissions.models.Submission.resolved_snapshot`. The
+:class:`openforms.submissions.rendering.renderer.Renderer` applies the snapshot to the
+submission steps rather than evaluating the logic again. Submissions without (valid)
+snapshot fall back to evaluating the logic.
+
+The resolved configurations are mostly identical to the configurations of the form
+definitions, so only the changed component properties are recorded, together with the
+hash of the form definition configuration they apply to.
+
+The value formatting is not part of the snapshot - it depends on the render mode and
+output format, and is cheap compared to the logic evaluation.
+
+The snapshot is built in the :func:`openforms.submissions.tasks.on_completion` workflow.
+"""
+from copy import deepcopy
+from typing import TYPE_CHECKING, Dict, List, Optional, TypedDict
+
+from openforms.formio.utils import iter_components
+from openforms.typing import JSONObject
+from openforms.variables.constants import FormVariableSources
+
+from ..form_logic import evaluate_form_logic
+from ..models.submission_step import DirtyData
+from .utils import get_request
+
+if TYPE_CHECKING:  # pragma: nocover
+    from ..models import Submission, SubmissionStep
+
+# bump when the structure of the snapshot changes, older snapshots are then ignored
+SNAPSHOT_VERSION = 2
+
+# properties holding the nested components, which are compared separately
+NESTED_COMPONENTS_PROPERTIES = ("components", "columns")
+
+
+class StepSnapshot(TypedDict):
+    form_step: str  # UUID of the form step
+    is_applicable: bool
+    # the resolved configuration and data are only recorded for applicable steps.
+    # The configuration is recorded as the changes compared to the form definition
+    # configuration with this hash:
+    configuration_hash: str
+    # component key -> changed (or added) properties
+    component_changes: Dict[str, JSONObject]
+    # component key -> names of the removed properties
+    removed_properties: Dict[str, List[str]]
+    # the full resolved configuration, only if the changes cannot be expressed as
+    # component property changes (e.g. because components were added)
+    configuration: Optional[JSONObject]
+    data: JSONObject
+
+
+class ResolvedSnapshot(TypedDict):
+    version: int
+    steps: List[StepSnapshot]
+    # values of the user defined variables
+    variables: JSONObject
+
+
+def _iter_component_properties(configuration: JSONObject):
+    for component in iter_components(configuration, recursive=True):
+        properties = {
+            name: value
+            for name, value in component.items()
+            if name not in NESTED_COMPONENTS_PROPERTIES
+        }
+        if "columns" in component:
+            properties["columns"] = [
+                {name: value for name, value in column.items() if name != "components"}
+                for column in component["columns"]
+            ]
+        yield component.get("key"), properties
+
+
+def _record_configuration(
+    step_snapshot: StepSnapshot, base: JSONObject, configuration: JSONObject
+) -> None:
+    """
+    Record the resolved configuration as the changes compared to the base.
+    """
+    base_components = dict(_iter_component_properties(base))
+    components = list(_iter_component_properties(configuration))
+    # the (nested) components can only be matched if the structure is unchanged
+    same_structure = [key for key, _ in components] == list(base_components) and all(
+        properties.get("columns") == base_components[key].get("columns")
+        for key, properties in components
+    )
+    if not same_structure:
+        step_snapshot["configuration"] = configuration
+        return
+
+    for key, properties in components:
+        base_properties = base_components[key]
+        changes = {
+            name: value
+            for name, value in properties.items()
+            if name not in base_properties or base_properties[name] != value
+        }
+        removed = [name for name in base_properties if name not in properties]
+        if changes:
+            step_snapshot["component_changes"][key] = changes
+        if removed:
+            step_snapshot["removed_properties"][key] = removed
+
+
+def _resolve_configuration(step_snapshot: StepSnapshot, base: JSONObject) -> JSONObject:
+    if step_snapshot["configuration"] is not None:
+        return step_snapshot["configuration"]
+
+    configuration = deepcopy(base)
+    changes = step_snapshot["component_changes"]
+    removed_properties = step_snapshot["removed_properties"]
+    for component in iter_components(configuration, recursive=True):
+        key = component.get("key")
+        component.update(changes.get(key, {}))
+        for name in removed_properties.get(key, []):
+            del component[name]
+    return configuration
+
+
+def build_resolved_snapshot(submission: "Submission") -> ResolvedSnapshot:
+    """
+    Evaluate the form logic for all steps and record the outcome.
+
+    Note that evaluating the logic mutates the (cached) state of the submission and its
+    steps, like rendering does.
+    """
+    request = get_request()
+    submission_data = submission.data
+    steps: List[StepSnapshot] = []
+    for step in submission.load_execution_state().submission_steps:
+        configuration = evaluate_form_logic(
+            submission=submission,
+            step=step,
+            data=submission_data,
+            dirty=False,
+            request=request,
+        )
+        is_applicable = step.is_applicable
+        form_definition = step.form_step.form_definition
+        step_snapshot: StepSnapshot = {
+            "form_step": str(step.form_step.uuid),
+            "is_applicable": is_applicable,
+            "configuration_hash": "",
+            "component_changes": {},
+            "removed_properties": {},
+            "configuration": None,
+            "data": step.data if is_applicable else {},
+        }
+        if is_applicable:
+            step_snapshot[
+                "configuration_hash"
+            ] = form_definition.get_configuration_hash()
+            _record_configuration(
+                step_snapshot, form_definition.configuration, configuration
+            )
+        steps.append(step_snapshot)
+
+    state = submission.load_submission_value_variables_state()
+    variables = {
+        key: variable.value
+        for key, variable in state.variables.items()
+        if variable.form_variable
+        and variable.form_variable.source == FormVariableSources.user_defined
+    }
+    return {"version": SNAPSHOT_VERSION, "steps": steps, "variables": variables}
+
+
+def apply_resolved_snapshot(
+    submission: "Submission", steps: List["SubmissionStep"]
+) -> bool:
+    """
+    Apply the recorded logic outcome of the submission to the steps, if possible.
+
+    The configurations of the form definitions are replaced (but not persisted) with
+    the resolved configurations, like :func:`evaluate_form_logic` would do.
+
+    :returns: ``False`` if the submission has no usable snapshot, in which case the
+      form logic must be evaluated instead.
+    """
+    if getattr(submission, "_resolved_snapshot_applied", False):
+        return True
+
+    snapshot: Optional[ResolvedSnapshot] = submission.resolved_snapshot
+    if not snapshot or snapshot.get("version") != SNAPSHOT_VERSION:
+        return False
+
+    step_snapshots = {
+        step_snapshot["form_step"]: step_snapshot for step_snapshot in snapshot["steps"]
+    }
+    # the form steps may have been changed after completion
+    if {str(step.form_step.uuid) for step in steps} != step_snapshots.keys():
+        return False
+    for step in steps:
+        step_snapshot = step_snapshots[str(step.form_step.uuid)]
+        if (
+            step_snapshot["is_applicable"]
+            and step_snapshot["configuration"] is None
+            and step_snapshot["configuration_hash"]
+            != step.form_step.form_definition.get_configuration_hash()
+        ):
+            return False
+
+    state = submission.load_submission_value_variables_state()
+    for key, value in snapshot["variables"].items():
+        if (variable := state.variables.get(key)) is not None:
+            variable.value = value
+
+    for step in steps:
+        step_snapshot = step_snapshots[str(step.form_step.uuid)]
+        step._is_applicable = step_snapshot["is_applicable"]
+        step._form_logic_evaluated = True
+        form_definition = step.form_step.form_definition
+        if not step_snapshot["is_applicable"]:
+            step._form_logic_configuration = form_definition.configuration
+            continue
+        configuration = _resolve_configuration(
+            step_snapshot, form_definition.configuration
+        )
+        step.data = DirtyData(step_snapshot["data"])
+        step._form_logic_configuration = configuration
+        # like the logic evaluation while rendering, the form definition is mutated
+        # without persisting it
+        form_definition.configuration = configuration
+
+    submission._resolved_snapshot_applied = True
+    return True
@@ -1,10 +1,14 @@
 import logging
 
+from django.db import transaction
 from django.db.models.base import ModelBase
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import Signal, receiver
 
 from openforms.submissions.models import SubmissionReport
+from openforms.variables.models import ServiceFetchConfiguration
+
+from .logic.service_fetching import invalidate_cache
 
 logger = logging.getLogger(__name__)
 
@@ -57,3 +61,16 @@ def delete_submission_report_files(
     logger.debug("Deleting file %r", instance.content.name)
 
     instance.content.delete(save=False)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=ServiceFetchConfiguration,
+    dispatch_uid="submissions.invalidate_service_fetch_cache",
+)
+def invalidate_service_fetch_cache(
+    sender: ModelBase, instance: ServiceFetchConfiguration, **kwargs
+) -> None:
+    # the primary key is cleared after deleting the instance
+    fetch_config_id = instance.pk
+    transaction.on_commit(lambda: invalidate_cache(fetch_config_id))
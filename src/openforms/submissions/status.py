@@ -1,10 +1,22 @@
 """
 Utility to interact with the celery task status.
+
+Once the processing is done, its outcome (including the rendered confirmation page) is
+cached, so that repeated reads of the status don't need to check the task results and
+render the page again. Completion stages signal that they finished through the cache,
+which allows a status request to wait for the processing without polling the result
+backend - see :meth:`SubmissionProcessingStatus.wait`.
 """
+import hashlib
+import time
 from dataclasses import dataclass
-from typing import List
+from typing import List, TypedDict
+from uuid import uuid4
 
+from django.conf import settings
+from django.core.cache import cache
 from django.urls import reverse
+from django.utils.translation import get_language
 
 from celery import states
 from celery.result import AsyncResult
@@ -16,6 +28,34 @@ from .constants import ProcessingResults, ProcessingStatuses
 from .models import Submission
 from .utils import add_submmission_to_session, get_report_download_url
 
+# interval (in seconds) between checks of the cache for finished completion stages
+STATUS_CHANGE_POLL_INTERVAL = 0.25
+STATUS_CHANGE_TIMEOUT = 60 * 60
+# the waiting request occupies a web server worker, so it may only wait briefly
+STATUS_MAX_WAIT = 5
+
+
+class FinalState(TypedDict):
+    status: str
+    result: str
+    error_message: str
+    confirmation_page_content: str
+
+
+def _get_status_change_key(submission_id: int) -> str:
+    return f"submission-processing-status-change:{submission_id}"
+
+
+def notify_status_change(submission_id: int) -> None:
+    """
+    Signal waiting status requests that a completion stage of the submission finished.
+    """
+    cache.set(
+        _get_status_change_key(submission_id),
+        uuid4().hex,
+        timeout=STATUS_CHANGE_TIMEOUT,
+    )
+
 
 @dataclass
 class SubmissionProcessingStatus:
@@ -23,13 +63,22 @@ class SubmissionProcessingStatus:
     submission: Submission
 
     def get_async_results(self) -> List[AsyncResult]:
-        if not hasattr(self, "_async_result"):
+        if not hasattr(self, "_async_results"):
             task_ids = self.submission.on_completion_task_ids
             self._async_results = [AsyncResult(task_id) for task_id in task_ids]
         return self._async_results
 
-    @property
-    def status(self) -> str:
+    def _get_cache_key(self) -> str:
+        # a new set of tasks is started when the submission is completed again
+        task_ids = ",".join(self.submission.on_completion_task_ids)
+        digest = hashlib.sha256(task_ids.encode("utf-8")).hexdigest()
+        # the confirmation page is rendered in the active language
+        return (
+            f"submission-processing-status:{self.submission.uuid}:{digest}:"
+            f"{get_language()}"
+        )
+
+    def _get_status(self) -> str:
         results = self.get_async_results()
         any_failed = any((result.state == states.FAILURE for result in results))
         all_ready = all((result.state in states.READY_STATES for result in results))
@@ -37,11 +86,7 @@ class SubmissionProcessingStatus:
             return ProcessingStatuses.done
         return ProcessingStatuses.in_progress
 
-    @property
-    def result(self) -> str:
-        if self.status != ProcessingStatuses.done:
-            return ""
-
+    def _get_result(self) -> str:
         results = self.get_async_results()
         all_success = all((result.state == states.SUCCESS for result in results))
         any_failed = any((result.state == states.FAILURE for result in results))
@@ -57,8 +102,7 @@ class SubmissionProcessingStatus:
             "defined as `ignore_result=True` which prevents us from tracking the state."
         )
 
-    @property
-    def error_message(self) -> str:
+    def _get_error_message(self) -> str:
         # check if we have error information from appointments
         error_bits = []
 
@@ -72,11 +116,77 @@ class SubmissionProcessingStatus:
             error_bits.append(appointment_error)
         return "\n\n".join(error_bits)
 
+    def get_final_state(self) -> FinalState | None:
+        """
+        Get the outcome of the processing, or ``None`` if it's still in progress.
+        """
+        if not hasattr(self, "_final_state"):
+            cache_key = self._get_cache_key()
+            final_state = cache.get(cache_key)
+            if final_state is None and self._get_status() == ProcessingStatuses.done:
+                result = self._get_result()
+                final_state = FinalState(
+                    status=ProcessingStatuses.done,
+                    result=result,
+                    error_message=self._get_error_message(),
+                    confirmation_page_content=(
+                        self.submission.render_confirmation_page()
+                        if result == ProcessingResults.success
+                        else ""
+                    ),
+                )
+                cache.set(
+                    cache_key,
+                    final_state,
+                    timeout=settings.SUBMISSION_STATUS_CACHE_TIMEOUT,
+                )
+            self._final_state = final_state
+        return self._final_state
+
+    def wait(self, timeout: float) -> None:
+        """
+        Wait (for a limited time) until the processing is done.
+
+        The wait is capped at :const:`STATUS_MAX_WAIT` seconds.
+
+        The task results are only checked again after a completion stage signalled that
+        it finished, see :func:`notify_status_change`.
+        """
+        deadline = time.monotonic() + min(timeout, STATUS_MAX_WAIT)
+        key = _get_status_change_key(self.submission.id)
+        change = cache.get(key)
+        while self.get_final_state() is None and time.monotonic() < deadline:
+            time.sleep(STATUS_CHANGE_POLL_INTERVAL)
+            if (new_change := cache.get(key)) == change:
+                continue
+            change = new_change
+            # check the task results again
+            self.__dict__.pop("_final_state", None)
+            self.__dict__.pop("_async_results", None)
+
+    @property
+    def status(self) -> str:
+        if (final_state := self.get_final_state()) is None:
+            return ProcessingStatuses.in_progress
+        return final_state["status"]
+
+    @property
+    def result(self) -> str:
+        if (final_state := self.get_final_state()) is None:
+            return ""
+        return final_state["result"]
+
+    @property
+    def error_message(self) -> str:
+        if (final_state := self.get_final_state()) is None:
+            return self._get_error_message()
+        return final_state["error_message"]
+
     @property
     def confirmation_page_content(self) -> str:
-        if self.result != ProcessingResults.success:
+        if (final_state := self.get_final_state()) is None:
             return ""
-        return self.submission.render_confirmation_page()
+        return final_state["confirmation_page_content"]
 
     @property
     def report_download_url(self) -> str:
@@ -1,81 +1,117 @@
 import logging
+import time
 from datetime import timedelta
 
 from django.conf import settings
-from django.utils import timezone
 
-from celery import chain
-from celery.result import AsyncResult
+from celery import chain, chord
+from celery.signals import task_postrun, task_prerun
 
 from openforms.appointments.tasks import maybe_register_appointment
 from openforms.celery import app
+from openforms.registrations.scheduling import RetryScheduler
 
 from ..models import Submission
+from ..status import notify_status_change
 from .cleanup import *  # noqa
 from .co_sign import *  # noqa
 from .emails import *  # noqa
 from .payments import *  # noqa
 from .pdf import *  # noqa
 from .registration import *  # noqa
+from .snapshot import *  # noqa
 from .user_uploads import *  # noqa
 
 logger = logging.getLogger(__name__)
 
 
 def on_completion(submission_id: int) -> None:
-    """
-    Celery chain of tasks to execute on a submission completion event.
+    r"""
+    Celery workflow of tasks to execute on a submission completion event.
 
     This SHOULD be invoked as a transaction.on_commit(...) handler, therefore it should
     not execute any extra queries in the process this function is running in.
+
+    The tasks and their dependencies::
+
+              register appointment
+                       |
+                pre-registration
+                       |
+               resolved snapshot
+              /        |        \
+         co-sign    process    generate
+         e-mail   attachments   report
+            |           \       /
+            |          registration
+             \            /
+           finalize completion
+
+    Independent stages run in parallel: the e-mail to the co-signer does not delay the
+    registration, and the attachments are processed while the report is generated.
     """
     # use immutable signatures so that the result of previous tasks is not passed
-    # in as an argument to chained tasks
+    # in as an argument to dependent tasks
     register_appointment_task = maybe_register_appointment.si(submission_id)
     pre_registration_task = pre_registration.si(submission_id)
+    record_snapshot_task = record_resolved_snapshot.si(submission_id)
     send_email_cosigner_task = send_email_cosigner.si(submission_id)
+    process_attachments_task = process_submission_attachments.si(submission_id)
     generate_report_task = generate_submission_report.si(submission_id)
     register_submission_task = register_submission.si(submission_id)
     finalize_completion_task = finalize_completion.si(submission_id)
 
+    stages = [
+        register_appointment_task,
+        pre_registration_task,
+        record_snapshot_task,
+        send_email_cosigner_task,
+        process_attachments_task,
+        generate_report_task,
+        register_submission_task,
+        finalize_completion_task,
+    ]
+    # Fix the task IDs up front so that the state of every stage can be checked later,
+    # walking the results of a workflow with groups/chords is not reliable.
+    task_ids = [stage.freeze().id for stage in stages]
+
     # for the orchestration with distributed processing and dependencies between
     # tasks, see the Celery documentation:
     # https://docs.celeryproject.org/en/stable/userguide/canvas.html#guide-canvas
-    # Additionally, check the developer documentation of Open Forms for a visual
-    # representation of the task orchestration and dependencies (TODO, @joeri)
-    # The linked task (= next task) is only executed if the previous task returns
+    # A dependent task is only executed if the tasks it depends on return
     # successfully, so error handling needs to happen inside each task.
-    on_completion_chain = chain(
+    on_completion_workflow = chain(
         # The appointment must be registered before a confirmation PDF is generated and
         # any backend registration happens, as on-failure, the user should get feedback
-        # about the failure.
+        # about the failure. The report also displays the appointment details.
         register_appointment_task,
+        # The public registration reference is included in the co-sign e-mail and the
+        # report.
         pre_registration_task,
-        send_email_cosigner_task,
-        # The submission report needs to already have been generated before it can be
-        # attached in the registration backend.
-        # TODO: can be in parallel with register_appointment_task and if that fails -> delete the report again
-        generate_report_task,
-        # TODO: ensure that any images that need resizing are done so before this is attempted
-        register_submission_task,
-        # we schedule the finalization so that the ``async_result`` below is marked
-        # as done, which is the "signal" to show the confirmation page. Actual payment
-        # flow & confirmation e-mail follow later.
-        finalize_completion_task,
+        # The outcome of the form logic is recorded once for the renderers of the
+        # e-mails, the report and the registration.
+        record_snapshot_task,
+        chord(
+            [
+                send_email_cosigner_task,
+                # The images must be resized and the submission report must have been
+                # generated before they can be attached in the registration backend.
+                chord(
+                    [process_attachments_task, generate_report_task],
+                    register_submission_task,
+                ),
+            ],
+            # we schedule the finalization so that its result is marked as done, which
+            # is the "signal" to show the confirmation page. Actual payment flow &
+            # confirmation e-mail follow later.
+            finalize_completion_task,
+        ),
     )
 
     # this can run any time because they have been claimed earlier
     cleanup_temporary_files_for.delay(submission_id)
 
-    async_result: AsyncResult = on_completion_chain.delay()
-
-    # obtain all the task IDs so we can check the state later
-    task_ids = []
-
-    node = async_result
-    while node is not None:
-        task_ids.append(node.id)
-        node = node.parent
+    on_completion_workflow.delay()
 
     # NOTE - this is "risky" since we're running outside of the transaction (this code
     # should run in transaction.on_commit)!
@@ -117,6 +153,9 @@ def on_completion_retry(submission_id: int) -> chain:
         properly. It's important that the individual celery tasks making up the
         workflow are idempotent and exit successfully when nothing needs to be done!
 
+    Contrary to :func:`on_completion`, every stage of the retry workflow depends on the
+    previous one, so they are executed sequentially.
+
     TODO: the results should be forgotten as part of the retry flow to not flood the
     result backend!
 
@@ -124,6 +163,9 @@ def on_completion_retry(submission_id: int) -> chain:
     monitoring _if and only if_ they're part of this particular workflow.
     """
     pre_register_submission_task = pre_registration.si(submission_id)
+    process_attachments_task = process_submission_attachments.si(submission_id).set(
+        ignore_result=True
+    )
     register_submission_task = register_submission.si(submission_id).set(
         ignore_result=True
     )
@@ -136,6 +178,7 @@ def on_completion_retry(submission_id: int) -> chain:
 
     retry_chain = chain(
         pre_register_submission_task,
+        process_attachments_task,
         register_submission_task,
         update_payments_task,
         finalize_completion_retry_task,
@@ -150,13 +193,88 @@ def retry_processing_submissions():
     """
     Retry submissions that have failed processing before and are recent enough.
     """
-    retry_time_limit = timezone.now() - timedelta(
+    scheduler = RetryScheduler()
+    retry_time_limit = scheduler.now - timedelta(
         hours=settings.RETRY_SUBMISSIONS_TIME_LIMIT
     )
     for submission in Submission.objects.filter(
         needs_on_completion_retry=True,
         completed_on__gte=retry_time_limit,
-    ):
+    ).select_related("form"):
+        if not scheduler.should_retry(submission):
+            continue
         logger.debug("Resend submission for registration '%s'", submission)
         retry_chain = on_completion_retry(submission.id)
         retry_chain.delay()
+
+    logger.info("Retried failed submissions: %r", dict(scheduler.stats))
+
+
+# the tasks making up the completion (retry) workflows, of which the duration is logged
+COMPLETION_STAGES = {
+    task.name
+    for task in (
+        maybe_register_appointment,
+        pre_registration,
+        record_resolved_snapshot,
+        send_email_cosigner,
+        process_submission_attachments,
+        generate_submission_report,
+        register_submission,
+        finalize_completion,
+        update_submission_payment_status,
+        finalize_completion_retry,
+    )
+}
+
+_stage_start_times: dict[str, float] = {}
+
+
+@task_prerun.connect
+def start_stage_timer(task_id: str, task, **kwargs) -> None:
+    if task.name in COMPLETION_STAGES:
+        _stage_start_times[task_id] = time.monotonic()
+
+
+@task_postrun.connect
+def record_stage_timing(task_id: str, task, args, state: str, **kwargs) -> None:
+    if (start := _stage_start_times.pop(task_id, None)) is None:
+        return
+    duration = time.monotonic() - start
+    submission_id = args[0] if args else None
+    logger.info(
+        "Completion stage %s for submission %s finished (%s) in %.3fs",
+        task.name,
+        submission_id,
+        state,
+        duration,
+        extra={
+            "stage": task.name,
+            "submission": submission_id,
+            "state": state,
+            "duration": duration,
+        },
+    )
+
+
+# the stages of the initial completion workflow, of which the status is checked
+ON_COMPLETION_STAGES = {
+    task.name
+    for task in (
+        maybe_register_appointment,
+        pre_registration,
+        record_resolved_snapshot,
+        send_email_cosigner,
+        process_submission_attachments,
+        generate_submission_report,
+        register_submission,
+        finalize_completion,
+    )
+}
+
+
+@task_postrun.connect
+def signal_status_change(task_id: str, task, args, **kwargs) -> None:
+    # the result of the task is stored in the result backend at this point
+    if task.name in ON_COMPLETION_STAGES and args:
+        notify_status_change(args[0])
@@ -0,0 +1,35 @@
+import logging
+
+from openforms.celery import app
+
+from ..models import Submission
+from ..rendering.snapshot import build_resolved_snapshot
+
+__all__ = ["record_resolved_snapshot"]
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(ignore_result=False)
+def record_resolved_snapshot(submission_id: int) -> None:
+    """
+    Record the outcome of the form logic once for all renderers of the submission.
+
+    The snapshot is an optimization - if it can't be built, the renderers evaluate the
+    form logic instead, so errors don't stop the completion processing.
+    """
+    submission = Submission.objects.get(id=submission_id)
+    # idempotency: the snapshot has been recorded already
+    if submission.resolved_snapshot:
+        return
+
+    try:
+        snapshot = build_resolved_snapshot(submission)
+    except Exception:
+        logger.exception(
+            "Could not record the resolved snapshot of submission %d", submission_id
+        )
+        return
+
+    # only update the snapshot, the other stages update the submission concurrently
+    Submission.objects.filter(id=submission_id).update(resolved_snapshot=snapshot)
@@ -9,6 +9,7 @@ from ..attachments import (
     cleanup_submission_temporary_uploaded_files,
     cleanup_unclaimed_temporary_uploaded_files,
     resize_attachment,
+    resize_submission_attachments,
 )
 from ..models import Submission, SubmissionFileAttachment
 
@@ -16,6 +17,7 @@ __all__ = [
     "cleanup_temporary_files_for",
     "cleanup_unclaimed_temporary_files",
     "resize_submission_attachment",
+    "process_submission_attachments",
 ]
 
 
@@ -35,3 +37,15 @@ def cleanup_unclaimed_temporary_files() -> None:
 def resize_submission_attachment(attachment_id: int, size: Tuple[int, int]) -> None:
     attachment = SubmissionFileAttachment.objects.get(id=attachment_id)
     resize_attachment(attachment, size)
+
+
+@app.task
+def process_submission_attachments(submission_id: int) -> None:
+    """
+    Process the attachments of the submission before it is registered.
+
+    Processing is best-effort: attachments that cannot be processed are logged and
+    registered as uploaded, so that this task does not block the registration.
+    """
+    submission = Submission.objects.get(id=submission_id)
+    resize_submission_attachments(submission)
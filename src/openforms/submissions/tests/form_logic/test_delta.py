@@ -0,0 +1,256 @@
+import json
+
+from django.test import SimpleTestCase
+
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormLogicFactory,
+    FormStepFactory,
+)
+from openforms.utils.tests.cache import clear_caches
+
+from ...logic.delta import DeltaNotPossible, get_base_state, get_changes
+from ..factories import SubmissionFactory, SubmissionStepFactory
+from ..mixins import SubmissionsMixin
+
+
+def _representation(components, data=None, **step_state):
+    step_state = {
+        "is_applicable": True,
+        "completed": False,
+        "can_submit": True,
+        **step_state,
+    }
+    return {
+        "submission": {
+            "id": "1",
+            "submission_allowed": "yes",
+            "steps": [{"id": "a", "name": "Step", **step_state}],
+        },
+        "step": {
+            "id": "2",
+            "slug": "step",
+            "form_step": {"index": 0, "configuration": {"components": components}},
+            "data": data or {},
+            **step_state,
+        },
+    }
+
+
+class GetChangesTests(SimpleTestCase):
+    def test_changed_component_properties(self):
+        base = _representation(
+            [
+                {
+                    "type": "fieldset",
+                    "key": "fieldset",
+                    "components": [
+                        {"type": "textfield", "key": "name", "hidden": False},
+                        {"type": "textfield", "key": "surname", "hidden": False},
+                    ],
+                }
+            ]
+        )
+        new = _representation(
+            [
+                {
+                    "type": "fieldset",
+                    "key": "fieldset",
+                    "components": [
+                        {"type": "textfield", "key": "name", "hidden": True},
+                        {
+                            "type": "textfield",
+                            "key": "surname",
+                            "hidden": False,
+                            "validate": {"required": True},
+                        },
+                    ],
+                }
+            ]
+        )
+
+        changes = get_changes(get_base_state(base), new)
+
+        self.assertEqual(
+            changes["configuration"],
+            {
+                "name": {"hidden": True},
+                "surname": {"validate": {"required": True}},
+            },
+        )
+        self.assertEqual(changes["data"], {})
+        self.assertEqual(changes["steps"], [])
+        self.assertEqual(changes["submission"], {})
+
+    def test_data_overrides_and_step_state(self):
+        components = [{"type": "textfield", "key": "name"}]
+        base = _representation(components, data={"name": "Foo", "age": 20})
+        new = _representation(
+            components, data={"name": "Foo", "age": 21}, can_submit=False
+        )
+
+        changes = get_changes(get_base_state(base), new)
+
+        self.assertEqual(changes["data"], {"age": 21})
+        self.assertEqual(
+            changes["step"],
+            {"is_applicable": True, "completed": False, "can_submit": False},
+        )
+        self.assertEqual(
+            changes["steps"],
+            [
+                {
+                    "id": "a",
+                    "is_applicable": True,
+                    "completed": False,
+                    "can_submit": False,
+                }
+            ],
+        )
+        self.assertEqual(changes["configuration"], {})
+
+    def test_changes_not_expressible_as_delta(self):
+        components = [{"type": "textfield", "key": "name", "hidden": True}]
+        base = _representation(components, data={"name": "Foo"})
+
+        cases = (
+            ("component added", _representation([*components, {"key": "other"}])),
+            ("property removed", _representation([{"key": "name", "hidden": True}])),
+            ("data removed", _representation(components)),
+        )
+        for label, new in cases:
+            with self.subTest(label):
+                with self.assertRaises(DeltaNotPossible):
+                    get_changes(get_base_state(base), new)
+
+    def test_submission_data_not_kept_in_base_state(self):
+        representation = _representation(
+            [{"type": "textfield", "key": "bsn"}], data={"bsn": "111222333"}
+        )
+
+        base = get_base_state(representation)
+
+        self.assertNotIn("111222333", json.dumps(base))
+        self.assertEqual(base["step"]["form_step"], representation["step"]["form_step"])
+        # the unchanged value is still detected
+        self.assertEqual(get_changes(base, representation)["data"], {})
+
+
+class CheckLogicDeltaTests(SubmissionsMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        form = FormFactory.create()
+        self.form_step = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "name", "hidden": False},
+                    {"type": "textfield", "key": "surname", "hidden": False},
+                ]
+            },
+        )
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"==": [{"var": "name"}, "hide"]},
+            actions=[
+                {
+                    "component": "surname",
+                    "action": {
+                        "name": "Hide element",
+                        "type": "property",
+                        "property": {"type": "bool", "value": "hidden"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+        self.submission = SubmissionFactory.create(form=form)
+        SubmissionStepFactory.create(
+            submission=self.submission,
+            form_step=self.form_step,
+            data={"name": "show"},
+        )
+        self._add_submission_to_session(self.submission)
+        self.endpoint = reverse(
+            "api:submission-steps-logic-check",
+            kwargs={
+                "submission_uuid": self.submission.uuid,
+                "step_uuid": self.form_step.uuid,
+            },
+        )
+
+    def test_full_representation_by_default(self):
+        response = self.client.post(self.endpoint, data={"data": {"name": "hide"}})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {"submission", "step"})
+
+    def test_unknown_base_version_returns_full_representation(self):
+        response = self.client.post(
+            self.endpoint,
+            data={"data": {"name": "show"}, "delta": True, "baseVersion": "unknown"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["changes"])
+        self.assertEqual(
+            response.data["full"]["step"]["form_step"]["configuration"]["components"][
+                1
+            ]["hidden"],
+            False,
+        )
+        self.assertEqual(response["ETag"], f'"{response.data["version"]}"')
+
+    def test_changes_relative_to_base_version(self):
+        base_response = self.client.post(
+            self.endpoint, data={"data": {"name": "show"}, "delta": True}
+        )
+        base_version = base_response.data["version"]
+
+        response = self.client.post(
+            self.endpoint,
+            data={"data": {"name": "hide"}, "delta": True, "baseVersion": base_version},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["full"])
+        self.assertNotEqual(response.data["version"], base_version)
+        changes = response.data["changes"]
+        self.assertEqual(changes["configuration"], {"surname": {"hidden": True}})
+        self.assertEqual(changes["data"], {"name": "hide"})
+        self.assertTrue(changes["step"]["can_submit"])
+
+        with self.subTest("same state"):
+            repeated = self.client.post(
+                self.endpoint,
+                data={
+                    "data": {"name": "hide"},
+                    "delta": True,
+                    "baseVersion": response.data["version"],
+                },
+            )
+
+            self.assertEqual(repeated.data["version"], response.data["version"])
+            self.assertEqual(repeated.data["changes"]["configuration"], {})
+            self.assertEqual(repeated.data["changes"]["data"], {})
+
+        with self.subTest("replaced base version"):
+            outdated = self.client.post(
+                self.endpoint,
+                data={
+                    "data": {"name": "hide"},
+                    "delta": True,
+                    "baseVersion": base_version,
+                },
+            )
+
+            self.assertIsNone(outdated.data["changes"])
+            self.assertEqual(outdated.data["version"], response.data["version"])
@@ -0,0 +1,120 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormLogicFactory,
+    FormStepFactory,
+)
+
+from ...form_logic import evaluate_form_logic
+from ...logic import rules as rules_module
+from ...models import Submission
+from ..factories import SubmissionFactory, SubmissionStepFactory
+
+
+class DependencyDrivenReevaluationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form = FormFactory.create()
+        cls.step = FormStepFactory.create(
+            form=cls.form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "number", "key": "a"},
+                    {"type": "number", "key": "b"},
+                    {"type": "number", "key": "double"},
+                    {"type": "textfield", "key": "result"},
+                ]
+            },
+        )
+        # depends on a
+        FormLogicFactory.create(
+            form=cls.form,
+            order=0,
+            json_logic_trigger={"!=": [{"var": "a"}, None]},
+            actions=[
+                {
+                    "variable": "double",
+                    "action": {
+                        "type": LogicActionTypes.variable,
+                        "value": {"*": [{"var": "a"}, 2]},
+                    },
+                }
+            ],
+        )
+        # depends on b
+        FormLogicFactory.create(
+            form=cls.form,
+            order=1,
+            json_logic_trigger={">": [{"var": "b"}, 10]},
+            actions=[
+                {
+                    "component": "a",
+                    "action": {
+                        "type": LogicActionTypes.property,
+                        "property": {"value": "hidden", "type": "bool"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+        # depends on a, through the variable set by the first rule
+        FormLogicFactory.create(
+            form=cls.form,
+            order=2,
+            json_logic_trigger={">": [{"var": "double"}, 10]},
+            actions=[
+                {
+                    "variable": "result",
+                    "action": {
+                        "type": LogicActionTypes.variable,
+                        "value": "big",
+                    },
+                }
+            ],
+        )
+
+    def _evaluate(self, submission, data):
+        # use fresh instances, as evaluation is idempotent per step instance and the
+        # states are cached on the submission instance
+        submission = Submission.objects.get(pk=submission.pk)
+        submission_step = submission.submissionstep_set.get()
+        with patch.object(
+            rules_module, "_replay_rule", wraps=rules_module._replay_rule
+        ) as m_replay:
+            evaluate_form_logic(submission, submission_step, data, dirty=True)
+        state = submission.load_submission_value_variables_state()
+        return m_replay.call_count, state
+
+    def test_only_affected_rules_are_reevaluated(self):
+        submission = SubmissionFactory.create(form=self.form)
+        SubmissionStepFactory.create(
+            submission=submission, form_step=self.step, data={"a": 1, "b": 1}
+        )
+
+        num_replayed, _ = self._evaluate(submission, {"a": 1, "b": 1})
+        self.assertEqual(num_replayed, 0)
+
+        with self.subTest("no changes"):
+            num_replayed, state = self._evaluate(submission, {"a": 1, "b": 1})
+
+            self.assertEqual(num_replayed, 3)
+            self.assertEqual(state.variables["double"].value, 2)
+
+        with self.subTest("change in b"):
+            num_replayed, state = self._evaluate(submission, {"a": 1, "b": 20})
+
+            self.assertEqual(num_replayed, 2)
+            self.assertEqual(state.variables["double"].value, 2)
+
+        with self.subTest("change in a affects transitive dependent"):
+            num_replayed, state = self._evaluate(submission, {"a": 6, "b": 20})
+
+            self.assertEqual(num_replayed, 1)
+            self.assertEqual(state.variables["double"].value, 12)
+            self.assertEqual(state.variables["result"].value, "big")
@@ -0,0 +1,76 @@
+"""
+Benchmark the logic evaluation cost in relation to the number of logic rules.
+
+Wall clock timings are too noisy to assert on in CI, so instead we count the number
+of variable value conversions that are needed to build the data used for rule
+evaluation - this is the dominating factor for large forms.
+"""
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormLogicFactory,
+    FormStepFactory,
+)
+
+from ...form_logic import evaluate_form_logic
+from ...models import SubmissionValueVariable
+from ..factories import SubmissionFactory, SubmissionStepFactory
+
+NUM_COMPONENTS = 50
+
+
+def _count_conversions(num_rules: int) -> int:
+    form = FormFactory.create()
+    step = FormStepFactory.create(
+        form=form,
+        form_definition__configuration={
+            "components": [
+                {"type": "textfield", "key": f"field{index}"}
+                for index in range(NUM_COMPONENTS)
+            ]
+        },
+    )
+    for index in range(num_rules):
+        FormLogicFactory.create(
+            form=form,
+            order=index,
+            json_logic_trigger={"!=": [{"var": "field0"}, "trigger"]},
+            actions=[
+                {
+                    "variable": f"field{index % NUM_COMPONENTS}",
+                    "action": {
+                        "type": LogicActionTypes.variable,
+                        "value": {"cat": [{"var": "field0"}, f"-{index}"]},
+                    },
+                }
+            ],
+        )
+    submission = SubmissionFactory.create(form=form)
+    submission_step = SubmissionStepFactory.create(
+        submission=submission, form_step=step, data={"field0": "start"}
+    )
+
+    with patch.object(
+        SubmissionValueVariable,
+        "to_python",
+        autospec=True,
+        side_effect=SubmissionValueVariable.to_python,
+    ) as m_to_python:
+        evaluate_form_logic(submission, submission_step, {"field0": "start"})
+
+    return m_to_python.call_count
+
+
+class RuleEvaluationScalingTests(TestCase):
+    def test_data_conversions_scale_linearly_with_rule_count(self):
+        small = _count_conversions(num_rules=25)
+        large = _count_conversions(num_rules=100)
+
+        # every triggered rule updates exactly one variable, which should only cause
+        # that single variable to be converted again
+        self.assertEqual(large - small, 100 - 25)
+        self.assertLess(small, NUM_COMPONENTS * 2 + 25)
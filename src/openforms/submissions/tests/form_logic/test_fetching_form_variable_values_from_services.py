@@ -4,6 +4,7 @@ from typing import Any
 from unittest import skip
 from urllib.parse import unquote
 
+from django.core.cache import cache
 from django.test import SimpleTestCase, tag
 
 import requests_mock
@@ -16,11 +17,16 @@ from openforms.forms.tests.factories import FormVariableFactory
 from openforms.tests.utils import c_profile
 from openforms.utils.tests.nlx import DisableNLXRewritingMixin
 from openforms.variables.constants import DataMappingTypes
+from openforms.variables.service_fetch_statistics import get_cache_statistics
 from openforms.variables.tests.factories import ServiceFetchConfigurationFactory
 from openforms.variables.validators import HeaderValidator, ValidationError
 from zgw_consumers_ext.tests.factories import ServiceFactory
 
-from ...logic.service_fetching import perform_service_fetch
+from ...logic.service_fetching import (
+    get_cache_key,
+    invalidate_cache,
+    perform_service_fetch,
+)
 
 DEFAULT_REQUEST_HEADERS = {
     "Accept",
@@ -416,3 +422,63 @@ class ServiceFetchConfigVariableBindingTests(DisableNLXRewritingMixin, SimpleTes
 
         with self.assertRaises(ValueError):
             perform_service_fetch(var, {})
+
+
+class ServiceFetchCacheTests(DisableNLXRewritingMixin, SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.service = ServiceFactory.build(
+            id=1,
+            api_root="https://httpbin.org/",
+            auth_type=AuthTypes.no_auth,
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(cache.clear)
+        self.fetch_config = ServiceFetchConfigurationFactory.build(
+            id=42, service=self.service, path="get"
+        )
+
+    def test_cache_key_is_deterministic(self):
+        request_args = {"method": "GET", "url": "get", "params": {"a": ["1"]}}
+
+        key1 = get_cache_key(self.fetch_config, "submission-uuid", dict(request_args))
+        key2 = get_cache_key(
+            self.fetch_config, "submission-uuid", dict(reversed(request_args.items()))
+        )
+        key3 = get_cache_key(self.fetch_config, "other-uuid", request_args)
+
+        self.assertIsInstance(key1, str)
+        self.assertTrue(key1.startswith("service_fetch:42:"))
+        self.assertEqual(key1, key2)
+        self.assertNotEqual(key1, key3)
+
+    @requests_mock.Mocker()
+    def test_results_are_cached_per_submission(self, m):
+        m.get("https://httpbin.org/get", json={"url": "https://httpbin.org/get"})
+        var = FormVariableFactory.build(service_fetch_configuration=self.fetch_config)
+
+        perform_service_fetch(var, {}, "submission-uuid")
+        perform_service_fetch(var, {}, "submission-uuid")
+        perform_service_fetch(var, {}, "other-uuid")
+
+        self.assertEqual(len(m.request_history), 2)
+        self.assertEqual(
+            get_cache_statistics(self.fetch_config), {"hits": 1, "misses": 2}
+        )
+
+    @requests_mock.Mocker()
+    def test_invalidation(self, m):
+        m.get("https://httpbin.org/get", json={"url": "https://httpbin.org/get"})
+        var = FormVariableFactory.build(service_fetch_configuration=self.fetch_config)
+        perform_service_fetch(var, {}, "submission-uuid")
+
+        invalidate_cache(self.fetch_config.pk)
+        perform_service_fetch(var, {}, "submission-uuid")
+
+        self.assertEqual(len(m.request_history), 2)
+        self.assertEqual(
+            get_cache_statistics(self.fetch_config), {"hits": 0, "misses": 2}
+        )
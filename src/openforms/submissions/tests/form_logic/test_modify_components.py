@@ -1045,3 +1045,49 @@ class ComponentModificationTests(TestCase):
         evaluate_form_logic(submission, submission_step, submission.data, dirty=True)
 
         self.assertEqual(submission_step.data["textField"], "Test value")
+
+    def test_form_definition_configuration_not_mutated(self):
+        form = FormFactory.create()
+        step = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "trigger"},
+                    {"type": "textfield", "key": "target", "hidden": False},
+                ]
+            },
+        )
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"==": [{"var": "trigger"}, "hide"]},
+            actions=[
+                {
+                    "component": "target",
+                    "action": {
+                        "type": LogicActionTypes.property,
+                        "property": {"value": "hidden", "type": "bool"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+        submission = SubmissionFactory.create(form=form)
+        submission_step = SubmissionStepFactory.create(
+            submission=submission, form_step=step, data={"trigger": "hide"}
+        )
+        form_definition = submission_step.form_step.form_definition
+
+        configuration = evaluate_form_logic(
+            submission, submission_step, submission.data
+        )
+
+        self.assertTrue(configuration["components"][1]["hidden"])
+        self.assertFalse(form_definition.configuration["components"][1]["hidden"])
+        self.assertFalse(
+            form_definition.configuration_wrapper["target"]["hidden"],
+        )
+        with self.subTest("idempotent"):
+            self.assertIs(
+                evaluate_form_logic(submission, submission_step, submission.data),
+                configuration,
+            )
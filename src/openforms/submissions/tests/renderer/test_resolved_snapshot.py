@@ -0,0 +1,200 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormLogicFactory,
+    FormStepFactory,
+)
+from openforms.variables.constants import FormVariableSources
+
+from ...models import Submission
+from ...rendering import Renderer, RenderModes
+from ...rendering.snapshot import SNAPSHOT_VERSION, build_resolved_snapshot
+from ...tasks import record_resolved_snapshot
+from ..factories import (
+    SubmissionFactory,
+    SubmissionStepFactory,
+    SubmissionValueVariableFactory,
+)
+
+
+class ResolvedSnapshotTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        form = FormFactory.create()
+        step1 = FormStepFactory.create(
+            form=form,
+            form_definition__name="Step 1",
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "input1", "label": "Input 1"},
+                    {"type": "textfield", "key": "input2", "label": "Input 2"},
+                ]
+            },
+        )
+        step2 = FormStepFactory.create(
+            form=form,
+            form_definition__name="Step 2",
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "input3", "label": "Input 3"},
+                ]
+            },
+        )
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"==": [{"var": "input1"}, "hide"]},
+            actions=[
+                {
+                    "component": "input2",
+                    "action": {
+                        "type": LogicActionTypes.property,
+                        "property": {"value": "hidden", "type": "bool"},
+                        "state": True,
+                    },
+                },
+                {
+                    "form_step_uuid": f"{step2.uuid}",
+                    "action": {"type": LogicActionTypes.step_not_applicable},
+                },
+            ],
+        )
+        cls.submission = SubmissionFactory.create(form=form, completed=True)
+        SubmissionStepFactory.create(
+            submission=cls.submission,
+            form_step=step1,
+            data={"input1": "hide", "input2": "hidden value"},
+        )
+        SubmissionValueVariableFactory.create(
+            key="ud1",
+            value="Some data",
+            submission=cls.submission,
+            form_variable__source=FormVariableSources.user_defined,
+            form_variable__name="User defined var",
+        )
+        cls.step1, cls.step2 = step1, step2
+
+    def _render(self, mode=RenderModes.pdf):
+        submission = Submission.objects.get(pk=self.submission.pk)
+        renderer = Renderer(submission=submission, mode=mode, as_html=False)
+        return [node.render() for node in renderer if node.is_visible]
+
+    def test_build_snapshot(self):
+        submission = Submission.objects.get(pk=self.submission.pk)
+
+        snapshot = build_resolved_snapshot(submission)
+
+        self.assertEqual(snapshot["version"], SNAPSHOT_VERSION)
+        self.assertEqual(snapshot["variables"], {"ud1": "Some data"})
+        step1_snapshot, step2_snapshot = snapshot["steps"]
+        self.assertEqual(step1_snapshot["form_step"], str(self.step1.uuid))
+        self.assertTrue(step1_snapshot["is_applicable"])
+        # only the changes compared to the form definition are recorded
+        self.assertIsNone(step1_snapshot["configuration"])
+        self.assertEqual(
+            step1_snapshot["configuration_hash"],
+            self.step1.form_definition.get_configuration_hash(),
+        )
+        self.assertEqual(step1_snapshot["component_changes"]["input2"]["hidden"], True)
+        self.assertEqual(step1_snapshot["data"]["input1"], "hide")
+        self.assertEqual(
+            step2_snapshot,
+            {
+                "form_step": str(self.step2.uuid),
+                "is_applicable": False,
+                "configuration_hash": "",
+                "component_changes": {},
+                "removed_properties": {},
+                "configuration": None,
+                "data": {},
+            },
+        )
+
+    def test_rendering_from_snapshot_does_not_evaluate_logic(self):
+        expected = self._render(mode=RenderModes.registration)
+        Submission.objects.filter(pk=self.submission.pk).update(
+            resolved_snapshot=build_resolved_snapshot(
+                Submission.objects.get(pk=self.submission.pk)
+            )
+        )
+
+        with patch(
+            "openforms.submissions.rendering.renderer.evaluate_form_logic"
+        ) as m_evaluate:
+            rendered = self._render(mode=RenderModes.registration)
+
+        m_evaluate.assert_not_called()
+        self.assertEqual(rendered, expected)
+        self.assertIn("Input 1: hide", rendered)
+        self.assertNotIn("Input 2: hidden value", rendered)
+        self.assertNotIn("Step 2", rendered)
+        self.assertIn("User defined var: Some data", rendered)
+
+    def test_outdated_snapshot_falls_back_to_logic_evaluation(self):
+        snapshot = build_resolved_snapshot(
+            Submission.objects.get(pk=self.submission.pk)
+        )
+        snapshot["steps"].pop()
+        Submission.objects.filter(pk=self.submission.pk).update(
+            resolved_snapshot=snapshot
+        )
+
+        with patch(
+            "openforms.submissions.rendering.renderer.evaluate_form_logic",
+            return_value={"components": []},
+        ) as m_evaluate:
+            self._render()
+
+        self.assertEqual(m_evaluate.call_count, 2)
+
+    def test_changed_form_definition_falls_back_to_logic_evaluation(self):
+        Submission.objects.filter(pk=self.submission.pk).update(
+            resolved_snapshot=build_resolved_snapshot(
+                Submission.objects.get(pk=self.submission.pk)
+            )
+        )
+        form_definition = self.step1.form_definition
+        form_definition.configuration["components"][0]["label"] = "Changed"
+        form_definition.save()
+
+        with patch(
+            "openforms.submissions.rendering.renderer.evaluate_form_logic",
+            return_value={"components": []},
+        ) as m_evaluate:
+            self._render()
+
+        self.assertEqual(m_evaluate.call_count, 2)
+
+    def test_snapshot_recorded_in_completion_task(self):
+        record_resolved_snapshot(self.submission.pk)
+
+        self.submission.refresh_from_db()
+        self.assertEqual(self.submission.resolved_snapshot["version"], SNAPSHOT_VERSION)
+
+    def test_snapshot_errors_do_not_fail_the_task(self):
+        with (
+            patch(
+                "openforms.submissions.tasks.snapshot.build_resolved_snapshot",
+                side_effect=Exception("boom"),
+            ),
+            self.assertLogs("openforms.submissions.tasks.snapshot", level="ERROR"),
+        ):
+            record_resolved_snapshot(self.submission.pk)
+
+        self.submission.refresh_from_db()
+        self.assertEqual(self.submission.resolved_snapshot, {})
+
+    def test_snapshot_cleared_with_sensitive_data(self):
+        submission = Submission.objects.get(pk=self.submission.pk)
+        submission.resolved_snapshot = build_resolved_snapshot(submission)
+        submission.save()
+
+        submission.remove_sensitive_data()
+
+        submission.refresh_from_db()
+        self.assertEqual(submission.resolved_snapshot, {})
@@ -1,14 +1,24 @@
+import json
 from datetime import datetime
+from io import BytesIO
 
+from django.db import connection
 from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
+import tablib
 from freezegun import freeze_time
 
 from openforms.forms.tests.factories import FormFactory, FormStepFactory
 from openforms.variables.constants import FormVariableSources
 
-from ..exports import create_submission_export
+from ..exports import (
+    ExportFileTypes,
+    create_submission_export,
+    iter_export_rows,
+    write_submissions_export,
+)
 from ..models import Submission
 from .factories import (
     SubmissionFactory,
@@ -266,3 +276,94 @@ class ExportTests(TestCase):
         export = create_submission_export(Submission.objects.all())
 
         self.assertIn(("Taalcode", "en"), zip(export.headers, export[0]))
+
+
+class StreamingExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form = FormFactory.create(name="Streaming export")
+        cls.form_step = FormStepFactory.create(
+            form=cls.form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "input1"},
+                    {"type": "textfield", "key": "input2"},
+                ]
+            },
+        )
+
+    def _create_submissions(self, num: int):
+        for index in range(num):
+            submission = SubmissionFactory.create(form=self.form, completed=True)
+            SubmissionStepFactory.create(
+                submission=submission,
+                form_step=self.form_step,
+                data={"input1": f"value {index}"},
+            )
+
+    def test_steps_and_variables_fetched_in_bulk(self):
+        self._create_submissions(5)
+
+        with CaptureQueriesContext(connection) as context:
+            rows = list(iter_export_rows(Submission.objects.order_by("pk")))
+
+        self.assertEqual(len(rows), 6)
+        for table in (
+            "submissions_submissionstep",
+            "submissions_submissionvaluevariable",
+        ):
+            with self.subTest(table=table):
+                queries = [
+                    query["sql"]
+                    for query in context.captured_queries
+                    if f'FROM "{table}"' in query["sql"]
+                ]
+                self.assertEqual(len(queries), 1)
+
+    def test_streamed_formats_match_dataset(self):
+        self._create_submissions(3)
+        queryset = Submission.objects.order_by("pk")
+        dataset = create_submission_export(queryset)
+
+        with self.subTest("csv"):
+            outfile = BytesIO()
+            write_submissions_export(queryset, ExportFileTypes.CSV, outfile)
+
+            self.assertEqual(outfile.getvalue().decode("utf8"), dataset.export("csv"))
+
+        with self.subTest("json"):
+            outfile = BytesIO()
+            write_submissions_export(queryset, ExportFileTypes.JSON, outfile)
+
+            self.assertEqual(
+                json.loads(outfile.getvalue()), json.loads(dataset.export("json"))
+            )
+
+        with self.subTest("xml"):
+            outfile = BytesIO()
+            write_submissions_export(queryset, ExportFileTypes.XML, outfile)
+
+            self.assertEqual(
+                outfile.getvalue().replace(b" ", b"").replace(b"\n", b""),
+                dataset.export("xml").replace(b" ", b"").replace(b"\n", b""),
+            )
+
+        with self.subTest("xlsx"):
+            outfile = BytesIO()
+            write_submissions_export(queryset, ExportFileTypes.XLSX, outfile)
+
+            loaded = tablib.Dataset().load(outfile.getvalue(), format="xlsx")
+            self.assertEqual(loaded.headers, dataset.headers)
+            self.assertEqual(len(loaded), 3)
+            self.assertEqual(loaded[0][2], "value 0")
+
+    def test_empty_queryset(self):
+        outfile = BytesIO()
+
+        write_submissions_export(
+            Submission.objects.none(), ExportFileTypes.JSON, outfile
+        )
+
+        self.assertEqual(outfile.getvalue(), b"[]")
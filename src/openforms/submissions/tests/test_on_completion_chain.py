@@ -7,12 +7,22 @@ from django.test import TestCase, override_settings
 from privates.test import temp_private_root
 
 from openforms.appointments.exceptions import AppointmentRegistrationFailed
+from openforms.appointments.tasks import maybe_register_appointment
 from openforms.appointments.tests.utils import setup_jcc
 from openforms.emails.tests.factories import ConfirmationEmailTemplateFactory
 from openforms.forms.tests.factories import FormDefinitionFactory
 
 from ..models import SubmissionReport, TemporaryFileUpload
-from ..tasks import on_completion
+from ..tasks import (
+    finalize_completion,
+    generate_submission_report,
+    on_completion,
+    pre_registration,
+    process_submission_attachments,
+    record_resolved_snapshot,
+    register_submission,
+    send_email_cosigner,
+)
 from .factories import SubmissionFactory, SubmissionFileAttachmentFactory
 
 
@@ -41,7 +51,8 @@ class OnCompletionTests(TestCase):
             submission_step=submission.submissionstep_set.first()
         )
 
-        on_completion(submission.id)
+        with self.assertLogs("openforms.submissions.tasks", level="INFO") as logs:
+            on_completion(submission.id)
 
         submission.refresh_from_db()
         for task_id in submission.on_completion_task_ids:
@@ -52,8 +63,11 @@ class OnCompletionTests(TestCase):
                     self.fail("Invalid task ID returned")
 
         self.assertEqual(
-            len(submission.on_completion_task_ids), 6
-        )  # 6 tasks in the chain
+            len(set(submission.on_completion_task_ids)), 8
+        )  # 8 tasks in the workflow
+        stage_logs = [record for record in logs.records if hasattr(record, "duration")]
+        self.assertEqual(len(stage_logs), 8)
+        self.assertTrue(submission.resolved_snapshot)
         # registration result reference
         self.assertTrue(submission.public_registration_reference.startswith("OF-"))
         self.assertTrue(SubmissionReport.objects.filter(submission=submission).exists())
@@ -62,6 +76,31 @@ class OnCompletionTests(TestCase):
             len(mail.outbox), 2
         )  # registration backend + confirmation email
 
+    def test_independent_stages_run_in_parallel(self):
+        submission = SubmissionFactory.create(completed=True)
+
+        with patch("celery.canvas._chain.delay", autospec=True) as mock_delay:
+            on_completion(submission.id)
+
+        workflow = mock_delay.call_args.args[0]
+        *serial_stages, completion = workflow.tasks
+        self.assertEqual(
+            [stage.task for stage in serial_stages],
+            [
+                maybe_register_appointment.name,
+                pre_registration.name,
+                record_resolved_snapshot.name,
+            ],
+        )
+        self.assertEqual(completion.body.task, finalize_completion.name)
+        send_email_cosigner_stage, registration = completion.tasks
+        self.assertEqual(send_email_cosigner_stage.task, send_email_cosigner.name)
+        self.assertEqual(
+            [stage.task for stage in registration.tasks],
+            [process_submission_attachments.name, generate_submission_report.name],
+        )
+        self.assertEqual(registration.body.task, register_submission.name)
+
     def test_submission_form_with_incomplete_appointment(self):
         setup_jcc()
         components = FormDefinitionFactory.build(is_appointment=True).configuration[
@@ -252,11 +252,21 @@ class OnCompletionRetryFailedRegistrationTests(TestCase):
             },
         )
 
-        with preregistration_patcher, registration_patcher as mock_register:
+        resize_patcher = patch(
+            "openforms.submissions.tasks.user_uploads.resize_submission_attachments"
+        )
+
+        with (
+            preregistration_patcher,
+            registration_patcher as mock_register,
+            resize_patcher as mock_resize,
+        ):
             # invoke the chain
             on_completion_retry(submission.id)()
 
         submission.refresh_from_db()
+        # attachments that were not processed before are processed before registering
+        mock_resize.assert_called_once_with(submission)
         mock_register.assert_called_once()
         # downstream tasks should not have been called - chain should abort
         mock_update_payment.assert_called_once_with(submission)
@@ -273,6 +283,11 @@ class RetrySubmissionTest(TestCase):
             registration_failed=True,
             needs_on_completion_retry=True,
             completed_on=timezone.now(),
+            # past the backoff delay of the first retry
+            last_register_date=(
+                timezone.now()
+                - timedelta(seconds=settings.REGISTRATION_RETRY_BACKOFF_BASE)
+            ),
         )
         # Outside time limit
         SubmissionFactory.create(
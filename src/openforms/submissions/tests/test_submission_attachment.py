@@ -1,3 +1,4 @@
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import patch
 
@@ -16,11 +17,13 @@ from openforms.forms.tests.factories import FormStepFactory
 from openforms.tests.utils import disable_2fa
 
 from ..attachments import (
+    _resize_image,
     append_file_num_postfix,
     attach_uploads_to_submission_step,
     clean_mime_type,
     cleanup_submission_temporary_uploaded_files,
     resize_attachment,
+    resize_submission_attachments,
     resolve_uploads_from_data,
     validate_uploads,
 )
@@ -1013,10 +1016,16 @@ class SubmissionAttachmentTest(TestCase):
         self.assertEqual(result[0][1], True)  # created new
         self.assertEqual(SubmissionFileAttachment.objects.count(), 1)
 
-        # verify resize
+        # the image is resized when the submission is processed after completion, not
+        # when it's attached - that would race with the registration (#507)
         attachment = submission_step.attachments.get()
         self.assertEqual(attachment.form_key, "my_file")
         self.assertEqual(attachment.original_name, "my-image.png")
+        self.assertImageSize(attachment.content, 256, 256, "png")
+
+        resize_submission_attachments(submission_step.submission)
+
+        attachment.refresh_from_db()
         self.assertImageSize(attachment.content, 100, 100, "png")
 
     def test_attach_upload_larger_than_configured_max_size_raises_413(self):
@@ -1467,6 +1476,156 @@ class SubmissionAttachmentTest(TestCase):
         res = resize_attachment(attachment_bad, (1024, 1024))
         self.assertEqual(res, False)
 
+    @override_settings(ATTACHMENT_RESIZE_MAX_MEMORY=1_000)
+    def test_resize_attachment_memory_limit(self):
+        with open(self.test_image_path, "rb") as f:
+            data = f.read()
+        attachment = SubmissionFileAttachmentFactory.create(
+            content__name="my-image.png", content__data=data
+        )
+
+        res = resize_attachment(attachment, (200, 200))
+
+        self.assertEqual(res, False)
+        self.assertImageSize(attachment.content, 256, 256, "png")
+
+    @override_settings(ATTACHMENT_RESIZE_MAX_MEMORY=1_000_000)
+    def test_resize_large_jpeg_decoded_at_reduced_scale(self):
+        # a full decode takes 2000 * 2000 * 3 bytes, exceeding the memory limit
+        buffer = BytesIO()
+        Image.new("RGB", (2000, 2000)).save(buffer, "jpeg")
+        attachment = SubmissionFileAttachmentFactory.create(
+            content__name="my-image.jpg", content__data=buffer.getvalue()
+        )
+
+        res = resize_attachment(attachment, (200, 200))
+
+        self.assertEqual(res, True)
+        self.assertImageSize(attachment.content, 200, 200, "jpeg")
+
+    def test_resize_submission_attachments(self):
+        with open(self.test_image_path, "rb") as f:
+            data = f.read()
+        submission_step = SubmissionStepFactory.create(
+            form_step__form_definition__configuration={
+                "components": [
+                    {
+                        "type": "file",
+                        "key": "image",
+                        "of": {
+                            "image": {
+                                "resize": {"apply": True, "width": 100, "height": 100}
+                            }
+                        },
+                    },
+                    {"type": "file", "key": "notResized"},
+                ]
+            }
+        )
+        # the same image uploaded twice
+        attachment1, attachment2 = SubmissionFileAttachmentFactory.create_batch(
+            2,
+            submission_step=submission_step,
+            content__name="my-image.png",
+            content__data=data,
+            _component_configuration_path="components.0",
+        )
+        not_resized = SubmissionFileAttachmentFactory.create(
+            submission_step=submission_step,
+            content__name="my-image.png",
+            content__data=data,
+            _component_configuration_path="components.1",
+        )
+
+        with patch(
+            "openforms.submissions.attachments._resize_image",
+            wraps=_resize_image,
+        ) as m_resize:
+            resize_submission_attachments(submission_step.submission)
+
+        m_resize.assert_called_once()
+        for attachment in (attachment1, attachment2):
+            attachment.refresh_from_db()
+            self.assertImageSize(attachment.content, 100, 100, "png")
+        not_resized.refresh_from_db()
+        self.assertImageSize(not_resized.content, 256, 256, "png")
+
+    def test_resize_submission_attachments_is_best_effort(self):
+        with open(self.test_image_path, "rb") as f:
+            data = f.read()
+        submission_step = SubmissionStepFactory.create(
+            form_step__form_definition__configuration={
+                "components": [
+                    {
+                        "type": "file",
+                        "key": "image",
+                        "of": {
+                            "image": {
+                                "resize": {"apply": True, "width": 100, "height": 100}
+                            }
+                        },
+                    },
+                ]
+            }
+        )
+        # a truncated image can be opened, but not decoded
+        corrupt = SubmissionFileAttachmentFactory.create(
+            submission_step=submission_step,
+            content__name="corrupt.png",
+            content__data=data[: len(data) // 2],
+            _component_configuration_path="components.0",
+        )
+        attachment = SubmissionFileAttachmentFactory.create(
+            submission_step=submission_step,
+            content__name="my-image.png",
+            content__data=data,
+            _component_configuration_path="components.0",
+        )
+
+        with self.assertLogs("openforms.submissions.attachments", "ERROR") as logs:
+            resize_submission_attachments(submission_step.submission)
+
+        self.assertIn(str(corrupt.uuid), logs.output[0])
+        corrupt.refresh_from_db()
+        with corrupt.content.open("rb") as content:
+            self.assertEqual(content.read(), data[: len(data) // 2])
+        attachment.refresh_from_db()
+        self.assertImageSize(attachment.content, 100, 100, "png")
+
+    def test_resize_submission_attachments_storage_error(self):
+        with open(self.test_image_path, "rb") as f:
+            data = f.read()
+        submission_step = SubmissionStepFactory.create(
+            form_step__form_definition__configuration={
+                "components": [
+                    {
+                        "type": "file",
+                        "key": "image",
+                        "of": {
+                            "image": {
+                                "resize": {"apply": True, "width": 100, "height": 100}
+                            }
+                        },
+                    },
+                ]
+            }
+        )
+        SubmissionFileAttachmentFactory.create(
+            submission_step=submission_step,
+            content__name="my-image.png",
+            content__data=data,
+            _component_configuration_path="components.0",
+        )
+
+        with (
+            patch(
+                "openforms.submissions.attachments._resize_image",
+                side_effect=OSError("Storage unavailable"),
+            ),
+            self.assertLogs("openforms.submissions.attachments", "ERROR"),
+        ):
+            resize_submission_attachments(submission_step.submission)
+
     def test_append_file_num_postfix_helper(self):
         actual = append_file_num_postfix("orginal.txt", "new.bin", 1, 1)
         self.assertEqual("new.txt", actual)
@@ -1,9 +1,11 @@
+import itertools
 from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils import timezone
+from django.utils.translation import get_language
 
 from celery import states
 from freezegun import freeze_time
@@ -16,9 +18,11 @@ from openforms.appointments.tests.factories import AppointmentInfoFactory
 from openforms.payments.constants import PaymentStatus
 from openforms.payments.contrib.ogone.tests.factories import OgoneMerchantFactory
 from openforms.payments.tests.factories import SubmissionPaymentFactory
+from openforms.utils.tests.cache import clear_caches
 
 from ...config.models import GlobalConfiguration
 from ..constants import SUBMISSIONS_SESSION_KEY, ProcessingResults, ProcessingStatuses
+from ..status import notify_status_change
 from ..tasks import cleanup_on_completion_results
 from ..tokens import submission_status_token_generator
 from .factories import SubmissionFactory, SubmissionReportFactory
@@ -88,6 +92,11 @@ class SubmissionStatusPermissionTests(APITestCase):
 
 
 class SubmissionStatusStatusAndResultTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+
     def test_no_task_id_registered(self):
         submission = SubmissionFactory.create(completed=True, on_completion_task_ids=[])
         token = submission_status_token_generator.make_token(submission)
@@ -152,6 +161,8 @@ class SubmissionStatusStatusAndResultTests(APITestCase):
         with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
             for state in finished_states:
                 with self.subTest(celery_state=state):
+                    # the outcome is cached once the processing is done
+                    clear_caches()
                     mock_AsyncResult.return_value.state = state
 
                     response = self.client.get(check_status_url)
@@ -178,6 +189,8 @@ class SubmissionStatusStatusAndResultTests(APITestCase):
         with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
             for state, expected_result in expected:
                 with self.subTest(celery_state=state):
+                    # the outcome is cached once the processing is done
+                    clear_caches()
                     mock_AsyncResult.return_value.state = state
 
                     response = self.client.get(check_status_url)
@@ -222,6 +235,11 @@ class SubmissionStatusExtraInformationTests(APITestCase):
     Only when the status is 'done' should these fields emit data.
     """
 
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+
     def test_succesful_processing(self):
         submission = SubmissionFactory.create(
             completed=True,
@@ -398,6 +416,154 @@ class SubmissionStatusExtraInformationTests(APITestCase):
             self.assertEqual(response_data["paymentUrl"], "")
 
 
+@temp_private_root()
+@override_settings(SUBMISSION_STATUS_MAX_WAIT=5)
+class SubmissionStatusCachingAndWaitTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+        self.submission = SubmissionFactory.create(
+            completed=True,
+            on_completion_task_ids=["some-id"],
+            form__submission_confirmation_template="You get a cookie!",
+        )
+        SubmissionReportFactory.create(submission=self.submission)
+        token = submission_status_token_generator.make_token(self.submission)
+        self.check_status_url = reverse(
+            "api:submission-status",
+            kwargs={"uuid": self.submission.uuid, "token": token},
+        )
+
+    def test_outcome_cached_once_done(self):
+        with (
+            patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult,
+            patch(
+                "openforms.submissions.models.Submission.render_confirmation_page",
+                return_value="You get a cookie!",
+            ) as mock_render,
+        ):
+            mock_AsyncResult.return_value.state = states.SUCCESS
+            self.client.get(self.check_status_url)
+            mock_AsyncResult.reset_mock()
+
+            response = self.client.get(self.check_status_url)
+
+        mock_AsyncResult.assert_not_called()
+        mock_render.assert_called_once()
+        response_data = response.json()
+        self.assertEqual(response_data["status"], ProcessingStatuses.done)
+        self.assertEqual(response_data["result"], ProcessingResults.success)
+        self.assertEqual(response_data["confirmationPageContent"], "You get a cookie!")
+        self.assertTrue(
+            response_data["reportDownloadUrl"].startswith("http://testserver")
+        )
+
+    def test_outcome_cached_per_language(self):
+        with (
+            patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult,
+            patch(
+                "openforms.submissions.models.Submission.render_confirmation_page",
+                side_effect=lambda: f"Confirmation ({get_language()})",
+            ) as mock_render,
+        ):
+            mock_AsyncResult.return_value.state = states.SUCCESS
+
+            response_nl = self.client.get(
+                self.check_status_url, HTTP_ACCEPT_LANGUAGE="nl"
+            )
+            response_en = self.client.get(
+                self.check_status_url, HTTP_ACCEPT_LANGUAGE="en"
+            )
+
+        self.assertEqual(mock_render.call_count, 2)
+        self.assertEqual(
+            response_nl.json()["confirmationPageContent"], "Confirmation (nl)"
+        )
+        self.assertEqual(
+            response_en.json()["confirmationPageContent"], "Confirmation (en)"
+        )
+
+    def test_outcome_not_cached_while_in_progress(self):
+        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
+            mock_AsyncResult.return_value.state = states.STARTED
+            self.client.get(self.check_status_url)
+            mock_AsyncResult.return_value.state = states.SUCCESS
+
+            response = self.client.get(self.check_status_url)
+
+        self.assertEqual(response.json()["status"], ProcessingStatuses.done)
+
+    def test_wait_until_stage_finished(self):
+        def finish_processing(seconds):
+            mock_AsyncResult.return_value.state = states.SUCCESS
+            notify_status_change(self.submission.id)
+
+        with (
+            patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult,
+            patch(
+                "openforms.submissions.status.time.sleep",
+                side_effect=finish_processing,
+            ) as mock_sleep,
+        ):
+            mock_AsyncResult.return_value.state = states.STARTED
+
+            response = self.client.get(self.check_status_url, {"wait": 5})
+
+        mock_sleep.assert_called_once()
+        response_data = response.json()
+        self.assertEqual(response_data["status"], ProcessingStatuses.done)
+        self.assertEqual(response_data["confirmationPageContent"], "You get a cookie!")
+
+    def test_results_not_checked_again_without_finished_stage(self):
+        with (
+            patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult,
+            patch("openforms.submissions.status.time.sleep"),
+            patch(
+                "openforms.submissions.status.time.monotonic",
+                side_effect=itertools.count(),
+            ),
+        ):
+            mock_AsyncResult.return_value.state = states.STARTED
+
+            response = self.client.get(self.check_status_url, {"wait": 5})
+
+        # only checked before waiting
+        mock_AsyncResult.assert_called_once_with("some-id")
+        self.assertEqual(response.json()["status"], ProcessingStatuses.in_progress)
+
+    @override_settings(SUBMISSION_STATUS_MAX_WAIT=60)
+    def test_wait_capped(self):
+        with (
+            patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult,
+            patch("openforms.submissions.status.time.sleep") as mock_sleep,
+            patch(
+                "openforms.submissions.status.time.monotonic",
+                side_effect=itertools.count(),
+            ),
+        ):
+            mock_AsyncResult.return_value.state = states.STARTED
+
+            response = self.client.get(self.check_status_url, {"wait": 60})
+
+        # one second passes for every check of the deadline, capped at 5 seconds
+        self.assertLessEqual(mock_sleep.call_count, 4)
+        self.assertEqual(response.json()["status"], ProcessingStatuses.in_progress)
+
+    @override_settings(SUBMISSION_STATUS_MAX_WAIT=0)
+    def test_waiting_disabled(self):
+        with (
+            patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult,
+            patch("openforms.submissions.status.time.sleep") as mock_sleep,
+        ):
+            mock_AsyncResult.return_value.state = states.STARTED
+
+            response = self.client.get(self.check_status_url, {"wait": 5})
+
+        mock_sleep.assert_not_called()
+        self.assertEqual(response.json()["status"], ProcessingStatuses.in_progress)
+
+
 @patch("openforms.submissions.status.AsyncResult.forget", return_value=None)
 class CleanupTaskTests(TestCase):
     def test_incomplete_submission(self, mock_forget):
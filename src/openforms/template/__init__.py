@@ -6,26 +6,48 @@ The ``template`` package provides generic template rendering constructs. Feature
 * Option to sandbox templates to only allow safe-ish public API
 * Utilities to evaluate templates from string (user-contributed content and inherently
   unsafe).
+* Caching for string-based templates - the parsed templates are kept in a bounded
+  (per-process) LRU cache.
+"""
+from functools import lru_cache
 
-Possible future features:
+from django.utils.safestring import mark_safe
 
-* Caching for string-based templates
-* ...
-"""
 from .backends.sandboxed_django import backend as sandbox_backend, openforms_backend
 
 __all__ = ["render_from_string", "parse", "sandbox_backend", "openforms_backend"]
 
+TEMPLATE_CACHE_SIZE = 1024
+# the template engine leaves source strings without any of these markers untouched
+TEMPLATE_MARKERS = ("{{", "{%", "{#")
+
+
+def has_template_syntax(source: str) -> bool:
+    return any(marker in source for marker in TEMPLATE_MARKERS)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _parse(source: str, backend):
+    # Compiled Django templates don't hold any render state and are safe to share
+    # between threads. Note that exceptions (syntax errors) are not cached.
+    return backend.from_string(source)
+
 
 def parse(source: str, backend=sandbox_backend):
     """
     Parse the template fragment using the specified backend.
 
+    Parsed templates are cached by source and backend.
+
     :returns: A template instance of the specified backend
     :raises: :class:`django.template.TemplateSyntaxError` if there are any
       syntax errors
     """
-    return backend.from_string(source)
+    return _parse(source, backend)
+
+
+def clear_template_cache() -> None:
+    _parse.cache_clear()
 
 
 def render_from_string(
@@ -45,6 +67,10 @@ def render_from_string(
     :raises: :class:`django.template.TemplateSyntaxError` if the template source is
       invalid
     """
+    # fast path - plain text is output as-is by the template engine
+    if not has_template_syntax(source):
+        return mark_safe(source)
+
     if disable_autoescape:
         source = f"{{% autoescape off %}}{source}{{% endautoescape %}}"
     template = parse(source, backend=backend)
@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from django.template import TemplateSyntaxError
+from django.test import SimpleTestCase
+
+from .. import (
+    clear_template_cache,
+    openforms_backend,
+    parse,
+    render_from_string,
+    sandbox_backend,
+)
+
+
+class TemplateCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        clear_template_cache()
+        self.addCleanup(clear_template_cache)
+
+    def test_parsed_templates_are_reused(self):
+        template1 = parse("{{ foo }}")
+        template2 = parse("{{ foo }}")
+
+        self.assertIs(template1, template2)
+
+    def test_cache_is_keyed_by_backend(self):
+        template1 = parse("{{ foo }}", backend=sandbox_backend)
+        template2 = parse("{{ foo }}", backend=openforms_backend)
+
+        self.assertIsNot(template1, template2)
+
+    def test_syntax_errors_are_not_cached(self):
+        with patch.object(
+            sandbox_backend, "from_string", wraps=sandbox_backend.from_string
+        ) as m_from_string:
+            for _ in range(2):
+                with self.assertRaises(TemplateSyntaxError):
+                    render_from_string("{% invalid %}", {})
+
+        self.assertEqual(m_from_string.call_count, 2)
+
+    def test_plain_text_skips_template_engine(self):
+        with patch.object(sandbox_backend, "from_string") as m_from_string:
+            result = render_from_string("Just <b>text</b>", {"foo": "bar"})
+
+        self.assertEqual(result, "Just <b>text</b>")
+        m_from_string.assert_not_called()
+
+    def test_comments_are_template_syntax(self):
+        result = render_from_string("foo{# a comment #}bar", {})
+
+        self.assertEqual(result, "foobar")
+
+    def test_cached_templates_render_concurrently(self):
+        def render(index: int) -> str:
+            return render_from_string(
+                "{% for item in items %}{{ item }}{% endfor %}",
+                {"items": [index] * 3},
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(render, range(50)))
+
+        self.assertEqual(results, [str(index) * 3 for index in range(50)])
@@ -15,6 +15,12 @@ class UtilsConfig(AppConfig):
 
         setting_changed.connect(clear_lru_cache_on_settings_changed)
 
+        from zgw_consumers.models import Service
+
+        from .connection_pools import connect_invalidation_signals
+
+        connect_invalidation_signals(Service)
+
         mute_deprecation_warnings()
 
         from openforms.utils.admin import replace_cookie_log_admin  # noqa
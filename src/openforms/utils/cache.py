@@ -1,4 +1,6 @@
 import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
 
 from django.core import signals
 from django.core.cache import DEFAULT_CACHE_ALIAS, caches
@@ -91,6 +93,55 @@ class RequestProxyCache(BaseCache):
         self._reset()
 
 
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A bounded, thread-safe, in-process least-recently-used cache.
+
+    Use this for derived datastructures that are expensive to compute and are safe to
+    share between requests in the same worker process. The cache key must capture
+    everything the value depends on, as there is no expiry other than the size limit.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: K, default: Callable[[], V]) -> V:
+        """
+        Look up the value for ``key`` or compute and store it if it's missing.
+
+        The value is computed outside of the lock - concurrent misses for the same key
+        may compute the value more than once.
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+
+        value = default()
+        with self._lock:
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
 def mark_request_proxy_caches(**kwargs):
     for cache in caches.all():
         if not isinstance(cache, RequestProxyCache):
@@ -0,0 +1,217 @@
+"""
+Process-wide HTTP connection pools for the configured services.
+
+The API clients (:class:`ape_pie.APIClient` subclasses) are :class:`requests.Session`
+instances that are typically created for a single operation and closed afterwards,
+which closes their connection pools too. Every service call therefore has to set up a
+new TCP connection and perform the (mTLS) handshake again.
+
+Instead, sessions built for a service configuration (:class:`zgw_consumers.models.Service`,
+:class:`soap.models.SoapService`, :class:`stuf.models.StufService`...) get a shared
+:class:`PooledHTTPAdapter` mounted, which is kept in a registry per worker process.
+Closing the session does not close the shared pools.
+
+The pools of a service are discarded when:
+
+* the service configuration is changed or deleted (in this process - other processes
+  detect changes to the connection parameters through the pool fingerprint)
+* too many consecutive connection errors occurred
+* the pools have not been used for a while
+
+See the ``HTTP_POOL_*`` settings to configure the pool sizes and eviction.
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Hashable, Protocol
+
+from django.conf import settings
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError
+
+logger = logging.getLogger(__name__)
+
+PoolKey = tuple[str, Any]
+
+
+class ServiceConfigAdapter(Protocol):
+    service: models.Model
+
+    def get_client_base_url(self) -> str:
+        ...  # pragma: nocover
+
+    def get_client_session_kwargs(self) -> dict[str, Any]:
+        ...  # pragma: nocover
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter shared by multiple sessions, keeping track of its health.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.num_requests = 0
+        self.num_failures = 0
+        self.consecutive_failures = 0
+        self.last_used = time.monotonic()
+
+    def send(self, request, *args, **kwargs):
+        self.num_requests += 1
+        self.last_used = time.monotonic()
+        try:
+            response = super().send(request, *args, **kwargs)
+        except ConnectionError:
+            self.num_failures += 1
+            self.consecutive_failures += 1
+            raise
+        self.consecutive_failures = 0
+        return response
+
+    def close(self) -> None:
+        # called when a session using the adapter is closed - the pools are owned by
+        # the registry
+        pass
+
+    def close_pools(self) -> None:
+        super().close()
+
+    def get_stats(self) -> dict[str, int]:
+        pools = [
+            self.poolmanager.pools[pool_key]
+            for pool_key in self.poolmanager.pools.keys()
+        ]
+        return {
+            "num_requests": self.num_requests,
+            "num_failures": self.num_failures,
+            "num_pools": len(pools),
+            "num_connections": sum(pool.num_connections for pool in pools),
+            "num_idle_connections": sum(
+                pool.pool.qsize() for pool in pools if pool.pool is not None
+            ),
+        }
+
+
+@dataclass
+class PoolEntry:
+    adapter: PooledHTTPAdapter
+    # the connection parameters the pools were set up for
+    fingerprint: Hashable
+    created: float = field(default_factory=time.monotonic)
+
+    def is_healthy(self) -> bool:
+        if self.adapter.consecutive_failures >= settings.HTTP_POOL_MAX_FAILURES:
+            return False
+        idle_time = time.monotonic() - self.adapter.last_used
+        return idle_time < settings.HTTP_POOL_MAX_IDLE_TIME
+
+
+class ConnectionPoolRegistry:
+    def __init__(self):
+        self._entries: dict[PoolKey, PoolEntry] = {}
+        self._lock = threading.Lock()
+
+    def get_adapter(self, key: PoolKey, fingerprint: Hashable) -> PooledHTTPAdapter:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry.fingerprint != fingerprint or not entry.is_healthy()
+            ):
+                self._discard(key)
+                entry = None
+
+            if entry is None:
+                adapter = PooledHTTPAdapter(
+                    pool_connections=settings.HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+                )
+                entry = self._entries[key] = PoolEntry(
+                    adapter=adapter, fingerprint=fingerprint
+                )
+            return entry.adapter
+
+    def _discard(self, key: PoolKey) -> None:
+        if (entry := self._entries.pop(key, None)) is not None:
+            logger.info(
+                "Discarding the connection pools of %r, statistics: %r",
+                key,
+                entry.adapter.get_stats(),
+            )
+            entry.adapter.close_pools()
+
+    def invalidate(self, key: PoolKey) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._discard(key)
+
+    def get_stats(self) -> dict[PoolKey, dict[str, Any]]:
+        with self._lock:
+            entries = list(self._entries.items())
+        now = time.monotonic()
+        return {
+            key: {
+                **entry.adapter.get_stats(),
+                "age": now - entry.created,
+                "healthy": entry.is_healthy(),
+            }
+            for key, entry in entries
+        }
+
+
+registry = ConnectionPoolRegistry()
+
+
+def get_pool_key(service: models.Model) -> PoolKey:
+    return (service._meta.label_lower, service.pk)
+
+
+def mount_pooled_adapter(session: Session, config_adapter: ServiceConfigAdapter):
+    """
+    Let the session use the shared connection pools of the configured service.
+    """
+    if not settings.HTTP_POOL_ENABLED:
+        return
+
+    service = config_adapter.service
+    if service.pk is None:
+        return
+
+    session_kwargs = config_adapter.get_client_session_kwargs()
+    # the connection parameters - auth is applied per request and not relevant
+    fingerprint = (
+        config_adapter.get_client_base_url(),
+        repr(session_kwargs.get("verify")),
+        repr(session_kwargs.get("cert")),
+    )
+    adapter = registry.get_adapter(get_pool_key(service), fingerprint)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def get_pool_stats() -> dict[PoolKey, dict[str, Any]]:
+    """
+    Report the usage of the connection pools in this process, to help sizing them.
+    """
+    return registry.get_stats()
+
+
+def invalidate_service_pools(sender, instance: models.Model, **kwargs) -> None:
+    registry.invalidate(get_pool_key(instance))
+
+
+def connect_invalidation_signals(*model_classes: type[models.Model]) -> None:
+    """
+    Discard the connection pools of a service when its configuration changes.
+    """
+    for model in model_classes:
+        post_save.connect(invalidate_service_pools, sender=model)
+        post_delete.connect(invalidate_service_pools, sender=model)
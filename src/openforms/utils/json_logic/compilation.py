@@ -0,0 +1,98 @@
+"""
+Compile jsonLogic expressions into Python callables.
+
+:func:`json_logic.jsonLogic` interprets the expression tree on every call, which means
+destructuring every (nested) expression and looking up the operators over and over
+again. Form logic is evaluated many times with the same expressions and different
+data, so we parse the expression once and build a tree of closures that only needs
+the data to produce the result.
+
+The compiled callables are guaranteed to produce the same results (and raise the
+same errors) as :func:`json_logic.jsonLogic`.
+"""
+from functools import partial
+from typing import Any, Callable
+
+from json_logic import (
+    empty_operand_values_for_operators,
+    get_var,
+    jsonLogic,
+    missing,
+    missing_some,
+    operations,
+    scoped_operations,
+)
+from json_logic.meta.expressions import destructure
+from json_logic.typing import JSON
+
+__all__ = ["CompiledExpression", "compile_expression"]
+
+CompiledExpression = Callable[[Any], Any]
+
+DATA_OPERATIONS = {
+    "var": get_var,
+    "missing": missing,
+    "missing_some": missing_some,
+}
+
+
+def compile_expression(expression: JSON) -> CompiledExpression:
+    """
+    Compile a jsonLogic expression into a callable taking the data as sole argument.
+
+    Expressions that cannot be compiled (e.g. because they are malformed) fall back
+    to the interpreter, so that any errors are raised at evaluation time, like
+    :func:`json_logic.jsonLogic` does.
+    """
+    try:
+        return _compile(expression)
+    except Exception:
+        return partial(_interpret, expression)
+
+
+def _interpret(expression: JSON, data: Any = None) -> Any:
+    return jsonLogic(expression, data)
+
+
+def _compile(expression: JSON) -> CompiledExpression:
+    if isinstance(expression, list):
+        items = [_compile(item) for item in expression]
+        return lambda data: [item(data) for item in items]
+
+    # primitives evaluate to themselves
+    if expression is None or not isinstance(expression, dict):
+        return lambda data: expression
+
+    operator, values = destructure(expression)
+    if not isinstance(values, (list, tuple)):
+        values = [values]
+
+    if operator in scoped_operations:
+        scoped_operation = scoped_operations[operator]
+        return lambda data: scoped_operation(data or {}, *values)
+
+    arguments = [_compile(value) for value in values]
+
+    if operator in DATA_OPERATIONS:
+        data_operation = DATA_OPERATIONS[operator]
+
+        def evaluate_data_operation(data):
+            data = data or {}
+            return data_operation(data, *[argument(data) for argument in arguments])
+
+        return evaluate_data_operation
+
+    if operator not in operations:
+        raise ValueError("Unrecognized operation %s" % operator)
+
+    operation = operations[operator]
+    empty_values = empty_operand_values_for_operators.get(operator)
+
+    def evaluate_operation(data):
+        data = data or {}
+        evaluated = [argument(data) for argument in arguments]
+        if empty_values and any([value in empty_values for value in evaluated]):
+            return None
+        return operation(*evaluated)
+
+    return evaluate_operation
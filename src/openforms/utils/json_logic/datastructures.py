@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Iterator, cast
 
 from glom import glom
+from json_logic import scoped_operations
 from json_logic.meta import JSONLogicExpressionTree, Operation
 from json_logic.typing import JSON, Primitive
 
@@ -71,6 +72,59 @@ class ExpressionIntrospection:
 
         return inputs
 
+    @property
+    def input_keys(self) -> frozenset[str] | None:
+        """
+        Collect the (dotted) variable paths the expression reads from the data.
+
+        :returns: the set of paths, or ``None`` if the inputs cannot be determined
+          statically, e.g. because the whole data object is accessed or the path
+          itself is the result of an expression.
+        """
+        keys = set()
+        for path in _iter_var_paths(self.tree):
+            if not path:
+                return None
+            keys.add(path)
+        return frozenset(keys)
+
+    @property
+    def operators(self) -> frozenset[str]:
+        return frozenset(
+            node.operator
+            for node in iter_tree(self.tree)
+            if isinstance(node, Operation)
+        )
+
+
+def _iter_var_paths(tree: JSONLogicExpressionTree) -> Iterator[str | None]:
+    """
+    Yield the variable paths looked up in the data, or ``None`` for unknown lookups.
+    """
+    if isinstance(tree, list):
+        for arg in tree:
+            yield from _iter_var_paths(arg)
+
+    elif isinstance(tree, Operation):
+        match tree.operator:
+            case "var":
+                path = tree.arguments[0] if tree.arguments else None
+                yield (
+                    str(path)
+                    if isinstance(path, Primitive) and path not in ("", None)
+                    else None
+                )
+                # the default value may be an expression too
+                yield from _iter_var_paths(tree.arguments[1:])
+            case "missing" | "missing_some":
+                yield None
+            case operator if operator in scoped_operations:
+                # only the iterable is looked up in the data, the scoped logic operates
+                # on the items of the iterable
+                yield from _iter_var_paths(tree.arguments[:1])
+            case _:
+                yield from _iter_var_paths(tree.arguments)
+
 
 def iter_tree(tree: JSONLogicExpressionTree) -> Iterator[Operation | Primitive]:
     if isinstance(tree, Primitive):
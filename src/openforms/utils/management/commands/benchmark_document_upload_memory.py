@@ -0,0 +1,75 @@
+"""
+Management command to measure the memory needed to send a document registration body.
+
+A (random) document of the given size is embedded base64 encoded in a JSON request body,
+both by encoding it in memory and by streaming it with
+:class:`openforms.utils.streaming.StreamingBody`. The body is read in blocks like the
+HTTP client does when sending it, and the peak of the allocated memory is reported.
+"""
+import json
+import os
+import tempfile
+import tracemalloc
+from base64 import b64encode
+
+from django.core.management import BaseCommand
+
+from openforms.conf.utils import Filesize
+
+from ...streaming import StreamingBody, make_placeholder
+
+# the block size used by http.client to send file-like bodies
+SEND_BLOCK_SIZE = 8192
+
+
+def _send(body) -> None:
+    while body.read(SEND_BLOCK_SIZE):
+        pass
+
+
+def _in_memory(fp) -> None:
+    data = {"titel": "benchmark", "inhoud": b64encode(fp.read()).decode()}
+    body = json.dumps(data).encode("utf-8")
+    # the bytes are sent directly, no copies are made
+    assert body
+
+
+def _streaming(fp) -> None:
+    placeholder = make_placeholder("inhoud")
+    data = {"titel": "benchmark", "inhoud": placeholder}
+    _send(StreamingBody.from_rendered(json.dumps(data), files={placeholder: fp}))
+
+
+class Command(BaseCommand):
+    help = "Benchmark the peak memory usage of embedding a document in a request body."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            type=Filesize(),
+            default="100M",
+            help="Size of the document, e.g. 10M or 1G. Defaults to 100M.",
+        )
+
+    def handle(self, **options):
+        size = options["size"]
+        with tempfile.TemporaryFile() as fp:
+            remaining = size
+            while remaining > 0:
+                remaining -= fp.write(os.urandom(min(remaining, 1024 * 1024)))
+
+            for label, build_and_send in (
+                ("in memory", _in_memory),
+                ("streaming", _streaming),
+            ):
+                fp.seek(0)
+                tracemalloc.start()
+                try:
+                    build_and_send(fp)
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+                self.stdout.write(
+                    f"{label}: peak memory {peak / 1024 / 1024:.1f} MiB "
+                    f"for a {size / 1024 / 1024:.1f} MiB document"
+                )
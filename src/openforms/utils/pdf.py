@@ -1,5 +1,7 @@
 import logging
 import mimetypes
+import os
+import threading
 from io import BytesIO
 from pathlib import PurePosixPath
 from typing import Optional, Tuple
@@ -12,9 +14,31 @@ from django.core.files.storage import FileSystemStorage, default_storage
 from django.template.loader import render_to_string
 
 import weasyprint
+from weasyprint.fonts import FontConfiguration
+
+from .cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# static assets (stylesheets, fonts, logos) read from disk, shared between the reports
+# rendered in this process
+_asset_cache: LRUCache[tuple[str, int, int], bytes] = LRUCache(maxsize=64)
+# the decoded images are cached by URL - discard them every now and then
+IMAGE_CACHE_MAX_SIZE = 32
+
+
+def _read_asset(absolute_path: str) -> bytes:
+    stat = os.stat(absolute_path)
+
+    def _read() -> bytes:
+        with open(absolute_path, "rb") as f:
+            return f.read()
+
+    # the modification time is part of the key, so changed files are read again
+    return _asset_cache.get_or_set(
+        (absolute_path, stat.st_mtime_ns, stat.st_size), _read
+    )
+
 
 class UrlFetcher:
 
@@ -73,8 +97,7 @@ class UrlFetcher:
                 redirected_url=orig_url,
                 filename=path.parts[-1],
             )
-            with open(absolute_path, "rb") as f:
-                result["file_obj"] = BytesIO(f.read())
+            result["file_obj"] = BytesIO(_read_asset(absolute_path))
             return result
         return weasyprint.default_url_fetcher(orig_url)
 
@@ -96,15 +119,68 @@ class UrlFetcher:
         return None
 
 
+class CachingFontConfiguration(FontConfiguration):
+    """
+    Font configuration that loads the fonts of identical ``@font-face`` rules once.
+
+    WeasyPrint fetches and registers the font files of every ``@font-face`` rule for
+    every document. When the configuration is shared between documents, the fonts of
+    the (same) stylesheets only need to be loaded once.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._font_faces: dict[str, str | None] = {}
+
+    def add_font_face(self, rule_descriptors, url_fetcher):
+        key = repr(sorted(rule_descriptors.items()))
+        if key not in self._font_faces:
+            self._font_faces[key] = super().add_font_face(rule_descriptors, url_fetcher)
+        return self._font_faces[key]
+
+
+class PDFRenderer:
+    """
+    Render HTML documents to PDF, re-using the WeasyPrint state between documents.
+
+    The font configuration and the decoded images are kept (warm) for the lifetime
+    of the renderer. Use :func:`get_pdf_renderer` to obtain the renderer of the
+    current thread.
+    """
+
+    def __init__(self):
+        self.font_config = CachingFontConfiguration()
+        self.image_cache = {}
+
+    def render(self, html: str) -> bytes:
+        if len(self.image_cache) > IMAGE_CACHE_MAX_SIZE:
+            self.image_cache.clear()
+
+        html_object = weasyprint.HTML(
+            string=html,
+            url_fetcher=UrlFetcher(),
+            base_url=settings.BASE_URL,
+        )
+        return html_object.write_pdf(
+            font_config=self.font_config,
+            image_cache=self.image_cache,
+        )
+
+
+_local = threading.local()
+
+
+def get_pdf_renderer() -> PDFRenderer:
+    # the WeasyPrint font configuration is not thread-safe
+    if not hasattr(_local, "renderer"):
+        _local.renderer = PDFRenderer()
+    return _local.renderer
+
+
 def render_to_pdf(template_name: str, context: dict) -> Tuple[str, bytes]:
     """
     Render a (HTML) template to PDF with the given context.
     """
     rendered_html = render_to_string(template_name, context=context)
-    html_object = weasyprint.HTML(
-        string=rendered_html,
-        url_fetcher=UrlFetcher(),
-        base_url=settings.BASE_URL,
-    )
-    pdf: bytes = html_object.write_pdf()
+    pdf: bytes = get_pdf_renderer().render(rendered_html)
     return rendered_html, pdf
@@ -0,0 +1,214 @@
+"""
+Streaming HTTP request bodies with embedded (base64 encoded) files.
+
+Both the Documenten API (JSON) and StUF-ZDS (XML) expect the content of a document
+embedded in the request body as a base64 encoded string. Building that body in memory
+costs a multiple of the file size: the file content, its base64 encoded form and the
+serialized body all live in memory at the same time.
+
+:class:`StreamingBody` instead renders the body with a placeholder in the place of the
+file content, and encodes the file chunk by chunk while the body is being sent. The
+length of the body is known up front, so the request is sent with a regular
+``Content-Length`` header rather than with chunked transfer encoding.
+
+The same body can stream (parts of) files as-is in a ``multipart/form-data`` body, for
+the uploads of the Documenten API "bestandsdelen".
+"""
+import os
+import re
+from base64 import b64encode
+from typing import IO, Iterator, Mapping, Sequence
+from uuid import uuid4
+
+# must be a multiple of 3, so that the encoded chunks can simply be concatenated
+ENCODE_CHUNK_SIZE = 3 * 64 * 1024
+
+
+def get_file_size(fp: IO[bytes]) -> int:
+    """
+    Determine the number of bytes left to read from the current position of ``fp``.
+    """
+    position = fp.tell()
+    fp.seek(0, os.SEEK_END)
+    size = fp.tell() - position
+    fp.seek(position)
+    return size
+
+
+def make_placeholder(name: str) -> str:
+    """
+    Create a unique placeholder to render in the place of the file content.
+    """
+    return f"__streamed_{name}_{uuid4().hex}__"
+
+
+class Base64EncodedFile:
+    """
+    Base64 encode the content of a (seekable) file lazily, from its current position.
+    """
+
+    def __init__(self, fp: IO[bytes]):
+        self.fp = fp
+        self.start = fp.tell()
+        size = get_file_size(fp)
+        self.length = 4 * ((size + 2) // 3)
+
+    def __len__(self):
+        return self.length
+
+    def chunks(self) -> Iterator[bytes]:
+        self.fp.seek(self.start)
+        remainder = b""
+        while chunk := self.fp.read(ENCODE_CHUNK_SIZE):
+            chunk = remainder + chunk
+            # reads may return less than requested, only encode complete groups of 3
+            # bytes until the end of the file is reached
+            cutoff = len(chunk) - len(chunk) % 3
+            remainder = chunk[cutoff:]
+            if cutoff:
+                yield b64encode(chunk[:cutoff])
+        if remainder:
+            yield b64encode(remainder)
+
+
+class FilePart:
+    """
+    Stream (at most ``size`` bytes of) the content of a (seekable) file as-is, from its
+    current position.
+    """
+
+    def __init__(self, fp: IO[bytes], size: int | None = None):
+        self.fp = fp
+        self.start = fp.tell()
+        available = get_file_size(fp)
+        self.length = available if size is None else min(size, available)
+
+    def __len__(self):
+        return self.length
+
+    def chunks(self) -> Iterator[bytes]:
+        self.fp.seek(self.start)
+        remaining = self.length
+        while remaining and (chunk := self.fp.read(min(ENCODE_CHUNK_SIZE, remaining))):
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _quote(value: str) -> str:
+    # like browsers do for the names in multipart/form-data headers
+    return value.replace("\r", "%0D").replace("\n", "%0A").replace('"', "%22")
+
+
+class StreamingBody:
+    """
+    File-like request body, concatenating byte strings and base64 encoded files.
+
+    Instances can be passed as ``data`` to :mod:`requests`, which reads the body in
+    blocks while sending it. The body can be read again after :meth:`seek` to the start,
+    e.g. when a request is retried or redirected.
+    """
+
+    def __init__(self, parts: Sequence[bytes | Base64EncodedFile | FilePart]):
+        self.parts = parts
+        self.length = sum(len(part) for part in parts)
+        self.seek(0)
+
+    @classmethod
+    def from_rendered(
+        cls, rendered: str, files: Mapping[str, IO[bytes]]
+    ) -> "StreamingBody":
+        """
+        Build the body from a rendered document and the files of its placeholders.
+
+        :param rendered: the rendered (JSON, XML...) document, containing the
+          placeholders created with :func:`make_placeholder`.
+        :param files: mapping of placeholder to the file to stream (base64 encoded)
+          into the body at the location of the placeholder.
+        """
+        pattern = re.compile("|".join(re.escape(placeholder) for placeholder in files))
+        parts = []
+        position = 0
+        for match in pattern.finditer(rendered):
+            parts.append(rendered[position : match.start()].encode("utf-8"))
+            parts.append(Base64EncodedFile(files[match.group()]))
+            position = match.end()
+        parts.append(rendered[position:].encode("utf-8"))
+        return cls(parts)
+
+    @classmethod
+    def from_form_data(
+        cls,
+        boundary: str,
+        fields: Mapping[str, str],
+        files: Mapping[str, tuple[str, FilePart]],
+    ) -> "StreamingBody":
+        """
+        Build a ``multipart/form-data`` body, streaming the content of the files.
+
+        :param boundary: the boundary between the parts, which must be passed in the
+          ``Content-Type`` header of the request as well.
+        :param fields: mapping of field name to the (string) value.
+        :param files: mapping of field name to the file name and the file to stream.
+        """
+        parts = []
+        for name, value in fields.items():
+            parts.append(
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+                f"{value}\r\n".encode("utf-8")
+            )
+        for name, (filename, file) in files.items():
+            parts.append(
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="{_quote(name)}"; '
+                f'filename="{_quote(filename)}"\r\n'
+                "Content-Type: application/octet-stream\r\n\r\n".encode("utf-8")
+            )
+            parts += [file, b"\r\n"]
+        parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+        return cls(parts)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.seek(0)
+        while data := self.read(ENCODE_CHUNK_SIZE):
+            yield data
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        for part in self.parts:
+            if isinstance(part, bytes):
+                yield part
+            else:
+                yield from part.chunks()
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if (offset, whence) != (0, os.SEEK_SET):
+            raise OSError("A StreamingBody can only be rewound to the start.")
+        self._position = 0
+        self._chunks = self._iter_chunks()
+        self._buffer, self._offset = b"", 0
+        return 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            data = self._buffer[self._offset :] + b"".join(self._chunks)
+            self._buffer, self._offset = b"", 0
+        else:
+            pieces = []
+            while size > 0:
+                if self._offset >= len(self._buffer):
+                    if (chunk := next(self._chunks, None)) is None:
+                        break
+                    self._buffer, self._offset = chunk, 0
+                piece = self._buffer[self._offset : self._offset + size]
+                self._offset += len(piece)
+                size -= len(piece)
+                pieces.append(piece)
+            data = b"".join(pieces)
+        self._position += len(data)
+        return data
@@ -0,0 +1,105 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+import requests
+import requests_mock
+
+from zgw_consumers_ext.api_client import build_client
+from zgw_consumers_ext.tests.factories import ServiceFactory
+
+from ..connection_pools import PooledHTTPAdapter, get_pool_key, get_pool_stats, registry
+
+
+@override_settings(HTTP_POOL_ENABLED=True)
+class ConnectionPoolTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(registry.clear)
+
+    def test_clients_share_adapter(self):
+        service = ServiceFactory.create(api_root="https://example.com/api/")
+
+        client1 = build_client(service)
+        client2 = build_client(service)
+
+        adapter = client1.get_adapter("https://example.com/api/")
+        self.assertIsInstance(adapter, PooledHTTPAdapter)
+        self.assertIs(client2.get_adapter("https://example.com/api/"), adapter)
+
+        with patch.object(adapter.poolmanager, "clear") as m_clear:
+            client1.close()
+
+        m_clear.assert_not_called()
+
+    def test_different_services_use_different_pools(self):
+        service1 = ServiceFactory.create(api_root="https://example.com/api/1/")
+        service2 = ServiceFactory.create(api_root="https://example.com/api/2/")
+
+        adapter1 = build_client(service1).get_adapter("https://example.com/")
+        adapter2 = build_client(service2).get_adapter("https://example.com/")
+
+        self.assertIsNot(adapter1, adapter2)
+
+    def test_pools_invalidated_on_service_change(self):
+        service = ServiceFactory.create(api_root="https://example.com/api/")
+        adapter = build_client(service).get_adapter("https://example.com/api/")
+
+        service.save()
+
+        self.assertNotIn(get_pool_key(service), get_pool_stats())
+        new_adapter = build_client(service).get_adapter("https://example.com/api/")
+        self.assertIsNot(new_adapter, adapter)
+
+    def test_pools_replaced_on_changed_connection_parameters(self):
+        # e.g. changed in another process, not triggering the signals here
+        service = ServiceFactory.create(api_root="https://example.com/api/")
+        adapter = build_client(service).get_adapter("https://example.com/api/")
+
+        service.api_root = "https://example.com/api/v2/"
+
+        new_adapter = build_client(service).get_adapter("https://example.com/api/v2/")
+        self.assertIsNot(new_adapter, adapter)
+
+    @override_settings(HTTP_POOL_MAX_FAILURES=2)
+    def test_unhealthy_pools_evicted(self):
+        service = ServiceFactory.create(api_root="https://example.com/api/")
+        client = build_client(service)
+        adapter = client.get_adapter("https://example.com/api/")
+
+        with patch(
+            "requests.adapters.HTTPAdapter.send",
+            side_effect=requests.ConnectionError("boom"),
+        ):
+            for _ in range(2):
+                with self.assertRaises(requests.ConnectionError):
+                    client.get("foo")
+
+        stats = get_pool_stats()[get_pool_key(service)]
+        self.assertEqual(stats["num_requests"], 2)
+        self.assertEqual(stats["num_failures"], 2)
+        self.assertFalse(stats["healthy"])
+
+        new_adapter = build_client(service).get_adapter("https://example.com/api/")
+        self.assertIsNot(new_adapter, adapter)
+
+    @override_settings(HTTP_POOL_ENABLED=False)
+    def test_pooling_disabled(self):
+        service = ServiceFactory.create(api_root="https://example.com/api/")
+
+        client = build_client(service)
+
+        self.assertNotIsInstance(
+            client.get_adapter("https://example.com/api/"), PooledHTTPAdapter
+        )
+
+    def test_mocked_requests_still_intercepted(self):
+        service = ServiceFactory.create(api_root="https://example.com/api/")
+
+        with requests_mock.Mocker() as m:
+            m.get("https://example.com/api/foo", json={"ok": True})
+
+            response = build_client(service).get("foo")
+
+        self.assertEqual(response.json(), {"ok": True})
@@ -0,0 +1,95 @@
+from django.test import SimpleTestCase
+
+from json_logic import jsonLogic
+
+from ..json_logic import introspect_json_logic
+from ..json_logic.compilation import compile_expression
+
+
+class CompileExpressionTests(SimpleTestCase):
+    def test_results_identical_to_interpreter(self):
+        cases = (
+            ({"==": [{"var": "a"}, 1]}, {"a": 1}),
+            ({"var": ["a.b", "default"]}, {"a": {"b": None}}),
+            ({"var": ""}, {"x": 1}),
+            ({"var": "x"}, None),
+            ([{"/": None}], {}),
+            (
+                {
+                    "reduce": [
+                        {"var": "items"},
+                        {"+": [{"var": "accumulator"}, {"var": "current"}]},
+                        0,
+                    ]
+                },
+                {"items": [1, 2, 3]},
+            ),
+            ({"map": [{"var": "items"}, {"*": [{"var": ""}, 2]}]}, {"items": [1, 2]}),
+            ({"if": [{"<": [{"var": "age"}, 18]}, "minor", "adult"]}, {"age": 20}),
+            ({"missing": ["a", "b"]}, {"a": 1}),
+            ({"missing_some": [1, ["a", "b"]]}, {"b": 1}),
+            ({"cat": ["x", {"var": "y"}]}, {}),
+            ({"+": [None, 1]}, {}),
+            ({"date": ""}, {}),
+            ({"in": [None, "foo"]}, {}),
+            ({"and": [True, {"var": "x"}]}, {"x": 0}),
+            ("a string", {}),
+            (None, {}),
+        )
+
+        for expression, data in cases:
+            with self.subTest(expression=expression, data=data):
+                compiled = compile_expression(expression)
+
+                self.assertEqual(compiled(data), jsonLogic(expression, data))
+
+    def test_errors_identical_to_interpreter(self):
+        cases = (
+            ({"unknown": [1]}, ValueError),
+            ({"==": [1, 1], "!=": [1, 2]}, AssertionError),
+            ({"/": [1, 0]}, ZeroDivisionError),
+        )
+
+        for expression, exception in cases:
+            with self.subTest(expression=expression):
+                compiled = compile_expression(expression)
+
+                with self.assertRaises(exception):
+                    jsonLogic(expression, {})
+                with self.assertRaises(exception):
+                    compiled({})
+
+
+class InputKeysTests(SimpleTestCase):
+    def test_static_inputs(self):
+        introspection = introspect_json_logic(
+            {
+                "==": [
+                    {"var": "nested.key"},
+                    {"var": ["other", {"var": "fallback"}]},
+                ]
+            }
+        )
+
+        self.assertEqual(introspection.input_keys, {"nested.key", "other", "fallback"})
+
+    def test_scoped_operations_only_read_iterable(self):
+        introspection = introspect_json_logic(
+            {"reduce": [{"var": "items"}, {"+": [{"var": "accumulator"}, 1]}, 0]}
+        )
+
+        self.assertEqual(introspection.input_keys, {"items"})
+
+    def test_dynamic_inputs(self):
+        expressions = (
+            {"var": ""},
+            {"var": {"cat": ["a", "b"]}},
+            {"missing": ["a"]},
+            {"missing_some": [1, ["a", "b"]]},
+        )
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                introspection = introspect_json_logic(expression)
+
+                self.assertIsNone(introspection.input_keys)
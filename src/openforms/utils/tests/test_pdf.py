@@ -0,0 +1,61 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from weasyprint.fonts import FontConfiguration
+
+from ..pdf import CachingFontConfiguration, _asset_cache, _read_asset
+
+
+class AssetCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(_asset_cache.clear)
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name) / "style.css"
+        self.path.write_bytes(b"body { color: red; }")
+
+    def test_asset_read_once(self):
+        content1 = _read_asset(str(self.path))
+
+        with patch("builtins.open") as m_open:
+            content2 = _read_asset(str(self.path))
+
+        m_open.assert_not_called()
+        self.assertEqual(content1, b"body { color: red; }")
+        self.assertEqual(content2, content1)
+
+    def test_modified_asset_read_again(self):
+        _read_asset(str(self.path))
+
+        self.path.write_bytes(b"body { color: blue; }")
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertEqual(_read_asset(str(self.path)), b"body { color: blue; }")
+
+
+class CachingFontConfigurationTests(SimpleTestCase):
+    def test_font_faces_loaded_once(self):
+        font_config = CachingFontConfiguration()
+        rule_descriptors = {
+            "font_family": "Open Sans",
+            "src": [("external", "https://example.com/static/fonts/OpenSans.ttf")],
+        }
+
+        with patch.object(
+            FontConfiguration, "add_font_face", return_value="/tmp/font"
+        ) as m_add_font_face:
+            filename1 = font_config.add_font_face(rule_descriptors, url_fetcher=None)
+            filename2 = font_config.add_font_face(
+                {**rule_descriptors}, url_fetcher=None
+            )
+
+        m_add_font_face.assert_called_once()
+        self.assertEqual(filename1, "/tmp/font")
+        self.assertEqual(filename2, "/tmp/font")
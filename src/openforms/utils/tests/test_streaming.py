@@ -0,0 +1,89 @@
+import json
+from base64 import b64encode
+from io import BytesIO
+
+from django.test import SimpleTestCase
+
+from requests.models import PreparedRequest
+from urllib3.filepost import encode_multipart_formdata
+
+from ..streaming import FilePart, StreamingBody, make_placeholder
+
+
+class ShortReadsFile(BytesIO):
+    # like raw (unbuffered) files, return less than the requested number of bytes
+    def read(self, size=-1):
+        return super().read(min(size, 1000) if size > 0 else size)
+
+
+class StreamingBodyTests(SimpleTestCase):
+    def _build_body(self, content: bytes) -> tuple[StreamingBody, bytes]:
+        placeholder = make_placeholder("inhoud")
+        body = StreamingBody.from_rendered(
+            json.dumps({"titel": "tëst", "inhoud": placeholder}),
+            files={placeholder: ShortReadsFile(content)},
+        )
+        expected = json.dumps(
+            {"titel": "tëst", "inhoud": b64encode(content).decode()}
+        ).encode("utf-8")
+        return body, expected
+
+    def test_body_equals_in_memory_body(self):
+        for size in (0, 1, 2, 3, 4, 1000, 3 * 64 * 1024 + 1, 1024 * 1024):
+            with self.subTest(size=size):
+                body, expected = self._build_body(bytes(range(256)) * (size // 256))
+
+                chunks = []
+                while chunk := body.read(8192):
+                    chunks.append(chunk)
+
+                self.assertEqual(len(body), len(expected))
+                self.assertEqual(b"".join(chunks), expected)
+
+    def test_body_can_be_read_again(self):
+        body, expected = self._build_body(b"some content")
+        body.read()
+
+        body.seek(0)
+
+        self.assertEqual(body.read(), expected)
+        self.assertEqual(b"".join(body), expected)
+
+    def test_sent_with_content_length(self):
+        body, expected = self._build_body(b"some content")
+        request = PreparedRequest()
+
+        request.prepare(method="POST", url="https://example.com", data=body)
+
+        self.assertEqual(request.headers["Content-Length"], str(len(expected)))
+        self.assertNotIn("Transfer-Encoding", request.headers)
+
+    def test_form_data_equals_in_memory_body(self):
+        content = bytes(range(256)) * 4096
+        fp = ShortReadsFile(content)
+        fp.seek(1000)
+
+        body = StreamingBody.from_form_data(
+            "boundary",
+            fields={"lock": "lock-123"},
+            files={"inhoud": ("tëst.pdf", FilePart(fp, 3 * 64 * 1024 + 1))},
+        )
+
+        expected, _ = encode_multipart_formdata(
+            [
+                ("lock", "lock-123"),
+                (
+                    "inhoud",
+                    (
+                        "tëst.pdf",
+                        content[1000 : 1000 + 3 * 64 * 1024 + 1],
+                        "application/octet-stream",
+                    ),
+                ),
+            ],
+            boundary="boundary",
+        )
+        self.assertEqual(len(body), len(expected))
+        self.assertEqual(body.read(), expected)
+        # only the part is read from the file
+        self.assertEqual(fp.tell(), 1000 + 3 * 64 * 1024 + 1)
@@ -45,6 +45,8 @@ You can set the environment variable ``VCR_RECORD_MODE`` to any of the supported
 import os
 from pathlib import Path
 
+from django.test import override_settings
+
 from vcr.unittest import VCRMixin
 
 RECORD_MODE = os.environ.get("VCR_RECORD_MODE", "none")
@@ -62,6 +64,15 @@ class OFVCRMixin(VCRMixin):
     A :class:`pathlib.Path` instance where the casettes should be stored.
     """
 
+    def setUp(self):
+        # vcr.py records and replays on the connections it creates itself - connections
+        # kept in the shared pools by other tests would bypass the cassette
+        pooling_disabled = override_settings(HTTP_POOL_ENABLED=False)
+        pooling_disabled.enable()
+        self.addCleanup(pooling_disabled.disable)
+
+        super().setUp()
+
     def _get_cassette_library_dir(self):
         assert (
             self.VCR_TEST_FILES
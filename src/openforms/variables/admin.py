@@ -1,6 +1,8 @@
 from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
 
 from .models import ServiceFetchConfiguration
+from .service_fetch_statistics import get_cache_statistics
 
 
 @admin.register(ServiceFetchConfiguration)
@@ -22,3 +24,11 @@ class ServiceFetchConfigurationAdmin(admin.ModelAdmin):
         "service__api_root",
         "path",
     ]
+    readonly_fields = ["cache_statistics"]
+
+    @admin.display(description=_("cache statistics"))
+    def cache_statistics(self, obj: ServiceFetchConfiguration) -> str:
+        if not obj.pk:
+            return "-"
+        statistics = get_cache_statistics(obj)
+        return _("{hits} hits, {misses} misses").format(**statistics)
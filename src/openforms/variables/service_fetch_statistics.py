@@ -0,0 +1,46 @@
+"""
+Usage statistics of the cached service fetch results.
+
+The results themselves are cached by the form logic evaluation of a submission, see
+:mod:`openforms.submissions.logic.service_fetching`, which records every cache access
+here.
+"""
+import logging
+
+from django.core.cache import cache
+
+from .models import ServiceFetchConfiguration
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "service_fetch_statistics"
+
+
+def _get_counter_key(fetch_config: ServiceFetchConfiguration, counter: str) -> str:
+    return f"{CACHE_PREFIX}:{fetch_config.pk}:{counter}"
+
+
+def record_cache_access(fetch_config: ServiceFetchConfiguration, hit: bool) -> None:
+    key = _get_counter_key(fetch_config, "hits" if hit else "misses")
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:  # evicted in the meantime
+        pass
+    logger.debug(
+        "Service fetch cache %s for configuration %s",
+        "hit" if hit else "miss",
+        fetch_config.pk,
+    )
+
+
+def get_cache_statistics(fetch_config: ServiceFetchConfiguration) -> dict[str, int]:
+    """
+    Report the number of cache hits and misses for the fetch configuration.
+    """
+    keys = {
+        counter: _get_counter_key(fetch_config, counter)
+        for counter in ("hits", "misses")
+    }
+    counts = cache.get_many(keys.values())
+    return {counter: counts.get(key, 0) for counter, key in keys.items()}
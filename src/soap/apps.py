@@ -5,3 +5,15 @@ from django.utils.translation import gettext_lazy as _
 class SOAPAppConfig(AppConfig):
     name = "soap"
     verbose_name = _("SOAP Settings & Services")
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+
+        from openforms.utils.connection_pools import connect_invalidation_signals
+
+        from .client import clear_client_cache
+        from .models import SoapService
+
+        connect_invalidation_signals(SoapService)
+        post_save.connect(clear_client_cache, sender=SoapService)
+        post_delete.connect(clear_client_cache, sender=SoapService)
@@ -0,0 +1,45 @@
+"""
+Cache the WSDL and XSD documents loaded by zeep in the Django cache.
+
+Parsing a WSDL requires loading the WSDL itself and all the schema documents it
+imports, which is slow. The documents are stored in the (shared) Django cache, so that
+they are downloaded once rather than every time a client is built in any process.
+"""
+import hashlib
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from zeep.cache import Base
+
+logger = logging.getLogger(__name__)
+
+
+class DjangoCache(Base):
+    """
+    A zeep cache backend storing the documents in the default Django cache.
+
+    :arg namespace: prefix for the cache keys, changing the namespace invalidates the
+      cached documents.
+    """
+
+    def __init__(self, namespace: str = "", timeout: int | None = None):
+        self.namespace = namespace
+        self.timeout = (
+            timeout if timeout is not None else settings.SOAP_DOCUMENT_CACHE_TIMEOUT
+        )
+
+    def _get_cache_key(self, url: str) -> str:
+        url_hash = hashlib.md5(url.encode("utf-8")).hexdigest()
+        return f"soap-document:{self.namespace}:{url_hash}"
+
+    def add(self, url: str, content: bytes | str) -> None:
+        logger.debug("Caching contents of %s", url)
+        cache.set(self._get_cache_key(url), content, timeout=self.timeout)
+
+    def get(self, url: str) -> bytes | str | None:
+        content = cache.get(self._get_cache_key(url))
+        if content is not None:
+            logger.debug("Cache HIT for %s", url)
+        return content
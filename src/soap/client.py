@@ -1,10 +1,22 @@
+import hashlib
+from typing import Callable
+
 from ape_pie.client import APIClient as SessionBase, is_base_url
 from zeep.client import Client
 from zeep.transports import Transport
 
+from openforms.utils.cache import LRUCache
+from openforms.utils.connection_pools import mount_pooled_adapter
+
+from .cache import DjangoCache
 from .models import SoapService
 from .session_factory import SessionFactory
 
+# upper limit of the number of (parsed) clients kept in memory per process
+CLIENT_CACHE_SIZE = 32
+
+_client_cache: LRUCache[tuple, Client] = LRUCache(maxsize=CLIENT_CACHE_SIZE)
+
 
 def build_client(
     service: SoapService,
@@ -17,6 +29,8 @@ def build_client(
 
     The mTLS and authentication parameters are taken from the service configuration
     and configured on the session, which is then used as transport for the zeep client.
+    The WSDL and XSD documents loaded by the transport are cached, see
+    :class:`soap.cache.DjangoCache`.
 
     Any additional kwargs are passed through to the :class:`zeep.Client` instantiation.
 
@@ -25,11 +39,43 @@ def build_client(
     """
     session_factory = SessionFactory(service)
     session = SOAPSession.configure_from(session_factory)
-    transport = transport_factory(session=session)
+    mount_pooled_adapter(session, session_factory)
+    transport = transport_factory(
+        session=session,
+        cache=DjangoCache(namespace=_get_configuration_digest(service)),
+    )
     client = client_factory(service.url, transport=transport, **kwargs)
     return client
 
 
+def get_cached_client(
+    service: SoapService, factory: Callable[[SoapService], Client] = build_client
+) -> Client:
+    """
+    Retrieve the (per-process) cached client for the service, building it if needed.
+
+    Building a client parses the WSDL, which is expensive. The cached client is
+    discarded whenever the service configuration changes.
+    """
+    key = (_get_configuration(service), factory)
+    return _client_cache.get_or_set(key, lambda: factory(service))
+
+
+def clear_client_cache(*args, **kwargs) -> None:
+    _client_cache.clear()
+
+
+def _get_configuration(service: SoapService) -> tuple:
+    return tuple(
+        getattr(service, field.attname) for field in service._meta.concrete_fields
+    )
+
+
+def _get_configuration_digest(service: SoapService) -> str:
+    configuration = repr(_get_configuration(service)).encode("utf-8")
+    return hashlib.sha256(configuration).hexdigest()
+
+
 class SOAPSession(SessionBase):
     def to_absolute_url(self, maybe_relative_url: str) -> str:
         """
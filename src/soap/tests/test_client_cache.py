@@ -0,0 +1,64 @@
+"""
+Test the caching of the (parsed) WSDL documents and clients.
+"""
+from pathlib import Path
+
+from django.test import TestCase
+
+import requests_mock
+
+from openforms.utils.tests.cache import clear_caches
+
+from ..client import build_client, clear_client_cache, get_cached_client
+from .factories import SoapServiceFactory
+
+WSDL = Path(__file__).parent.resolve() / "data" / "sample.wsdl"
+WSDL_URL = "https://example.com/soap/sample.wsdl"
+
+
+class ClientCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+        self.addCleanup(clear_client_cache)
+
+    def test_client_cached_per_service_configuration(self):
+        service = SoapServiceFactory.create(url=str(WSDL))
+
+        client1 = get_cached_client(service)
+        client2 = get_cached_client(service)
+
+        self.assertIs(client1, client2)
+
+        with self.subTest("configuration changed in another process"):
+            service.user = "changed"
+
+            client3 = get_cached_client(service)
+
+            self.assertIsNot(client3, client1)
+
+    def test_cache_cleared_on_service_change(self):
+        service = SoapServiceFactory.create(url=str(WSDL))
+        client = get_cached_client(service)
+
+        service.save()
+
+        self.assertIsNot(get_cached_client(service), client)
+
+    @requests_mock.Mocker()
+    def test_wsdl_documents_cached(self, m):
+        m.get(WSDL_URL, content=WSDL.read_bytes())
+        service = SoapServiceFactory.create(url=WSDL_URL)
+
+        build_client(service)
+        build_client(service)
+
+        self.assertEqual(len(m.request_history), 1)
+
+        with self.subTest("cache invalidated by configuration changes"):
+            service.label = "changed"
+
+            build_client(service)
+
+            self.assertEqual(len(m.request_history), 2)
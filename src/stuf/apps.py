@@ -5,3 +5,10 @@ from django.utils.translation import gettext_lazy as _
 class StufAppConfig(AppConfig):
     name = "stuf"
     verbose_name = _("StUF Settings & Services")
+
+    def ready(self):
+        from openforms.utils.connection_pools import connect_invalidation_signals
+
+        from .models import StufService
+
+        connect_invalidation_signals(StufService)
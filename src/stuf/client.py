@@ -13,7 +13,7 @@ subclass the base class and implement your domain specific logic in your own cla
 """
 import logging
 import uuid
-from typing import Any, Literal, Protocol
+from typing import IO, Any, Literal, Protocol
 
 from django.template import loader
 
@@ -21,6 +21,8 @@ from ape_pie import APIClient, InvalidURLError
 from ape_pie.client import is_base_url
 from requests.models import Response
 
+from openforms.utils.connection_pools import ServiceConfigAdapter, mount_pooled_adapter
+from openforms.utils.streaming import StreamingBody, make_placeholder
 from soap.constants import SOAP_VERSION_CONTENT_TYPES, SOAPVersion
 
 from .constants import EndpointType
@@ -111,6 +113,12 @@ class BaseClient(APIClient):
         # set the correct Content-Type header for the specified soap version
         self.headers["Content-Type"] = SOAP_VERSION_CONTENT_TYPES[self.soap_version]
 
+    @classmethod
+    def configure_from(cls, adapter: ServiceConfigAdapter, **kwargs):
+        client = super().configure_from(adapter, **kwargs)
+        mount_pooled_adapter(client, adapter)
+        return client
+
     def to_absolute_url(self, maybe_relative_url: str | EndpointType) -> str:
         # Override of the base client behaviour - StUF clients support multiple
         # "base URLs" depending on the endpoint type which could *technically* not
@@ -155,7 +163,7 @@ class BaseClient(APIClient):
     def soap_request(
         self,
         soap_action: str,
-        body: str,
+        body: str | StreamingBody,
         endpoint_type: EndpointType = EndpointType.vrije_berichten,
     ) -> Response:
         normalized_url = self.to_absolute_url(endpoint_type)
@@ -163,7 +171,7 @@ class BaseClient(APIClient):
 
         response = self.post(
             normalized_url,
-            data=body.encode("utf-8"),
+            data=body.encode("utf-8") if isinstance(body, str) else body,
             # See https://docs.python-requests.org/en/latest/user/advanced/#session-objects,
             # both the session.headers and these run-time headers are sent.
             headers={
@@ -204,14 +212,24 @@ class BaseClient(APIClient):
         template: str,
         context: dict[str, Any] | None = None,
         endpoint_type: EndpointType = EndpointType.vrije_berichten,
+        files: dict[str, IO[bytes]] | None = None,
     ) -> Response:
         """
         Make a request by templating out a template with the provided context.
 
         The context is merged with the base context and the resolved template is
         rendered into a string, suitable to be passed down to :meth:`request`.
+
+        The ``files`` are context variables holding file content. Their content is not
+        rendered into the string, but streamed base64 encoded into the request body
+        while it is being sent.
         """
         full_context = {**self.build_base_context(), **(context or {})}
+        placeholders = {}
+        for name, file in (files or {}).items():
+            placeholder = make_placeholder(name)
+            full_context[name] = placeholder
+            placeholders[placeholder] = file
         ref_nr = full_context["referentienummer"]
         logger.debug(
             "Making StUF-%r request with referentienummer %s",
@@ -220,6 +238,8 @@ class BaseClient(APIClient):
             extra={"ref_nr": ref_nr, "sector_alias": self.sector_alias},
         )
         body = loader.render_to_string(template, full_context)
+        if placeholders:
+            body = StreamingBody.from_rendered(body, files=placeholders)
         response = self.soap_request(
             soap_action, body=body, endpoint_type=endpoint_type
         )
@@ -6,6 +6,7 @@ from datetime import datetime
 from functools import partial
 from typing import Callable, Literal, TypedDict
 
+from django.conf import settings
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -18,6 +19,7 @@ from openforms.logging import logevent
 from openforms.plugins.exceptions import InvalidPluginConfiguration
 from openforms.registrations.exceptions import RegistrationFailed
 from openforms.submissions.models import SubmissionFileAttachment, SubmissionReport
+from openforms.utils.streaming import get_file_size
 
 from ..client import BaseClient
 from ..constants import EndpointType
@@ -301,9 +303,6 @@ class Client(BaseClient):
         document: SubmissionReport | SubmissionFileAttachment,
         doc_data: dict,
     ) -> None:
-        document.content.seek(0)
-        base64_body = base64.b64encode(document.content.read()).decode()
-
         now = timezone.now()
         # TODO: vertrouwelijkAanduiding
         context = {
@@ -320,15 +319,27 @@ class Client(BaseClient):
             "document_identificatie": doc_id,
             "auteur": "open-forms",
             "taal": "nld",
-            "inhoud": base64_body,
             "status": "definitief",
             **doc_data,
         }
+
+        document.content.seek(0)
+        files = {}
+        if (
+            get_file_size(document.content)
+            < settings.DOCUMENT_UPLOAD_STREAMING_THRESHOLD
+        ):
+            context["inhoud"] = base64.b64encode(document.content.read()).decode()
+        else:
+            # the content is base64 encoded into the request body while it's being sent
+            files["inhoud"] = document.content
+
         self.execute_call(
             soap_action="voegZaakdocumentToe_Lk01",
             template="stuf_zds/soap/voegZaakdocumentToe.xml",
             context=context,
             endpoint_type=EndpointType.ontvang_asynchroon,
+            files=files,
         )
 
     def create_zaak_document(
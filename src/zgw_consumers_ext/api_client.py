@@ -8,6 +8,8 @@ from zds_client import ClientAuth
 from zgw_consumers.constants import AuthTypes
 from zgw_consumers.models import Service
 
+from openforms.utils.connection_pools import mount_pooled_adapter
+
 from .nlx import NLXClient
 
 logger = logging.getLogger(__name__)
@@ -26,7 +28,9 @@ def build_client(service: Service, client_factory: type[T] = NLXClient, **kwargs
     Any additional keyword arguments are forwarded to the client initialization.
     """
     factory = ServiceClientFactory(service)
-    return client_factory.configure_from(factory, nlx_base_url=service.nlx, **kwargs)
+    client = client_factory.configure_from(factory, nlx_base_url=service.nlx, **kwargs)
+    mount_pooled_adapter(client, factory)
+    return client
 
 
 @dataclass